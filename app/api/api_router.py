@@ -5,6 +5,7 @@ from app.api.routes import (
     schedule_router,
     schedule_slot_router,
     admin_schedule_router,
+    admin_metrics_router,
 )
 
 api_router = APIRouter()
@@ -12,3 +13,4 @@ api_router.include_router(account_router.router)
 api_router.include_router(schedule_router.router)
 api_router.include_router(admin_schedule_router.router)
 api_router.include_router(schedule_slot_router.router)
+api_router.include_router(admin_metrics_router.router)
@@ -5,10 +5,11 @@ from pydantic import BaseModel
 
 from app.api.routes.dto.account_dto import AccountResponse, AccountCreateRequest
 from app.common.jwt_token import jwt_token_util, Authentication
+from app.common.auth_policy import auth_policy, AuthPolicy
 from app.dependencies import account_service
 from app.service.account_service import AccountService
 
-router = APIRouter(tags=["accounts"])
+router = APIRouter(tags=["accounts"], dependencies=auth_policy(AuthPolicy.PUBLIC))
 
 
 @router.post("/accounts", response_model=AccountResponse)
@@ -0,0 +1,13 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.common.auth_policy import auth_policy, AuthPolicy
+from app.common.metrics import metrics
+
+router = APIRouter(tags=["admin/metrics"], dependencies=auth_policy(AuthPolicy.ADMIN))
+
+
+@router.get("/admin/metrics", response_model=dict[str, dict[str, Any]])
+async def get_metrics() -> dict[str, dict[str, Any]]:
+    return metrics.snapshot()
@@ -1,3 +1,7 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query
 
 from app.api.routes.dto.schedule_dto import (
@@ -6,30 +10,66 @@ from app.api.routes.dto.schedule_dto import (
     ScheduleRequest,
     AdminScheduleStatusChangeRequest,
 )
+from app.api.routes.dto.schedule_slot_dto import ScheduleSlotSchedulesResponse
+from app.common.fast_json import fast_json, FastJSONResponse
+from app.common.auth_policy import auth_policy, AuthPolicy
+from app.common.compression import compression_level
 from app.dependencies import schedule_service
 from app.docs.error_responses import admin_change_schedule, admin_change_schedule_status
 from app.service.models.page import SchedulePage
 from app.service.models.schedule_query import ScheduleQuery
+from app.service.models.schedule_status import ScheduleStatus
 from app.service.schedule_service import ScheduleService
 
-router = APIRouter(tags=["admin/schedules"])
+# 요청이 적고 목록이 크므로 압축률 우선
+router = APIRouter(
+    tags=["admin/schedules"],
+    dependencies=auth_policy(AuthPolicy.ADMIN)
+    + compression_level(gzip=9, brotli_quality=9),
+)
 
 
 @router.get("/admin/schedules", response_model=PaginatedScheduleResponse)
 async def get_schedules(
     page: int = Query(0, alias="page", ge=0),
     page_size: int = Query(10, alias="page-size", ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="empty for the first keyset page, then next_cursor"
+    ),
+    include_total: bool = Query(True, alias="include-total"),
+    status: ScheduleStatus | None = Query(None),
+    start_from: datetime | None = Query(None, alias="start-from"),
+    start_to: datetime | None = Query(None, alias="start-to"),
+    account_id: UUID | None = Query(None, alias="account-id"),
+    name: str | None = Query(None, max_length=100, description="name substring"),
     service: ScheduleService = Depends(schedule_service),
-) -> PaginatedScheduleResponse:
+) -> dict[str, Any] | FastJSONResponse:
     schedule_page: SchedulePage = await service.list(
-        ScheduleQuery(page_number=page, page_size=page_size, account_id=None)
-    )
-    return PaginatedScheduleResponse(
-        total=schedule_page.total,
-        page_number=schedule_page.page_number,
-        page_size=schedule_page.page_size,
-        items=[ScheduleResponse.from_schedule(s) for s in schedule_page.items],
+        ScheduleQuery(
+            page_number=page,
+            page_size=page_size,
+            account_id=account_id,
+            cursor=cursor,
+            include_total=include_total,
+            status=status,
+            start_from=start_from,
+            start_to=start_to,
+            name=name,
+        )
     )
+    return fast_json(PaginatedScheduleResponse.page_to_dict(schedule_page))
+
+
+@router.get(
+    "/admin/schedule-slot/{start_at}/schedules",
+    response_model=ScheduleSlotSchedulesResponse,
+)
+async def get_slot_schedules(
+    start_at: datetime,
+    service: ScheduleService = Depends(schedule_service),
+) -> dict[str, Any] | FastJSONResponse:
+    slot_schedules = await service.slot_schedules(start_at)
+    return fast_json(ScheduleSlotSchedulesResponse.to_dict(slot_schedules))
 
 
 @router.put(
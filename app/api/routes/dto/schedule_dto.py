@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
+from typing import Mapping, Any
 
 from pydantic import BaseModel, field_validator, model_validator
 
 from app.api.routes.dto.account_dto import ProfileResponse
 from app.common.exceptions import BusinessException, ErrorCode
+from app.service.models.page import SchedulePage
 from app.service.models.schedule_form import ScheduleForm
 from app.service.models.schedule_status import ScheduleStatus
 from app.storage.models.schedule import Schedule
@@ -30,12 +32,36 @@ class ScheduleResponse(BaseModel):
             profile=ProfileResponse.from_account(schedule.account),
         )
 
+    @staticmethod
+    def row_to_dict(row: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "start_at": row["start_at"],
+            "end_at": row["end_at"],
+            "applicants": row["applicants"],
+            "status": row["status"],
+            "profile": {"id": row["account_id"], "nickname": row["nickname"]},
+        }
+
 
 class PaginatedScheduleResponse(BaseModel):
-    total: int
+    total: int | None  # include-total=false 이면 None
     page_number: int  # 0부터 시작
     page_size: int
     items: list[ScheduleResponse]
+    next_cursor: str | None = None  # 다음 페이지가 없으면 None
+
+    # 응답 모델 객체를 거치지 않고 response_model 검증에 바로 쓰이는 dict 로 변환
+    @staticmethod
+    def page_to_dict(page: SchedulePage) -> dict[str, Any]:
+        return {
+            "total": page.total,
+            "page_number": page.page_number,
+            "page_size": page.page_size,
+            "items": [ScheduleResponse.row_to_dict(row) for row in page.items],
+            "next_cursor": page.next_cursor,
+        }
 
 
 ALLOWED_START_BEFORE: float = 3
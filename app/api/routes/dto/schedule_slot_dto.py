@@ -1,7 +1,14 @@
+import struct
+import sys
+from array import array
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel
 
+from app.api.routes.dto.schedule_dto import ScheduleResponse
+from app.service.models.hour_key import from_hour_key
+from app.service.models.page import ScheduleSlotPage, SlotSchedules
 from app.storage.models.schedule_slot import ScheduleSlot
 
 
@@ -25,3 +32,84 @@ class PaginatedScheduleSlotResponse(BaseModel):
     start_at: datetime
     end_at: datetime
     items: list[ScheduleSlotResponse]
+
+    # 배열 기반 page 를 응답 모델 객체 없이 response_model 검증용 dict 로 변환
+    @staticmethod
+    def page_to_dict(page: ScheduleSlotPage) -> dict[str, Any]:
+        return {
+            "start_at": page.start_at(),
+            "end_at": page.end_at(),
+            "items": [
+                {
+                    "start_at": from_hour_key(hour_key),
+                    "end_at": from_hour_key(hour_key + 1),
+                    "max_applicants": max_applicants,
+                    "confirmed_applicants": confirmed_applicants,
+                }
+                for hour_key, max_applicants, confirmed_applicants in page.rows()
+            ],
+        }
+
+
+# Accept 헤더로 고르는 /schedule-slot 응답 형식, 같은 q 값이면 앞쪽 우선
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.schedule-slot.columnar+json"
+INT32_MEDIA_TYPE = "application/vnd.schedule-slot.int32"
+SCHEDULE_SLOT_MEDIA_TYPES = [
+    JSON_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    INT32_MEDIA_TYPE,
+]
+HOUR_SECONDS = 60 * 60
+
+
+# 시간마다 key 를 반복하지 않고 시작 시각, 간격과 시간 순서의 인원 배열만 전달
+class ColumnarScheduleSlotResponse(BaseModel):
+    start_at: datetime
+    end_at: datetime
+    step_seconds: int
+    max_applicants: list[int]
+    confirmed_applicants: list[int]
+
+    @staticmethod
+    def page_to_dict(page: ScheduleSlotPage) -> dict[str, Any]:
+        return {
+            "start_at": page.start_at(),
+            "end_at": page.end_at(),
+            "step_seconds": HOUR_SECONDS,
+            "max_applicants": page.max_applicants.tolist(),
+            "confirmed_applicants": page.confirmed_applicants.tolist(),
+        }
+
+    # little-endian int32: start hour_key, 시간 수, max_applicants[시간 수], confirmed_applicants[시간 수]
+    @staticmethod
+    def page_to_int32(page: ScheduleSlotPage) -> bytes:
+        body = array("i", page.max_applicants)
+        body.extend(page.confirmed_applicants)
+        if sys.byteorder == "big":
+            body.byteswap()
+        header = struct.pack("<ii", page.start_key, len(page.max_applicants))
+        return header + body.tobytes()
+
+
+class ScheduleSlotSchedulesResponse(BaseModel):
+    start_at: datetime
+    end_at: datetime
+    max_applicants: int
+    confirmed_applicants: int
+    applicants: int  # items 의 applicants 합계
+    items: list[ScheduleResponse]
+
+    @staticmethod
+    def to_dict(slot_schedules: SlotSchedules) -> dict[str, Any]:
+        slot = slot_schedules.slot
+        return {
+            "start_at": slot.start_at(),
+            "end_at": slot.end_at(),
+            "max_applicants": slot.max_applicants,
+            "confirmed_applicants": slot.confirmed_applicants,
+            "applicants": slot_schedules.applicants(),
+            "items": [
+                ScheduleResponse.row_to_dict(row) for row in slot_schedules.items
+            ],
+        }
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends, Request, Query
 
 from app.api.routes.dto.schedule_dto import (
@@ -6,7 +8,8 @@ from app.api.routes.dto.schedule_dto import (
     PaginatedScheduleResponse,
     CustomerScheduleCancelRequest,
 )
-from app.common.auth_middleware import account_id
+from app.common.fast_json import fast_json, FastJSONResponse
+from app.common.auth_policy import account_id, auth_policy, AuthPolicy
 from app.dependencies import schedule_service
 from app.docs.error_responses import (
     customer_create_schedule,
@@ -17,7 +20,7 @@ from app.service.models.page import SchedulePage
 from app.service.models.schedule_query import ScheduleQuery
 from app.service.schedule_service import ScheduleService
 
-router = APIRouter(tags=["schedules"])
+router = APIRouter(tags=["schedules"], dependencies=auth_policy(AuthPolicy.CUSTOMER))
 
 
 @router.get("/schedules", response_model=PaginatedScheduleResponse)
@@ -25,19 +28,22 @@ async def get_schedules(
     request: Request,
     page: int = Query(0, alias="page", ge=0),
     page_size: int = Query(10, alias="page-size", ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="empty for the first keyset page, then next_cursor"
+    ),
+    include_total: bool = Query(True, alias="include-total"),
     service: ScheduleService = Depends(schedule_service),
-) -> PaginatedScheduleResponse:
+) -> dict[str, Any] | FastJSONResponse:
     schedule_page: SchedulePage = await service.list(
         ScheduleQuery(
-            page_number=page, page_size=page_size, account_id=account_id(request)
+            page_number=page,
+            page_size=page_size,
+            account_id=account_id(request),
+            cursor=cursor,
+            include_total=include_total,
         )
     )
-    return PaginatedScheduleResponse(
-        total=schedule_page.total,
-        page_number=schedule_page.page_number,
-        page_size=schedule_page.page_size,
-        items=[ScheduleResponse.from_schedule(s) for s in schedule_page.items],
-    )
+    return fast_json(PaginatedScheduleResponse.page_to_dict(schedule_page))
 
 
 @router.post(
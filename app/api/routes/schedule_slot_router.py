@@ -1,37 +1,62 @@
 from datetime import datetime
+from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header
+from starlette.responses import Response
 
 from app.api.routes.dto.schedule_slot_dto import (
     PaginatedScheduleSlotResponse,
-    ScheduleSlotResponse,
+    ColumnarScheduleSlotResponse,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    INT32_MEDIA_TYPE,
+    SCHEDULE_SLOT_MEDIA_TYPES,
 )
+from app.common.fast_json import fast_json, FastJSONResponse
+from app.common.auth_policy import auth_policy, AuthPolicy
+from app.common.compression import compression_level
+from app.common.content_negotiation import negotiate_media_type
 from app.dependencies import schedule_slot_service
 from app.docs.error_responses import get_schedule_slots
+from app.docs.success_responses import get_schedule_slots_formats
 from app.service.models.schedule_slot_query import ScheduleSlotQuery
 from app.service.schedule_slot_service import ScheduleSlotService
 
-router = APIRouter(tags=["schedule-slot"])
+router = APIRouter(tags=["schedule-slot"], dependencies=auth_policy(AuthPolicy.PUBLIC))
 
 
 @router.get(
     "/schedule-slot",
     response_model=PaginatedScheduleSlotResponse,
-    responses=get_schedule_slots,
+    responses={**get_schedule_slots_formats, **get_schedule_slots},
+    # 요청이 많은 공개 조회, 반복이 많은 응답이라 낮은 수준으로도 충분히 줄어듦
+    dependencies=compression_level(gzip=1, brotli_quality=2),
 )
 async def get_schedule_slot(
+    response: Response,
     start_at: datetime | None = Query(alias="start-at"),
     end_at: datetime | None = Query(alias="end-at"),
+    accept: str = Header("application/json"),
     service: ScheduleSlotService = Depends(schedule_slot_service),
-) -> PaginatedScheduleSlotResponse:
+) -> dict[str, Any] | Response:
     schedule_slots = await service.page(
         ScheduleSlotQuery(start_at=start_at, end_at=end_at)
     )
-    return PaginatedScheduleSlotResponse(
-        start_at=schedule_slots.start_at(),
-        end_at=schedule_slots.end_at(),
-        items=[
-            ScheduleSlotResponse.from_schedule_slot(slot)
-            for slot in schedule_slots.items
-        ],
+    # 같은 URL 이 형식별로 따로 캐시되도록 지정
+    headers = {"Vary": "Accept"}
+    # 받을 수 있는 형식이 없으면 기본 JSON
+    media_type = negotiate_media_type(accept, SCHEDULE_SLOT_MEDIA_TYPES)
+    if media_type == INT32_MEDIA_TYPE:
+        return Response(
+            ColumnarScheduleSlotResponse.page_to_int32(schedule_slots),
+            media_type=INT32_MEDIA_TYPE,
+            headers=headers,
+        )
+    if media_type == COLUMNAR_JSON_MEDIA_TYPE:
+        return FastJSONResponse(
+            ColumnarScheduleSlotResponse.page_to_dict(schedule_slots),
+            media_type=COLUMNAR_JSON_MEDIA_TYPE,
+            headers=headers,
+        )
+    return fast_json(
+        PaginatedScheduleSlotResponse.page_to_dict(schedule_slots), headers, response
     )
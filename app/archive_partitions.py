@@ -0,0 +1,36 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from app.common.database import AsyncSessionLocal
+from app.common.enviroment import env
+from app.storage.partition_repository import PartitionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def retention_start(now: datetime, retention_months: int) -> datetime:
+    month_index = now.year * 12 + now.month - 1 - retention_months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+# 보관 기간이 지난 월 partition 을 분리하는 운영 명령
+# DETACH 는 부모 테이블을 잠그므로 서버의 주기 작업이 아닌 요청이 적은 시간에 실행
+async def archive_partitions(before: datetime) -> list[str]:
+    async with AsyncSessionLocal() as sess:
+        archived = await PartitionRepository(sess).archive_month_partitions(before)
+        await sess.commit()
+    return archived
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if env.PARTITION_RETENTION_MONTHS <= 0:
+        logger.info("PARTITION_RETENTION_MONTHS is 0, nothing to archive")
+    else:
+        archived_partitions = asyncio.run(
+            archive_partitions(
+                retention_start(datetime.now(), env.PARTITION_RETENTION_MONTHS)
+            )
+        )
+        logger.info("month partitions archived: %s", archived_partitions)
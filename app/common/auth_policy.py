@@ -0,0 +1,55 @@
+from enum import Enum
+from uuid import UUID
+
+from fastapi import Depends, Request
+from fastapi.params import Depends as DependsParam
+
+from app.common.authentication import Authentication
+from app.common.exceptions import AuthorizationException, AuthenticateException
+from app.common.verified_token_cache import verified_token_cache
+
+
+class AuthPolicy(str, Enum):
+    PUBLIC = "PUBLIC"
+    CUSTOMER = "CUSTOMER"  # 인증된 모든 계정
+    ADMIN = "ADMIN"
+
+
+def bearer_token(request: Request) -> str:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise AuthenticateException("invalid token")
+    return token
+
+
+async def authenticate(request: Request) -> Authentication:
+    user = verified_token_cache.verify(bearer_token(request))
+    # handler 에서 request.user 로 사용
+    request.scope["auth"] = user.auth_credentials()
+    request.scope["user"] = user
+    return user
+
+
+async def authorize_admin(request: Request) -> Authentication:
+    user = await authenticate(request)
+    if not user.is_admin():
+        raise AuthorizationException("access denied")
+    return user
+
+
+# 라우터에 선언하는 인증 정책, include 시점에 각 route 의 의존성으로 고정되어
+# 요청마다 경로를 비교하지 않고 PUBLIC route 는 인증 작업을 전혀 하지 않음
+def auth_policy(policy: AuthPolicy) -> list[DependsParam]:
+    if policy == AuthPolicy.ADMIN:
+        return [Depends(authorize_admin)]
+    if policy == AuthPolicy.CUSTOMER:
+        return [Depends(authenticate)]
+    return []
+
+
+def authentication(request: Request) -> Authentication:
+    return request.user
+
+
+def account_id(request: Request) -> UUID:
+    return request.user.account_id
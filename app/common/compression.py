@@ -0,0 +1,253 @@
+import time
+import zlib
+from collections import Counter
+from enum import Enum
+from typing import Any
+
+from fastapi import Depends, Request
+from fastapi.params import Depends as DependsParam
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 협상
+    brotli = None
+
+# route 가 지정한 압축 수준을 middleware 에 전달하는 scope key
+COMPRESSION_LEVEL_SCOPE_KEY = "compression_level"
+
+
+class Encoding(str, Enum):
+    BROTLI = "br"
+    GZIP = "gzip"
+
+
+def supported_encodings() -> list[Encoding]:
+    # 같은 q 값이면 앞쪽 우선
+    if brotli is None:
+        return [Encoding.GZIP]
+    return [Encoding.BROTLI, Encoding.GZIP]
+
+
+def negotiate(accept_encoding: str) -> Encoding | None:
+    qualities = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    selected, selected_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = qualities.get(encoding.value, qualities.get("*", 0.0))
+        if quality > selected_quality:
+            selected, selected_quality = encoding, quality
+    return selected
+
+
+class CompressionStats:
+    def __init__(self):
+        self.responses: Counter[str] = Counter()
+        self.bytes_in: Counter[str] = Counter()
+        self.bytes_out: Counter[str] = Counter()
+        self.seconds: Counter[str] = Counter()
+        self.skipped: Counter[str] = Counter()
+
+    def record(
+        self, encoding: Encoding, bytes_in: int, bytes_out: int, seconds: float
+    ) -> None:
+        self.bytes_in[encoding.value] += bytes_in
+        self.bytes_out[encoding.value] += bytes_out
+        self.seconds[encoding.value] += seconds
+
+    def stats(self) -> dict[str, Any]:
+        report: dict[str, Any] = {"skipped": dict(self.skipped)}
+        for encoding in sorted(self.bytes_in.keys() | self.responses.keys()):
+            bytes_in, bytes_out = self.bytes_in[encoding], self.bytes_out[encoding]
+            responses = self.responses[encoding]
+            report[encoding] = {
+                "responses": responses,
+                "bytes_in": bytes_in,
+                "bytes_out": bytes_out,
+                "ratio": bytes_out / bytes_in if bytes_in else 0.0,
+                "seconds": self.seconds[encoding],
+                "avg_micros": (
+                    self.seconds[encoding] / responses * 1_000_000 if responses else 0.0
+                ),
+            }
+        return report
+
+    def clear(self) -> None:
+        for counter in (
+            self.responses,
+            self.bytes_in,
+            self.bytes_out,
+            self.seconds,
+            self.skipped,
+        ):
+            counter.clear()
+
+
+compression_stats = CompressionStats()
+metrics.register("compression", compression_stats.stats)
+
+
+# 라우터나 route 에 선언하는 압축 수준, None 이면 기본값, 0 이면 압축하지 않음
+def compression_level(
+    gzip: int | None = None, brotli_quality: int | None = None
+) -> list[DependsParam]:
+    levels = {Encoding.GZIP: gzip, Encoding.BROTLI: brotli_quality}
+
+    # 요청마다 threadpool 을 거치지 않도록 async 로 선언
+    async def set_compression_level(request: Request) -> None:
+        request.scope[COMPRESSION_LEVEL_SCOPE_KEY] = levels
+
+    return [Depends(set_compression_level)]
+
+
+class Compressor:
+    def __init__(self, encoding: Encoding, level: int):
+        self.encoding: Encoding = encoding
+        if encoding == Encoding.BROTLI:
+            self.__brotli = brotli.Compressor(quality=level)
+        else:
+            self.__zlib = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    # 마지막이 아닌 chunk 는 flush 해서 client 가 받은 만큼 바로 풀 수 있게 함
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == Encoding.BROTLI:
+            compressed = self.__brotli.process(data)
+            return compressed + (
+                self.__brotli.finish() if final else self.__brotli.flush()
+            )
+        compressed = self.__zlib.compress(data)
+        return compressed + self.__zlib.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        stats: CompressionStats = compression_stats,
+    ):
+        self.app: ASGIApp = app
+        self.minimum_size: int = minimum_size
+        self.default_levels: dict[Encoding, int] = {
+            Encoding.GZIP: gzip_level,
+            Encoding.BROTLI: brotli_quality,
+        }
+        self.stats: CompressionStats = stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = CompressionResponder(self, scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+    def level(self, scope: Scope, encoding: Encoding) -> int:
+        # route 의 의존성이 응답 시작 전에 scope 에 남긴 값
+        level = scope.get(COMPRESSION_LEVEL_SCOPE_KEY, {}).get(encoding)
+        return self.default_levels[encoding] if level is None else level
+
+
+# 첫 body 를 받을 때까지 응답 시작을 미뤄 크기와 streaming 여부를 보고 압축 여부를 결정
+class CompressionResponder:
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        scope: Scope,
+        send: Send,
+        encoding: Encoding,
+    ):
+        self.middleware: CompressionMiddleware = middleware
+        self.scope: Scope = scope
+        self.downstream: Send = send
+        self.encoding: Encoding = encoding
+        self.start_message: Message | None = None
+        self.compressor: Compressor | None = None
+        self.passthrough: bool = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+        if self.compressor is None:
+            await self.__start(message)
+            return
+        await self.downstream(self.__compress(message))
+
+    async def __start(self, message: Message) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        level = self.middleware.level(self.scope, self.encoding)
+        skipped = self.__skip_reason(headers, body, more_body, level)
+        if skipped is not None:
+            self.middleware.stats.skipped[skipped] += 1
+            if skipped != "encoded":
+                headers.add_vary_header("Accept-Encoding")
+            self.passthrough = True
+            await self.downstream(self.start_message)
+            await self.downstream(message)
+            return
+
+        self.compressor = Compressor(self.encoding, level)
+        compressed = self.__compress(message)
+        headers["Content-Encoding"] = self.encoding.value
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            # streaming 응답은 전체 길이를 알 수 없으므로 chunked 로 전송
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(compressed["body"]))
+        await self.downstream(self.start_message)
+        await self.downstream(compressed)
+
+    def __skip_reason(
+        self, headers: MutableHeaders, body: bytes, more_body: bool, level: int
+    ) -> str | None:
+        if "Content-Encoding" in headers:
+            return "encoded"
+        if level == 0:
+            return "disabled"
+        # streaming 응답은 크기를 미리 알 수 없으므로 항상 압축
+        if not more_body and len(body) < self.middleware.minimum_size:
+            return "below_minimum_size"
+        return None
+
+    def __compress(self, message: Message) -> Message:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        started = time.perf_counter()
+        compressed = self.compressor.compress(body, final=not more_body)
+        self.middleware.stats.record(
+            self.encoding, len(body), len(compressed), time.perf_counter() - started
+        )
+        if not more_body:
+            self.middleware.stats.responses[self.encoding.value] += 1
+        return {
+            "type": "http.response.body",
+            "body": compressed,
+            "more_body": more_body,
+        }
@@ -0,0 +1,40 @@
+# Accept 헤더의 media range 와 q 값으로 제공하는 형식 중 하나를 선택
+# 같은 q 값이면 offered 의 앞쪽 우선, 받을 수 있는 형식이 없으면 None
+def negotiate_media_type(accept: str, offered: list[str]) -> str | None:
+    media_ranges = []
+    for part in accept.split(","):
+        media_range, *params = part.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_ranges.append((media_range, quality))
+
+    selected, selected_quality = None, 0.0
+    for media_type in offered:
+        quality = _quality(media_type, media_ranges)
+        if quality > selected_quality:
+            selected, selected_quality = media_type, quality
+    return selected
+
+
+# 형식과 맞는 media range 중 가장 구체적인 것(type/subtype > type/* > */*)의 q 값
+def _quality(media_type: str, media_ranges: list[tuple[str, float]]) -> float:
+    candidates = {
+        media_type: 2,
+        f"{media_type.split('/')[0]}/*": 1,
+        "*/*": 0,
+    }
+    quality, specificity = 0.0, -1
+    for media_range, range_quality in media_ranges:
+        range_specificity = candidates.get(media_range, -1)
+        if range_specificity > specificity:
+            quality, specificity = range_quality, range_specificity
+    return quality
@@ -1,10 +1,12 @@
 import logging
 from contextlib import asynccontextmanager
+from typing import Callable
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.enviroment import env
+from app.common.statement_cache import statement_cache_stats
 
 if env.is_local():
     logging.basicConfig()
@@ -18,12 +20,27 @@ async_engine = create_async_engine(
     pool_recycle=1800,
     echo=True,
 )
+statement_cache_stats.install(async_engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+AFTER_COMMIT_KEY = "after_commit"
+ON_CLOSE_KEY = "on_close"
+
+
+# 트랜잭션이 커밋된 뒤에만 실행, 롤백되면 버려짐
+def after_commit(sess: AsyncSession, callback: Callable[[], None]) -> None:
+    sess.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+# 커밋, 롤백 여부와 관계없이 세션이 끝날 때 실행
+def on_close(sess: AsyncSession, callback: Callable[[], None]) -> None:
+    sess.info.setdefault(ON_CLOSE_KEY, []).append(callback)
+
+
 @asynccontextmanager
 async def __get_session():
     async with AsyncSessionLocal() as sess:
@@ -33,6 +50,11 @@ async def __get_session():
         except Exception:
             await sess.rollback()
             raise
+        finally:
+            for callback in sess.info.pop(ON_CLOSE_KEY, []):
+                callback()
+        for callback in sess.info.pop(AFTER_COMMIT_KEY, []):
+            callback()
 
 
 async def session():
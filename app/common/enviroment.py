@@ -23,11 +23,48 @@ class Settings(BaseSettings):
     # 8 days = 60 minutes * 24 hours * 8 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     SECRET_KEY: str = "grepp"
-    AUTHENTICATE_URL_PREFIX: list[str] = ["/schedules"]
-    ADMIN_URL_PREFIX: list[str] = ["/admin"]
+
+    # verified token cache, size 0 disables
+    TOKEN_CACHE_SIZE: int = 10_000
+    REJECTED_TOKEN_CACHE_SIZE: int = 10_000
+    REJECTED_TOKEN_CACHE_TTL_SECONDS: float = 10
 
     DOCS_URL: str = "/docs"
 
+    # in-process capacity ledger
+    CAPACITY_LEDGER_ENABLED: bool = False
+    CAPACITY_LEDGER_DAYS: int = 90
+    CAPACITY_LEDGER_REFRESH_SECONDS: float = 5
+
+    # schedule slot pre-materialization
+    SLOT_HORIZON_WORKER_ENABLED: bool = True
+    SLOT_HORIZON_DAYS: int = 90
+    SLOT_HORIZON_INTERVAL_SECONDS: float = 60 * 60
+
+    # 월 단위 partition 보관 기간(월), python -m app.archive_partitions 로 분리, 0 이면 분리하지 않음
+    PARTITION_RETENTION_MONTHS: int = 0
+
+    # in-process hour lock stripes
+    HOUR_LOCK_STRIPES: int = 1024
+
+    # schedule_slot 인원을 나눠 담을 shard 수, 0 이면 시간당 한 row 사용
+    SLOT_SHARD_COUNT: int = 0
+    # schedule_slot 대신 하루 한 row(int[24]) 인 schedule_slot_day 사용, shard 보다 우선
+    SLOT_DAY_ROWS: bool = False
+
+    # schedule slot page cache, size 0 disables
+    SLOT_PAGE_CACHE_SIZE: int = 1024
+    SLOT_PAGE_CACHE_TTL_SECONDS: float = 5
+
+    # list 응답을 response_model 검증 없이 바로 encoding (orjson 이 있으면 사용)
+    FAST_JSON_RESPONSE: bool = False
+
+    # Accept-Encoding 협상 응답 압축 (brotli 는 패키지가 있을 때만), route 별 수준은 compression_level
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # database
     POSTGRES_SERVER: str = "localhost"
     POSTGRES_PORT: int = 5432
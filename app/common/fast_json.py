@@ -0,0 +1,54 @@
+import json
+from datetime import date
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.common.enviroment import env
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 encoding
+    orjson = None
+
+
+# asyncpg 의 UUID 처럼 표준 타입을 상속한 값도 처리
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"not json serializable. type: '{type(value).__name__}'")
+
+
+# router 가 응답 형식대로 만든 dict 를 검증 없이 한 번에 encoding
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=_default)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+
+# FAST_JSON_RESPONSE 이면 response_model 검증을 건너뛰고, 아니면 FastAPI 가 검증 후 encoding
+# headers 는 만들어진 응답 한 곳에만 붙도록, dict 를 돌려줄 때만 주입받은 response 에 추가
+def fast_json(
+    content: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    response: Response | None = None,
+) -> dict[str, Any] | FastJSONResponse:
+    if env.FAST_JSON_RESPONSE:
+        return FastJSONResponse(content, headers=headers)
+    if headers and response is not None:
+        response.headers.update(headers)
+    return content
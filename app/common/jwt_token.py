@@ -21,10 +21,16 @@ class JwtTokenUtil:
         return jwt.encode(auth_and_exp, env.SECRET_KEY, algorithm=self.ALGORITHM)
 
     def verify_access_token(self, token: str) -> Authentication:
+        return self.verify_access_token_with_exp(token)[0]
+
+    # 검증된 인증 정보와 만료 시각(epoch seconds), exp 가 없는 token 은 None
+    def verify_access_token_with_exp(
+        self, token: str
+    ) -> tuple[Authentication, float | None]:
         payload = self.__parse_token(token)
         account_id: UUID = self.__parse_sub(payload.get("sub"))
         role: Role = self.__parse_role(payload.get("role"))
-        return Authentication(account_id=account_id, role=role)
+        return Authentication(account_id=account_id, role=role), payload.get("exp")
 
     def __parse_token(self, token: str) -> dict:
         try:
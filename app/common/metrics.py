@@ -0,0 +1,15 @@
+from typing import Callable, Any
+
+
+class Metrics:
+    def __init__(self):
+        self.__sources: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register(self, name: str, source: Callable[[], dict[str, Any]]) -> None:
+        self.__sources[name] = source
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: source() for name, source in self.__sources.items()}
+
+
+metrics = Metrics()
@@ -0,0 +1,56 @@
+from collections import Counter
+from typing import Any, TypeVar
+
+from sqlalchemy import event, Engine
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.sql import Executable
+
+from app.common.metrics import metrics
+
+STATEMENT_NAME_KEY = "statement_name"
+
+T = TypeVar("T", bound=Executable)
+
+
+# 모듈 로딩 시 한 번 만든 문장에 이름을 붙여 compiled cache 적중률을 이름별로 집계
+def named_statement(name: str, stmt: T) -> T:
+    return stmt.execution_options(**{STATEMENT_NAME_KEY: name})
+
+
+class StatementCacheStats:
+    def __init__(self):
+        self.__hits: Counter[str] = Counter()
+        self.__misses: Counter[str] = Counter()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self.__record)
+
+    def __record(self, conn, cursor, statement, parameters, context, executemany):
+        if context is None:
+            return
+        name = context.execution_options.get(STATEMENT_NAME_KEY)
+        if name is None:
+            return
+        if context.cache_hit == CacheStats.CACHE_HIT:
+            self.__hits[name] += 1
+        else:
+            self.__misses[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        report = {}
+        for name in sorted(self.__hits.keys() | self.__misses.keys()):
+            hits, misses = self.__hits[name], self.__misses[name]
+            report[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses),
+            }
+        return report
+
+    def clear(self) -> None:
+        self.__hits.clear()
+        self.__misses.clear()
+
+
+statement_cache_stats = StatementCacheStats()
+metrics.register("statement_cache", statement_cache_stats.stats)
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TtlLruCache(Generic[K, V]):
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size: int = max_size
+        self.ttl_seconds: float = ttl_seconds
+        self.__entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.invalidations: int = 0
+
+    def is_enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: K) -> V | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expire_at, value = entry
+        if expire_at <= time.monotonic():
+            del self.__entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    # ttl_seconds 를 지정하면 항목별 만료시간으로 사용
+    def put(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        if not self.is_enabled():
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.__entries[key] = (time.monotonic() + ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> None:
+        keys = [key for key in self.__entries if predicate(key)]
+        for key in keys:
+            del self.__entries[key]
+        self.invalidations += len(keys)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        requests = self.hits + self.misses
+        return {
+            "size": len(self.__entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
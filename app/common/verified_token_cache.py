@@ -0,0 +1,65 @@
+import hashlib
+import time
+
+from app.common.authentication import Authentication
+from app.common.enviroment import env
+from app.common.exceptions import AuthenticateException
+from app.common.jwt_token import JwtTokenUtil, jwt_token_util
+from app.common.metrics import metrics
+from app.common.ttl_lru_cache import TtlLruCache
+
+
+# 임의 길이의 token 을 그대로 저장하지 않도록 고정 길이 digest 를 key 로 사용
+def token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+# 검증한 token 은 만료(exp)까지, 검증에 실패한 token 은 잠시 동안 결과를 재사용
+# 실패 결과는 같은 예외 객체를 다시 던지면 traceback 이 쌓이므로 메시지만 저장
+class VerifiedTokenCache:
+    def __init__(
+        self,
+        token_util: JwtTokenUtil,
+        max_size: int,
+        rejected_max_size: int,
+        rejected_ttl_seconds: float,
+    ):
+        self.token_util: JwtTokenUtil = token_util
+        self.verified: TtlLruCache[bytes, Authentication] = TtlLruCache(max_size, 0)
+        self.rejected: TtlLruCache[bytes, str] = TtlLruCache(
+            rejected_max_size, rejected_ttl_seconds
+        )
+
+    def verify(self, token: str) -> Authentication:
+        key = token_key(token)
+        if self.verified.is_enabled():
+            user = self.verified.get(key)
+            if user is not None:
+                return user
+        if self.rejected.is_enabled():
+            message = self.rejected.get(key)
+            if message is not None:
+                raise AuthenticateException(message)
+
+        try:
+            user, exp = self.token_util.verify_access_token_with_exp(token)
+        except AuthenticateException as e:
+            self.rejected.put(key, e.message())
+            raise
+        if exp is not None:
+            self.verified.put(key, user, exp - time.time())
+        return user
+
+    def clear(self) -> None:
+        self.verified.clear()
+        self.rejected.clear()
+
+
+verified_token_cache = VerifiedTokenCache(
+    jwt_token_util,
+    env.TOKEN_CACHE_SIZE,
+    env.REJECTED_TOKEN_CACHE_SIZE,
+    env.REJECTED_TOKEN_CACHE_TTL_SECONDS,
+)
+metrics.register("verified_token_cache", verified_token_cache.verified.stats)
+metrics.register("rejected_token_cache", verified_token_cache.rejected.stats)
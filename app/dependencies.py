@@ -3,11 +3,14 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.common.database import session
 from app.service.account_service import AccountService
+from app.service.capacity_ledger import capacity_ledger
+from app.service.hour_lock_table import hour_lock_table
 from app.service.schedule_service import ScheduleService
 from app.service.schedule_slot_service import ScheduleSlotService
+from app.service.slot_page_cache import slot_page_cache
 from app.storage.account_repository import AccountRepository
 from app.storage.schedule_repository import ScheduleRepository
-from app.storage.schedule_slot_repository import ScheduleSlotRepository
+from app.storage.schedule_slot_repository_factory import schedule_slot_repository
 
 
 def account_service(sess: AsyncSession = Depends(session)):
@@ -21,4 +24,9 @@ def schedule_service(sess: AsyncSession = Depends(session)):
 
 
 def schedule_slot_service(sess: AsyncSession = Depends(session)):
-    return ScheduleSlotService(ScheduleSlotRepository(sess))
+    return ScheduleSlotService(
+        schedule_slot_repository(sess),
+        capacity_ledger,
+        slot_page_cache,
+        hour_lock_table,
+    )
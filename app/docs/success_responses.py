@@ -0,0 +1,20 @@
+from app.api.routes.dto.schedule_slot_dto import (
+    ColumnarScheduleSlotResponse,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    INT32_MEDIA_TYPE,
+)
+
+get_schedule_slots_formats = {
+    200: {
+        "description": "Accept 헤더로 형식 선택."
+        + f" {COLUMNAR_JSON_MEDIA_TYPE}: 시작 시각, 간격(초), 시간 순서의 인원 배열."
+        + f" {INT32_MEDIA_TYPE}: little-endian int32"
+        + " [start hour_key, 시간 수, max_applicants..., confirmed_applicants...]",
+        "content": {
+            COLUMNAR_JSON_MEDIA_TYPE: {
+                "schema": ColumnarScheduleSlotResponse.model_json_schema()
+            },
+            INT32_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+        },
+    },
+}
@@ -1,22 +1,54 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from starlette.middleware.authentication import AuthenticationMiddleware
 
 from app.api.api_router import api_router
-from app.common.auth_middleware import BearerTokenAuthBackend, auth_error_handler
+from app.common.compression import CompressionMiddleware
+from app.common.database import AsyncSessionLocal
 from app.common.enviroment import env
 from app.common.exception_handler import exception_handle
+from app.common.statement_cache import statement_cache_stats
+from app.service.capacity_ledger import capacity_ledger
+from app.service.slot_horizon_worker import slot_horizon_worker
+from app.storage.day_schedule_slot_repository import DayScheduleSlotRepository
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    if env.SLOT_DAY_ROWS:
+        # day row 로 바꾼 뒤 처음 기동할 때 시간 단위 테이블의 인원을 옮김
+        async with AsyncSessionLocal() as sess:
+            repository = DayScheduleSlotRepository(sess)
+            backfilled = await repository.backfill_from_hour_slots()
+            await sess.commit()
+        logger.info("schedule_slot_day backfilled: %d", backfilled)
+    if env.SLOT_HORIZON_WORKER_ENABLED:
+        slot_horizon_worker.start()
+    capacity_ledger.start()
+    yield
+    await capacity_ledger.stop()
+    await slot_horizon_worker.stop()
+    # 기동 이후 문장별 compiled cache 적중률, 실행 중에는 /admin/metrics 로 확인
+    logger.info("statement cache since startup: %s", statement_cache_stats.stats())
+
 
 app: FastAPI = FastAPI(
     title="exam schedule reservation system",
     docs_url=env.DOCS_URL,
+    lifespan=lifespan,
 )
 
 exception_handle(app)
 
-app.add_middleware(
-    AuthenticationMiddleware,
-    backend=BearerTokenAuthBackend(),
-    on_error=auth_error_handler,
-)
+if env.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=env.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=env.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=env.COMPRESSION_BROTLI_QUALITY,
+    )
 
 app.include_router(api_router)
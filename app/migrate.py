@@ -0,0 +1,268 @@
+import asyncio
+import hashlib
+import logging
+import re
+from pathlib import Path
+
+import asyncpg
+
+from app.common.enviroment import env
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_DIR = Path(__file__).resolve().parents[1] / "script" / "migrations"
+MIGRATION_FILE_PATTERN = re.compile(r"^V(\d+)__(\w+)\.sql$")
+# 파일 첫 줄들의 "-- migrate: <option>" 으로 실행 방식을 지정
+MIGRATION_OPTION_PATTERN = re.compile(r"^-- migrate: (.+)$")
+# CREATE INDEX CONCURRENTLY 처럼 트랜잭션 안에서 실행할 수 없는 파일
+NO_TRANSACTION_OPTION = "no-transaction"
+# 서버에 extension 이 없으면 기록하지 않고 건너뛰어 설치 후 다음 배포에서 적용되는 선택 migration
+REQUIRES_EXTENSION_OPTION = "requires-extension "
+# 여러 인스턴스가 동시에 배포되어도 한 곳에서만 적용
+MIGRATION_LOCK_KEY = 20250301
+BASELINE_VERSION = 1
+# 문장 구분자가 아닌 ; 를 포함할 수 있는 주석, 문자열, 따옴표 식별자, $tag$ 본문과 구분자
+SQL_TOKEN_PATTERN = re.compile(
+    r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\""
+    r"|(\$(?:[A-Za-z_]\w*)?\$).*?\1|;",
+    re.DOTALL,
+)
+CONCURRENT_INDEX_PATTERN = re.compile(
+    r"^CREATE\s+(UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)"
+    r"\s+ON\s+(\w+)\s+(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class Migration:
+    def __init__(self, version: int, name: str, sql: str):
+        self.version: int = version
+        self.name: str = name
+        self.sql: str = sql
+        self.checksum: str = hashlib.sha256(sql.encode()).hexdigest()
+
+    def options(self) -> list[str]:
+        options = []
+        for line in self.sql.splitlines():
+            matched = MIGRATION_OPTION_PATTERN.match(line)
+            if matched is None:
+                break
+            options.append(matched.group(1).strip())
+        return options
+
+    def is_transactional(self) -> bool:
+        return NO_TRANSACTION_OPTION not in self.options()
+
+    def required_extension(self) -> str | None:
+        for option in self.options():
+            if option.startswith(REQUIRES_EXTENSION_OPTION):
+                return option[len(REQUIRES_EXTENSION_OPTION) :].strip()
+        return None
+
+    # 트랜잭션 밖에서는 여러 문장을 한 번에 보내면 암묵적 트랜잭션으로 묶이므로 나눠서 실행
+    def statements(self) -> list[str]:
+        statements, current, position = [], [], 0
+        for token in SQL_TOKEN_PATTERN.finditer(self.sql):
+            current.append(self.sql[position : token.start()])
+            position = token.end()
+            if token.group() == ";":
+                statements.append("".join(current))
+                current = []
+            elif not token.group().startswith(("--", "/*")):
+                current.append(token.group())
+        current.append(self.sql[position:])
+        statements.append("".join(current))
+        return [statement.strip() for statement in statements if statement.strip()]
+
+
+def load_migrations(directory: Path = MIGRATION_DIR) -> list[Migration]:
+    migrations = {}
+    for path in directory.iterdir():
+        matched = MIGRATION_FILE_PATTERN.match(path.name)
+        if matched is None:
+            continue
+        version = int(matched.group(1))
+        if version in migrations:
+            raise ValueError(f"duplicated migration version. version: '{version}'")
+        migrations[version] = Migration(version, matched.group(2), path.read_text())
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def database_dsn(database: str | None = None) -> str:
+    dsn = str(env.DATABASE_URL).replace("postgresql+asyncpg://", "postgresql://")
+    if database is None:
+        return dsn
+    return f"{dsn.rsplit('/', 1)[0]}/{database}"
+
+
+async def migrate(
+    directory: Path = MIGRATION_DIR, dsn: str | None = None
+) -> list[Migration]:
+    migrations = load_migrations(directory)
+    conn = await asyncpg.connect(dsn or database_dsn())
+    try:
+        await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_KEY)
+        try:
+            applied = await _applied_checksums(conn, migrations)
+            migrated = []
+            for migration in migrations:
+                if migration.version in applied:
+                    continue
+                if not await _available(conn, migration):
+                    logger.warning(
+                        "skip migration V%03d %s, extension %s is not available",
+                        migration.version,
+                        migration.name,
+                        migration.required_extension(),
+                    )
+                    continue
+                logger.info(
+                    "apply migration V%03d %s", migration.version, migration.name
+                )
+                await _apply(conn, migration)
+                migrated.append(migration)
+            return migrated
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_KEY)
+    finally:
+        await conn.close()
+
+
+async def _applied_checksums(
+    conn: asyncpg.Connection, migrations: list[Migration]
+) -> dict[int, str]:
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY NOT NULL,
+            name VARCHAR(100) NOT NULL,
+            checksum VARCHAR(64) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+        """)
+    rows = await conn.fetch("SELECT version, checksum FROM schema_migrations")
+    applied = {row["version"]: row["checksum"] for row in rows}
+    if not applied and await conn.fetchval(
+        "SELECT to_regclass('schedule') IS NOT NULL"
+    ):
+        # init.sql 로 만들어진 기존 데이터베이스는 baseline 을 적용된 것으로 기록
+        baseline = next(m for m in migrations if m.version == BASELINE_VERSION)
+        await _record(conn, baseline)
+        applied[baseline.version] = baseline.checksum
+
+    for migration in migrations:
+        checksum = applied.get(migration.version)
+        if checksum is not None and checksum != migration.checksum:
+            raise ValueError(
+                f"applied migration was modified. version: '{migration.version}'"
+            )
+    return applied
+
+
+async def _available(conn: asyncpg.Connection, migration: Migration) -> bool:
+    extension = migration.required_extension()
+    if extension is None:
+        return True
+    return await conn.fetchval(
+        "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = $1)",
+        extension,
+    )
+
+
+async def _apply(conn: asyncpg.Connection, migration: Migration) -> None:
+    if migration.is_transactional():
+        async with conn.transaction():
+            await conn.execute(migration.sql)
+            await _record(conn, migration)
+        return
+    for statement in migration.statements():
+        matched = CONCURRENT_INDEX_PATTERN.match(statement)
+        if matched is None:
+            await conn.execute(statement)
+        else:
+            await _create_index_concurrently(conn, *matched.groups())
+    await _record(conn, migration)
+
+
+# partitioned table 에는 CONCURRENTLY 를 쓸 수 없으므로 부모에 ON ONLY 로 인덱스를 만들고
+# partition 마다 CONCURRENTLY 로 만든 인덱스를 attach, 모두 attach 되면 부모 인덱스가 유효해짐
+async def _create_index_concurrently(
+    conn: asyncpg.Connection,
+    unique: str | None,
+    index_name: str,
+    table: str,
+    definition: str,
+) -> None:
+    unique = unique or ""
+    partitioned = await conn.fetchval(
+        "SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass($1)", table
+    )
+    if not partitioned:
+        await _drop_invalid_index(conn, index_name)
+        await conn.execute(
+            f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {index_name}"
+            f" ON {table} {definition}"
+        )
+        return
+    # 같은 이름의 일반 인덱스가 이미 있으면 IF NOT EXISTS 와 같이 건너뜀
+    if await conn.fetchval(
+        "SELECT relkind = 'i' FROM pg_class WHERE oid = to_regclass($1)", index_name
+    ):
+        return
+
+    await conn.execute(
+        f"CREATE {unique}INDEX IF NOT EXISTS {index_name} ON ONLY {table} {definition}"
+    )
+    # 다시 실행할 때는 인덱스가 아직 attach 되지 않은 partition 만 처리
+    partitions = await conn.fetch(
+        "SELECT inhrelid::regclass::text AS name FROM pg_inherits child"
+        " WHERE inhparent = to_regclass($1) AND NOT EXISTS ("
+        "  SELECT 1 FROM pg_inherits attached"
+        "  JOIN pg_index ON pg_index.indexrelid = attached.inhrelid"
+        "  WHERE attached.inhparent = to_regclass($2)"
+        "  AND pg_index.indrelid = child.inhrelid"
+        " ) ORDER BY 1",
+        table,
+        index_name,
+    )
+    for partition in partitions:
+        partition_index = _partition_index_name(index_name, table, partition["name"])
+        await _create_index_concurrently(
+            conn, unique, partition_index, partition["name"], definition
+        )
+        await conn.execute(
+            f"ALTER INDEX {index_name} ATTACH PARTITION {partition_index}"
+        )
+
+
+def _partition_index_name(index_name: str, table: str, partition: str) -> str:
+    if index_name.startswith(f"{table}_"):
+        return f"{partition}{index_name[len(table):]}"
+    return f"{partition}_{index_name}"
+
+
+# 실패한 CREATE INDEX CONCURRENTLY 는 INVALID 인덱스를 남기고 다시 실행하면 IF NOT EXISTS 로 건너뛰므로 먼저 삭제
+# 아직 attach 중인 partitioned 인덱스는 partition 인덱스까지 지워지므로 제외
+async def _drop_invalid_index(conn: asyncpg.Connection, index_name: str) -> None:
+    invalid = await conn.fetchval(
+        "SELECT NOT indisvalid FROM pg_index JOIN pg_class ON pg_class.oid = indexrelid"
+        " WHERE indexrelid = to_regclass($1) AND relkind = 'i'",
+        index_name,
+    )
+    if invalid:
+        logger.info("drop invalid index %s", index_name)
+        await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+async def _record(conn: asyncpg.Connection, migration: Migration) -> None:
+    await conn.execute(
+        "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)",
+        migration.version,
+        migration.name,
+        migration.checksum,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    applied_migrations = asyncio.run(migrate())
+    logger.info("migration finished. applied: %d", len(applied_migrations))
@@ -0,0 +1,21 @@
+import asyncio
+import logging
+
+from app.common.database import AsyncSessionLocal
+from app.storage.schedule_repository import ScheduleRepository
+
+logger = logging.getLogger(__name__)
+
+
+# V004 배포 중 schedule_count 를 갱신하지 않는 이전 버전 서버가 남긴 차이를 바로잡는 운영 명령
+# 이전 버전 서버가 모두 내려간 뒤 실행, 새 버전 서버의 쓰기를 멈추지 않아도 됨
+async def recount_schedules() -> int:
+    async with AsyncSessionLocal() as sess:
+        corrected = await ScheduleRepository(sess).recount()
+        await sess.commit()
+    return corrected
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logger.info("schedule counts corrected: %s", asyncio.run(recount_schedules()))
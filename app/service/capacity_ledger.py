@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from app.common.database import AsyncSessionLocal
+from app.common.enviroment import env
+from app.service.models.hour_key import ceil_hour_key
+from app.service.models.page import ScheduleSlotPage
+from app.service.models.schedule_slot_query import ScheduleSlotQuery
+from app.storage.schedule_slot_repository import ScheduleSlotRepository
+from app.storage.schedule_slot_repository_factory import schedule_slot_repository
+
+logger = logging.getLogger(__name__)
+
+
+# worker 프로세스 단위의 시간별 인원 배열, 장부 범위 안의 슬롯 목록 조회를 데이터베이스 없이 처리
+# 인원 검사에는 사용하지 않음, 다른 프로세스의 변경은 주기적으로 다시 읽을 때 반영
+# 다시 읽기는 요청 경로 밖의 task 에서 수행하고, 오래된 장부는 조회에 쓰지 않음, days 0 이면 사용하지 않음
+class CapacityLedger:
+    def __init__(self, days: int, refresh_seconds: float):
+        self.hours: int = days * 24
+        self.refresh_seconds: float = refresh_seconds
+        self.loaded_at: float | None = None
+        self.__page: ScheduleSlotPage | None = None
+        self.__task: asyncio.Task | None = None
+
+    def is_enabled(self) -> bool:
+        return self.hours > 0
+
+    # 다시 읽기가 두 번 연속 늦어지면 오래된 것으로 봄
+    def is_fresh(self) -> bool:
+        return (
+            self.loaded_at is not None
+            and time.monotonic() - self.loaded_at < self.refresh_seconds * 2
+        )
+
+    # 조회할 수 있는 가장 이른 시간부터, 조회 요청과 같은 기준(ScheduleSlotQuery)으로 범위를 정함
+    def window(self) -> tuple[int, int]:
+        first_date = datetime.now().date() + timedelta(
+            days=ScheduleSlotQuery.ALLOWED_START_BEFORE
+        )
+        start_key = ceil_hour_key(datetime.combine(first_date, datetime.min.time()))
+        return start_key, start_key + self.hours
+
+    async def hydrate(self, repository: ScheduleSlotRepository) -> None:
+        self.load(await repository.find_range_page(*self.window()))
+
+    def load(self, page: ScheduleSlotPage) -> None:
+        self.__page = page
+        self.loaded_at = time.monotonic()
+
+    def page(self, start_key: int, end_key: int) -> ScheduleSlotPage | None:
+        page = self.__page
+        if (
+            not self.is_fresh()
+            or start_key < page.start_key
+            or page.end_key() < end_key
+        ):
+            return None
+        left, right = start_key - page.start_key, end_key - page.start_key
+        return ScheduleSlotPage(
+            start_key,
+            page.max_applicants[left:right],
+            page.confirmed_applicants[left:right],
+        )
+
+    # 커밋된 확정 인원 변경을 다음 다시 읽기 전까지 반영, 장부 범위 밖의 시간은 무시
+    def add_applicants(self, start_key: int, end_key: int, applicants: int) -> None:
+        page = self.__page
+        if page is None:
+            return
+        confirmed_applicants = page.confirmed_applicants
+        for hour_key in range(
+            max(start_key, page.start_key), min(end_key, page.end_key())
+        ):
+            confirmed_applicants[hour_key - page.start_key] += applicants
+
+    async def run_once(self) -> None:
+        async with AsyncSessionLocal() as sess:
+            await self.hydrate(schedule_slot_repository(sess))
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("capacity ledger refresh failed")
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self) -> None:
+        if self.is_enabled():
+            self.__task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+
+capacity_ledger = CapacityLedger(
+    env.CAPACITY_LEDGER_DAYS if env.CAPACITY_LEDGER_ENABLED else 0,
+    env.CAPACITY_LEDGER_REFRESH_SECONDS,
+)
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Iterable
+
+from app.common.enviroment import env
+
+
+# hour_key 를 stripe 로 나눈 worker 내부 잠금, 데이터베이스 row lock 보다 먼저 획득
+class HourLockTable:
+    def __init__(self, stripes: int):
+        self.__locks: list[asyncio.Lock] = [asyncio.Lock() for _ in range(stripes)]
+
+    def stripes(self, hour_keys: Iterable[int]) -> list[int]:
+        return sorted({hour_key % len(self.__locks) for hour_key in hour_keys})
+
+    def is_free(self, stripes: list[int]) -> bool:
+        return not any(self.__locks[stripe].locked() for stripe in stripes)
+
+    # 교착 상태를 피하기 위해 항상 stripe 오름차순으로 획득
+    async def acquire(self, stripes: list[int]) -> None:
+        acquired = []
+        try:
+            for stripe in stripes:
+                await self.__locks[stripe].acquire()
+                acquired.append(stripe)
+        except BaseException:
+            self.release(acquired)
+            raise
+
+    def release(self, stripes: list[int]) -> None:
+        for stripe in reversed(stripes):
+            self.__locks[stripe].release()
+
+
+hour_lock_table = HourLockTable(env.HOUR_LOCK_STRIPES)
@@ -0,0 +1,18 @@
+from app.service.models.time_range import TimeRange
+
+
+# 시간(hour_key)별 확정 인원 변화량
+class ApplicantsDelta:
+    def __init__(self):
+        self.__deltas: dict[int, int] = {}
+
+    def add(self, time_range: TimeRange, applicants: int) -> "ApplicantsDelta":
+        for hour_key in range(time_range.start_key(), time_range.end_key()):
+            self.__deltas[hour_key] = self.__deltas.get(hour_key, 0) + applicants
+        return self
+
+    def changes(self) -> dict[int, int]:
+        return {key: delta for key, delta in self.__deltas.items() if delta != 0}
+
+    def increased_keys(self) -> list[int]:
+        return sorted(key for key, delta in self.__deltas.items() if delta > 0)
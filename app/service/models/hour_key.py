@@ -0,0 +1,18 @@
+from datetime import datetime, timedelta
+
+EPOCH: datetime = datetime(1970, 1, 1)
+HOUR: timedelta = timedelta(hours=1)
+
+
+# 1970-01-01 00:00 부터 지난 시간(hour) 수, 정각이 아니면 내림
+def to_hour_key(d: datetime) -> int:
+    return (d - EPOCH) // HOUR
+
+
+# 정각이 아니면 다음 정각의 key
+def ceil_hour_key(d: datetime) -> int:
+    return -((EPOCH - d) // HOUR)
+
+
+def from_hour_key(hour_key: int) -> datetime:
+    return EPOCH + hour_key * HOUR
@@ -1,26 +1,73 @@
+from array import array
 from datetime import datetime
-from typing import Sequence
+from typing import Sequence, Mapping, Any, Iterator, Iterable
 
-from app.storage.models.schedule import Schedule
-from app.storage.models.schedule_slot import ScheduleSlot
+from app.service.models.hour_key import from_hour_key
+from app.storage.models.schedule_slot import DEFAULT_MAX_APPLICANTS, ScheduleSlot
 
 
 class SchedulePage:
     def __init__(
-        self, total: int, page_size: int, page_number: int, items: Sequence[Schedule]
+        self,
+        total: int | None,
+        page_size: int,
+        page_number: int,
+        items: Sequence[Mapping[str, Any]],
+        next_cursor: str | None = None,
     ):
-        self.total: int = total
+        self.total: int | None = total
         self.page_size: int = page_size
         self.page_number: int = page_number
-        self.items: Sequence[Schedule] = items
+        # schedule 컬럼과 account nickname 만 담은 조회 전용 row
+        self.items: Sequence[Mapping[str, Any]] = items
+        self.next_cursor: str | None = next_cursor
 
 
+# 한 시간 슬롯과 그 시간에 겹치는 CONFIRMED schedule row
+class SlotSchedules:
+    def __init__(self, slot: ScheduleSlot, items: Sequence[Mapping[str, Any]]):
+        self.slot: ScheduleSlot = slot
+        self.items: Sequence[Mapping[str, Any]] = items
+
+    def applicants(self) -> int:
+        return sum(item["applicants"] for item in self.items)
+
+
+# 시간별 인원을 ScheduleSlot 객체 대신 int 배열로 담은 연속된 시간 범위
 class ScheduleSlotPage:
-    def __init__(self, items: Sequence[ScheduleSlot]):
-        self.items: Sequence[ScheduleSlot] = items
+    def __init__(
+        self, start_key: int, max_applicants: array, confirmed_applicants: array
+    ):
+        self.start_key: int = start_key
+        self.max_applicants: array = max_applicants
+        self.confirmed_applicants: array = confirmed_applicants
 
     def start_at(self) -> datetime:
-        return self.items[0].start_at()
+        return from_hour_key(self.start_key)
 
     def end_at(self) -> datetime:
-        return self.items[-1].end_at()
+        return from_hour_key(self.end_key())
+
+    def end_key(self) -> int:
+        return self.start_key + len(self.max_applicants)
+
+    # (hour_key, max_applicants, confirmed_applicants)
+    def rows(self) -> Iterator[tuple[int, int, int]]:
+        return zip(
+            range(self.start_key, self.end_key()),
+            self.max_applicants,
+            self.confirmed_applicants,
+        )
+
+    # row 가 없는 시간은 기본값(max_applicants, 0명 확정) 으로 채움
+    @staticmethod
+    def from_rows(
+        start_key: int, end_key: int, rows: Iterable[tuple[int, int, int]]
+    ) -> "ScheduleSlotPage":
+        hours = end_key - start_key
+        max_applicants = array("i", [DEFAULT_MAX_APPLICANTS]) * hours
+        confirmed_applicants = array("i", [0]) * hours
+        for hour_key, max_count, confirmed_count in rows:
+            max_applicants[hour_key - start_key] = max_count
+            confirmed_applicants[hour_key - start_key] = confirmed_count
+        return ScheduleSlotPage(start_key, max_applicants, confirmed_applicants)
@@ -0,0 +1,25 @@
+import base64
+import binascii
+from datetime import datetime
+
+from app.common.exceptions import BusinessException, ErrorCode
+
+
+# 마지막으로 응답한 schedule 의 (start_at, id), 클라이언트에는 불투명한 문자열로 전달
+class ScheduleCursor:
+    def __init__(self, start_at: datetime, id_: int):
+        self.start_at: datetime = start_at
+        self.id: int = id_
+
+    def encode(self) -> str:
+        raw = f"{self.start_at.isoformat()},{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode(value: str) -> "ScheduleCursor":
+        try:
+            raw = base64.urlsafe_b64decode(value.encode()).decode()
+            start_at, id_ = raw.split(",")
+            return ScheduleCursor(datetime.fromisoformat(start_at), int(id_))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise BusinessException("invalid cursor.", ErrorCode.INVALID_ARGUMENT)
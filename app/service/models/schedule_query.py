@@ -1,11 +1,44 @@
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from app.common.exceptions import BusinessException, ErrorCode
+from app.service.models.schedule_cursor import ScheduleCursor
+from app.service.models.schedule_status import ScheduleStatus
+
 
 class ScheduleQuery:
-    def __init__(self, page_size: int, page_number: int, account_id: UUID | None):
+    def __init__(
+        self,
+        page_size: int,
+        page_number: int,
+        account_id: UUID | None,
+        cursor: str | None = None,
+        include_total: bool = True,
+        status: ScheduleStatus | None = None,
+        start_from: datetime | None = None,
+        start_to: datetime | None = None,
+        name: str | None = None,
+    ):
+        if start_from and start_to and start_from >= start_to:
+            raise BusinessException(
+                "start-from must be before start-to.", ErrorCode.INVALID_ARGUMENT
+            )
         self.page_size = page_size
         self.page_number = page_number
         self.account_id = account_id
+        self.include_total: bool = include_total
+        # cursor 파라미터가 있으면(빈 문자열은 첫 페이지) keyset 방식으로 조회
+        self.keyset: bool = cursor is not None
+        self.cursor: ScheduleCursor | None = (
+            ScheduleCursor.decode(cursor) if cursor else None
+        )
+        self.status: ScheduleStatus | None = status
+        # start_at 이 [start_from, start_to) 인 schedule
+        self.start_from: datetime | None = start_from
+        self.start_to: datetime | None = start_to
+        # 이름에 포함된 문자열
+        self.name: str | None = name or None
 
     def offset(self) -> int:
         return self.page_number * self.page_size
@@ -13,5 +46,16 @@ class ScheduleQuery:
     def limit(self) -> int:
         return self.page_size
 
-    def has_account_filter(self):
-        return self.account_id is not None
+    # 값이 있는 조건만 (조건 이름, 값), 조건 이름 조합 별로 조회 문장이 정해짐
+    def filters(self) -> dict[str, Any]:
+        filters = {
+            "account_id": self.account_id,
+            "status": self.status,
+            "start_from": self.start_from,
+            "start_to": self.start_to,
+            "name": self.name,
+        }
+        return {key: value for key, value in filters.items() if value is not None}
+
+    def is_keyset(self) -> bool:
+        return self.keyset
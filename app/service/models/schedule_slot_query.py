@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 
 from app.common.exceptions import BusinessException, ErrorCode
+from app.service.models.hour_key import ceil_hour_key
 
 
 class ScheduleSlotQuery:
@@ -15,6 +16,12 @@ class ScheduleSlotQuery:
         self.__validate_time_order()
         self.__validate_max_period()
 
+    def start_key(self) -> int:
+        return ceil_hour_key(self.start_at)
+
+    def end_key(self) -> int:
+        return ceil_hour_key(self.end_at)
+
     def __validate_min_start_at(self):
         min_start_date = datetime.now().date() + timedelta(
             days=self.ALLOWED_START_BEFORE
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from app.service.models.hour_key import to_hour_key
+
 
 class TimeRange:
     def __init__(self, start_at: datetime, end_at: datetime):
@@ -13,12 +15,24 @@ class TimeRange:
         if start_at >= end_at:
             raise ValueError("start_at must be before end_at.")
 
+        self.__start_key = to_hour_key(start_at)
+        self.__end_key = to_hour_key(end_at)
+
     def start_at(self) -> datetime:
         return self.__start_at
 
     def end_at(self) -> datetime:
         return self.__end_at
 
+    def start_key(self) -> int:
+        return self.__start_key
+
+    def end_key(self) -> int:
+        return self.__end_key
+
+    def hours(self) -> int:
+        return self.__end_key - self.__start_key
+
     @staticmethod
     def __is_hourly(d: datetime) -> bool:
         return d.minute == 0 and d.second == 0 and d.microsecond == 0
@@ -1,12 +1,14 @@
+from datetime import datetime
 from uuid import UUID
 
 from app.common.exceptions import NoResourceException
 from app.service.account_service import AccountService
-from app.service.models.page import SchedulePage
+from app.service.models.page import SchedulePage, SlotSchedules
 from app.service.models.schedule_form import ScheduleForm
 from app.service.models.schedule_query import ScheduleQuery
 from app.service.models.schedule_status import ScheduleStatus
 from app.service.models.schedule_status_change import ScheduleStatusChange
+from app.service.models.time_range import TimeRange
 from app.service.schedule_slot_service import ScheduleSlotService
 from app.storage.models.schedule import Schedule
 from app.storage.schedule_repository import ScheduleRepository
@@ -26,6 +28,13 @@ class ScheduleService:
     async def list(self, query: ScheduleQuery) -> SchedulePage:
         return await self.repository.find_all(query)
 
+    async def slot_schedules(self, start_at: datetime) -> SlotSchedules:
+        slot = await self.slot_service.get(start_at)
+        items = await self.repository.find_confirmed_overlapping(
+            slot.start_at(), slot.end_at()
+        )
+        return SlotSchedules(slot, items)
+
     async def create(self, account_id: UUID, form: ScheduleForm) -> Schedule:
         account = await self.account_service.get_or_raise(account_id)
         schedule = Schedule.from_form(form, account)
@@ -39,12 +48,14 @@ class ScheduleService:
     ) -> Schedule:
         schedule = await self.__get_or_raise(schedule_id)
         schedule.validate_owner(account_id)
+        await self.__lock_slots(schedule, schedule.time_range(), form.time_range())
         await self.slot_service.re_allocate(schedule, form)
         schedule.update(form)
         return await self.repository.save(schedule)
 
     async def admin_update(self, schedule_id: int, form: ScheduleForm) -> Schedule:
         schedule = await self.__get_or_raise(schedule_id)
+        await self.__lock_slots(schedule, schedule.time_range(), form.time_range())
         await self.slot_service.re_allocate(schedule, form)
         schedule.update(form)
         return await self.repository.save(schedule)
@@ -52,6 +63,7 @@ class ScheduleService:
     async def customer_cancel(self, account_id: UUID, schedule_id: int) -> Schedule:
         schedule = await self.__get_or_raise(schedule_id)
         schedule.validate_owner(account_id)
+        await self.__lock_slots(schedule, schedule.time_range())
         schedule.validate_customer_cancel(account_id)
         await self.slot_service.add_or_minus_by(
             ScheduleStatusChange(schedule, ScheduleStatus.CANCELED)
@@ -63,9 +75,15 @@ class ScheduleService:
         self, schedule_id: int, to_be: ScheduleStatus
     ) -> Schedule:
         schedule = await self.__get_or_raise(schedule_id)
+        await self.__lock_slots(schedule, schedule.time_range())
         await self.slot_service.add_or_minus_by(ScheduleStatusChange(schedule, to_be))
         schedule.change_status(to_be)
-        return schedule
+        return await self.repository.save(schedule)
+
+    # 잠금을 기다리는 동안 다른 요청이 변경했을 수 있으므로 다시 조회
+    async def __lock_slots(self, schedule: Schedule, *time_ranges: TimeRange) -> None:
+        if await self.slot_service.lock(*time_ranges):
+            await self.repository.refresh(schedule)
 
     async def __get_or_raise(self, schedule_id: int) -> Schedule:
         schedule = await self.repository.find_by_id(schedule_id)
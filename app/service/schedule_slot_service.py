@@ -1,6 +1,10 @@
 from datetime import datetime
 
 from app.common.exceptions import BusinessException, ErrorCode
+from app.service.capacity_ledger import CapacityLedger
+from app.service.hour_lock_table import HourLockTable
+from app.service.slot_page_cache import SlotPageCache
+from app.service.models.applicants_delta import ApplicantsDelta
 from app.service.models.page import ScheduleSlotPage
 from app.service.models.schedule_form import ScheduleForm
 from app.service.models.schedule_slot_query import ScheduleSlotQuery
@@ -12,53 +16,120 @@ from app.storage.schedule_slot_repository import ScheduleSlotRepository
 
 
 class ScheduleSlotService:
-    def __init__(self, repository: ScheduleSlotRepository):
+    def __init__(
+        self,
+        repository: ScheduleSlotRepository,
+        ledger: CapacityLedger,
+        page_cache: SlotPageCache,
+        lock_table: HourLockTable,
+    ):
         self.repository = repository
+        self.ledger = ledger
+        self.page_cache = page_cache
+        self.lock_table = lock_table
 
     async def get(self, start_at: datetime) -> ScheduleSlot:
         return await self.repository.find_by_start_at(start_at)
 
     async def page(self, query: ScheduleSlotQuery) -> ScheduleSlotPage:
-        return await self.repository.find_page(query)
+        start_key, end_key = query.start_key(), query.end_key()
+        page = self.ledger.page(start_key, end_key)
+        if page is not None:
+            return page
+        page = self.page_cache.get(start_key, end_key)
+        if page is None:
+            page = await self.repository.find_page(query)
+            self.page_cache.put(start_key, end_key, page)
+        return page
+
+    # 세션이 끝날 때까지 시간별 잠금을 유지, 기다려야 했다면 True
+    async def lock(self, *time_ranges: TimeRange) -> bool:
+        stripes = self.lock_table.stripes(
+            hour_key
+            for time_range in time_ranges
+            for hour_key in range(time_range.start_key(), time_range.end_key())
+        )
+        waited = not self.lock_table.is_free(stripes)
+        if waited:
+            await self.repository.end_read_transaction()
+        await self.lock_table.acquire(stripes)
+        self.repository.on_close(lambda: self.lock_table.release(stripes))
+        return waited
 
     async def re_allocate(self, as_is: Schedule, to_be: ScheduleForm) -> None:
-        applicants = as_is.applicants
-        await self.__validate_applicants_limit_with_lock(to_be.time_range(), applicants)
         if as_is.is_slot_allocated():
-            await self.repository.add_applicants(as_is.time_range(), -applicants)
-            await self.repository.add_applicants(to_be.time_range(), applicants)
+            await self.__move(
+                as_is.time_range(),
+                as_is.applicants,
+                to_be.time_range(),
+                to_be.applicants,
+            )
+        else:
+            await self.validate_applicants_limit(to_be.time_range(), to_be.applicants)
 
     async def add_or_minus_by(self, change_status: ScheduleStatusChange) -> None:
         time_range = change_status.time_range
         applicants = change_status.applicants
         if change_status.increase_applicants():
-            await self.__validate_applicants_limit_with_lock(time_range, applicants)
-            await self.repository.add_applicants(time_range, applicants)
+            await self.__reserve(time_range, applicants)
         elif change_status.decrease_applicants():
-            await self.repository.add_applicants(time_range, -applicants)
+            await self.__release(time_range, applicants)
 
     async def validate_applicants_limit(
         self, time_range: TimeRange, applicants: int
     ) -> None:
-        remain_applicants: int = await self.repository.min_applicants_in_range(
-            time_range
-        )
+        # 장부는 다른 프로세스의 변경을 모르므로 인원 검사는 데이터베이스로 수행
+        remain_applicants = await self.repository.min_applicants_in_range(time_range)
         if remain_applicants < applicants:
-            raise BusinessException(
-                "Applicants must be less than or equal to the limit. "
-                + f"limit({remain_applicants}) < applicants({applicants}). range({time_range})",
-                ErrorCode.INVALID_ARGUMENT,
+            self.__raise_limit_over(time_range, applicants, remain_applicants)
+
+    async def __reserve(self, time_range: TimeRange, applicants: int) -> None:
+        if not await self.repository.reserve_applicants(time_range, applicants):
+            remain_applicants = await self.repository.min_applicants_in_range(
+                time_range
             )
+            self.__raise_limit_over(time_range, applicants, remain_applicants)
+        self.__after_applicants_change(time_range, applicants)
 
-    async def __validate_applicants_limit_with_lock(
-        self, time_range: TimeRange, applicants: int
+    async def __move(
+        self,
+        as_is_range: TimeRange,
+        as_is_applicants: int,
+        to_be_range: TimeRange,
+        to_be_applicants: int,
     ) -> None:
-        slots = await self.repository.find_schedules_by_range_with_lock(time_range)
-        min_slot = min(slots, key=lambda slot: slot.remain_applicants())
-        remain_applicants = min_slot.remain_applicants()
-        if remain_applicants < applicants:
-            raise BusinessException(
-                "Applicants must be less than or equal to the limit. "
-                + f"limit({remain_applicants}) < applicants({applicants}). range({time_range})",
-                ErrorCode.INVALID_ARGUMENT,
+        delta = (
+            ApplicantsDelta()
+            .add(as_is_range, -as_is_applicants)
+            .add(to_be_range, to_be_applicants)
+        )
+        if not await self.repository.apply_applicants_delta(delta):
+            remain_applicants = await self.repository.min_applicants_in_range(
+                to_be_range
             )
+            self.__raise_limit_over(to_be_range, to_be_applicants, remain_applicants)
+        self.__after_applicants_change(as_is_range, -as_is_applicants)
+        self.__after_applicants_change(to_be_range, to_be_applicants)
+
+    async def __release(self, time_range: TimeRange, applicants: int) -> None:
+        await self.repository.release_applicants(time_range, applicants)
+        self.__after_applicants_change(time_range, -applicants)
+
+    def __after_applicants_change(self, time_range: TimeRange, applicants: int) -> None:
+        start_key, end_key = time_range.start_key(), time_range.end_key()
+
+        def on_commit() -> None:
+            self.ledger.add_applicants(start_key, end_key, applicants)
+            self.page_cache.invalidate(start_key, end_key)
+
+        self.repository.after_commit(on_commit)
+
+    @staticmethod
+    def __raise_limit_over(
+        time_range: TimeRange, applicants: int, remain_applicants: int
+    ) -> None:
+        raise BusinessException(
+            "Applicants must be less than or equal to the limit. "
+            + f"limit({remain_applicants}) < applicants({applicants}). range({time_range})",
+            ErrorCode.INVALID_ARGUMENT,
+        )
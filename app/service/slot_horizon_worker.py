@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from datetime import datetime, time, timedelta
+
+from app.common.database import AsyncSessionLocal
+from app.common.enviroment import env
+from app.service.models.hour_key import to_hour_key, from_hour_key
+from app.service.models.schedule_slot_query import ScheduleSlotQuery
+from app.storage.partition_repository import PartitionRepository
+from app.storage.schedule_slot_repository_factory import schedule_slot_repository
+
+logger = logging.getLogger(__name__)
+
+
+# 예약 가능한 기간의 월 partition 과 schedule_slot row 를 요청 경로 밖에서 미리 생성
+class SlotHorizonWorker:
+    def __init__(self, horizon_days: int, interval_seconds: float):
+        self.horizon_days: int = horizon_days
+        self.interval_seconds: float = interval_seconds
+        self.__task: asyncio.Task | None = None
+
+    def horizon(self) -> tuple[int, int]:
+        first_date = datetime.now().date() + timedelta(
+            days=ScheduleSlotQuery.ALLOWED_START_BEFORE
+        )
+        start_at = datetime.combine(first_date, time())
+        end_at = start_at + timedelta(days=self.horizon_days)
+        return to_hour_key(start_at), to_hour_key(end_at)
+
+    async def run_once(self) -> int:
+        start_key, end_key = self.horizon()
+        async with AsyncSessionLocal() as sess:
+            await self.__maintain_partitions(PartitionRepository(sess), end_key)
+            created = await schedule_slot_repository(sess).create_missing_slots(
+                start_key, end_key
+            )
+            await sess.commit()
+        return created
+
+    # slot row 가 default partition 에 쌓이지 않도록 partition 을 먼저 생성
+    # 지난 partition 분리는 부모 테이블을 잠그므로 운영 명령 app.archive_partitions 로 수행
+    async def __maintain_partitions(
+        self, repository: PartitionRepository, end_key: int
+    ) -> None:
+        created = await repository.ensure_month_partitions(
+            datetime.now(), from_hour_key(end_key)
+        )
+        if created:
+            logger.info("month partitions created: %d", created)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                created = await self.run_once()
+                logger.info("schedule slot horizon materialized. created: %d", created)
+            except Exception:
+                logger.exception("schedule slot horizon materialization failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        self.__task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+
+slot_horizon_worker = SlotHorizonWorker(
+    env.SLOT_HORIZON_DAYS, env.SLOT_HORIZON_INTERVAL_SECONDS
+)
@@ -0,0 +1,33 @@
+from app.common.enviroment import env
+from app.common.metrics import metrics
+from app.common.ttl_lru_cache import TtlLruCache
+from app.service.models.page import ScheduleSlotPage
+
+
+# (start_key, end_key) 로 정렬된 시간 범위별 슬롯 조회 결과 캐시
+class SlotPageCache:
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.cache: TtlLruCache[tuple[int, int], ScheduleSlotPage] = TtlLruCache(
+            max_size, ttl_seconds
+        )
+
+    def get(self, start_key: int, end_key: int) -> ScheduleSlotPage | None:
+        if not self.cache.is_enabled():
+            return None
+        return self.cache.get((start_key, end_key))
+
+    def put(self, start_key: int, end_key: int, page: ScheduleSlotPage) -> None:
+        self.cache.put((start_key, end_key), page)
+
+    # 변경된 시간과 겹치는 범위만 제거
+    def invalidate(self, start_key: int, end_key: int) -> None:
+        self.cache.invalidate(lambda key: key[0] < end_key and start_key < key[1])
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+slot_page_cache = SlotPageCache(
+    env.SLOT_PAGE_CACHE_SIZE, env.SLOT_PAGE_CACHE_TTL_SECONDS
+)
+metrics.register("slot_page_cache", slot_page_cache.cache.stats)
@@ -0,0 +1,204 @@
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Integer, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import select, col
+
+from app.common.statement_cache import named_statement
+from app.service.models.applicants_delta import ApplicantsDelta
+from app.service.models.hour_key import ceil_hour_key
+from app.service.models.page import ScheduleSlotPage
+from app.service.models.time_range import TimeRange
+from app.storage.models.schedule_slot import ScheduleSlot, DEFAULT_MAX_APPLICANTS
+from app.storage.models.schedule_slot_day import (
+    ScheduleSlotDay,
+    HOURS_PER_DAY,
+    to_day_key,
+)
+from app.storage.schedule_slot_repository import ScheduleSlotRepository
+
+_day_in_range = (
+    col(ScheduleSlotDay.day_key) >= bindparam("start_day", type_=Integer),
+    col(ScheduleSlotDay.day_key) < bindparam("end_day", type_=Integer),
+)
+
+FIND_DAYS = named_statement(
+    "schedule_slot_day.find_days",
+    select(ScheduleSlotDay)
+    .where(*_day_in_range)
+    .order_by(col(ScheduleSlotDay.day_key)),
+)
+
+LOCK_DAYS = named_statement(
+    "schedule_slot_day.lock_days",
+    select(ScheduleSlotDay)
+    .where(col(ScheduleSlotDay.day_key).in_(bindparam("day_keys", expanding=True)))
+    .order_by(col(ScheduleSlotDay.day_key))
+    .with_for_update()
+    .execution_options(populate_existing=True),
+)
+
+_day_defaults = (
+    bindparam("max_applicants", DEFAULT_MAX_APPLICANTS, type_=Integer),
+    bindparam("hours_per_day", HOURS_PER_DAY, type_=Integer),
+)
+
+CREATE_MISSING_DAYS = named_statement(
+    "schedule_slot_day.create_missing_days",
+    text(
+        "INSERT INTO schedule_slot_day (day_key, max_applicants, confirmed_applicants)"
+        " SELECT generate_series(:start_day, :end_day - 1),"
+        " array_fill(:max_applicants, ARRAY[:hours_per_day]),"
+        " array_fill(0, ARRAY[:hours_per_day])"
+        " ON CONFLICT (day_key) DO NOTHING"
+    ).bindparams(
+        bindparam("start_day", type_=Integer),
+        bindparam("end_day", type_=Integer),
+        *_day_defaults,
+    ),
+)
+
+# 변경되는 날짜의 row 만 day_key 순서로 만듦
+CREATE_DAYS = named_statement(
+    "schedule_slot_day.create_days",
+    text(
+        "INSERT INTO schedule_slot_day (day_key, max_applicants, confirmed_applicants)"
+        " SELECT day_key,"
+        " array_fill(:max_applicants, ARRAY[:hours_per_day]),"
+        " array_fill(0, ARRAY[:hours_per_day])"
+        " FROM unnest(:day_keys) AS day_key ORDER BY day_key"
+        " ON CONFLICT (day_key) DO NOTHING"
+    ).bindparams(
+        bindparam("day_keys", type_=ARRAY(Integer)),
+        *_day_defaults,
+    ),
+)
+
+# 시간 단위 schedule_slot 의 row 를 day row 로 옮김, 없는 시간은 기본값
+# 이미 있는 day row 는 그 이후의 변경이 반영되어 있으므로 건너뜀
+BACKFILL_DAYS = named_statement(
+    "schedule_slot_day.backfill_days",
+    text(
+        "INSERT INTO schedule_slot_day (day_key, max_applicants, confirmed_applicants)"
+        " SELECT days.day_key,"
+        " array_agg(coalesce(slot.max_applicants, :max_applicants) ORDER BY hours.hour),"
+        " array_agg(coalesce(slot.confirmed_applicants, 0) ORDER BY hours.hour)"
+        " FROM (SELECT DISTINCT hour_key / :hours_per_day AS day_key FROM schedule_slot) days"
+        " CROSS JOIN generate_series(0, :hours_per_day - 1) AS hours(hour)"
+        " LEFT JOIN schedule_slot slot"
+        " ON slot.hour_key = days.day_key * :hours_per_day + hours.hour"
+        " WHERE NOT EXISTS (SELECT 1 FROM schedule_slot_day day"
+        " WHERE day.day_key = days.day_key)"
+        " GROUP BY days.day_key"
+        " ON CONFLICT (day_key) DO NOTHING"
+    ).bindparams(*_day_defaults),
+)
+
+
+def _day_params(start_key: int, end_key: int) -> dict[str, int]:
+    return {"start_day": to_day_key(start_key), "end_day": to_day_key(end_key - 1) + 1}
+
+
+# 하루 한 row(int[24]) 에 시간별 인원을 저장, 밖으로는 시간 단위 ScheduleSlot 으로 보여줌
+# 변경은 범위의 day row 를 잠근 뒤 배열을 고쳐 씀
+class DayScheduleSlotRepository(ScheduleSlotRepository):
+    SLOT_RANGE_SQL: str = (
+        "SELECT day_key, max_applicants, confirmed_applicants FROM schedule_slot_day"
+        " WHERE day_key >= $1 AND day_key < $2"
+    )
+
+    async def find_by_start_at(self, start_at: datetime) -> ScheduleSlot:
+        hour_key = ceil_hour_key(start_at)
+        slots = await self.find_all(hour_key, hour_key + 1)
+        return slots[0] if slots else ScheduleSlot(hour_key=hour_key)
+
+    async def update_confirmed_applicants(
+        self, slot_start: datetime, new_count: int
+    ) -> ScheduleSlot:
+        hour_key = ceil_hour_key(slot_start)
+        days = await self.__lock_days([hour_key])
+        day = days[to_day_key(hour_key)]
+        day.set_confirmed_applicants(hour_key, new_count)
+        await self.sess.flush()
+        return day.slot(hour_key)
+
+    async def min_applicants_in_range(self, time_range: TimeRange) -> int:
+        page = await self.find_range_page(time_range.start_key(), time_range.end_key())
+        return min(
+            max_applicants - confirmed_applicants
+            for _, max_applicants, confirmed_applicants in page.rows()
+        )
+
+    async def reserve_applicants(self, time_range: TimeRange, applicants: int) -> bool:
+        return await self.apply_applicants_delta(
+            ApplicantsDelta().add(time_range, applicants)
+        )
+
+    async def release_applicants(self, time_range: TimeRange, applicants: int) -> None:
+        await self.apply_applicants_delta(
+            ApplicantsDelta().add(time_range, -applicants)
+        )
+
+    # 증가하는 시간만 여유를 검사하고, 모두 가능할 때만 반영
+    async def apply_applicants_delta(self, delta: ApplicantsDelta) -> bool:
+        changes = delta.changes()
+        if not changes:
+            return True
+        days = await self.__lock_days(list(changes))
+        for hour_key, applicants in changes.items():
+            day = days[to_day_key(hour_key)]
+            if applicants > 0 and day.remain_applicants(hour_key) < applicants:
+                return False
+        for hour_key, applicants in changes.items():
+            day = days[to_day_key(hour_key)]
+            confirmed = day.slot(hour_key).confirmed_applicants
+            day.set_confirmed_applicants(hour_key, confirmed + applicants)
+        await self.sess.flush()
+        return True
+
+    async def find_all(self, start_key: int, end_key: int) -> Sequence[ScheduleSlot]:
+        result = await self.sess.execute(FIND_DAYS, _day_params(start_key, end_key))
+        return [
+            day.slot(hour_key)
+            for day in result.scalars().all()
+            for hour_key in self.__hour_keys(day.day_key, start_key, end_key)
+        ]
+
+    async def create_missing_slots(self, start_key: int, end_key: int) -> int:
+        result = await self.sess.execute(
+            CREATE_MISSING_DAYS, _day_params(start_key, end_key)
+        )
+        return result.rowcount
+
+    # SLOT_DAY_ROWS 로 바꾸기 전까지 시간 단위 테이블에 쌓인 인원을 옮김, 반복 실행해도 됨
+    async def backfill_from_hour_slots(self) -> int:
+        result = await self.sess.execute(BACKFILL_DAYS)
+        return result.rowcount
+
+    async def find_range_page(self, start_key: int, end_key: int) -> ScheduleSlotPage:
+        days = await self.fetch_raw(
+            self.SLOT_RANGE_SQL, *_day_params(start_key, end_key).values()
+        )
+        rows = []
+        for day_key, max_applicants, confirmed_applicants in days:
+            first_key = day_key * HOURS_PER_DAY
+            for hour_key in self.__hour_keys(day_key, start_key, end_key):
+                hour = hour_key - first_key
+                rows.append(
+                    (hour_key, max_applicants[hour], confirmed_applicants[hour])
+                )
+        return ScheduleSlotPage.from_rows(start_key, end_key, rows)
+
+    # 시간들이 속한 날짜의 row 만 없으면 만든 뒤 day_key 순서로 잠금
+    async def __lock_days(self, hour_keys: list[int]) -> dict[int, ScheduleSlotDay]:
+        day_keys = sorted({to_day_key(hour_key) for hour_key in hour_keys})
+        await self.sess.execute(CREATE_DAYS, {"day_keys": day_keys})
+        result = await self.sess.execute(LOCK_DAYS, {"day_keys": day_keys})
+        return {day.day_key: day for day in result.scalars().all()}
+
+    # day 의 시간 중 [start_key, end_key) 에 속하는 hour_key
+    @staticmethod
+    def __hour_keys(day_key: int, start_key: int, end_key: int) -> range:
+        first_key = day_key * HOURS_PER_DAY
+        return range(max(first_key, start_key), min(first_key + HOURS_PER_DAY, end_key))
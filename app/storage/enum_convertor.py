@@ -8,6 +8,7 @@ T = TypeVar("T", bound=Enum)
 
 class EnumConvertor(TypeDecorator, Generic[T]):
     impl = String(20)
+    cache_ok = True
 
     def __init__(self, enum_type: Type[T]):
         super().__init__()
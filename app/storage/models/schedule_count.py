@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from sqlalchemy import Column
+from sqlmodel import Field, SQLModel
+
+from app.service.models.schedule_status import ScheduleStatus
+from app.storage.enum_convertor import EnumConvertor
+
+
+class ScheduleCount(SQLModel, table=True):
+    __tablename__ = "schedule_count"
+
+    account_id: UUID = Field(foreign_key="account.id", primary_key=True)
+    status: ScheduleStatus = Field(
+        sa_column=Column(EnumConvertor(ScheduleStatus), primary_key=True)
+    )
+    total: int = Field(default=0, nullable=False)
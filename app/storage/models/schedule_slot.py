@@ -1,21 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from sqlmodel import Field, SQLModel
 
+from app.service.models.hour_key import from_hour_key
+
+DEFAULT_MAX_APPLICANTS: int = 50_000
+
 
 class ScheduleSlot(SQLModel, table=True):
     __tablename__ = "schedule_slot"
 
-    id: int | None = Field(default=None, primary_key=True)
-    slot_start_time: datetime = Field(nullable=False)
-    max_applicants: int = Field(default=50000, nullable=False)
+    hour_key: int = Field(primary_key=True)
+    max_applicants: int = Field(default=DEFAULT_MAX_APPLICANTS, nullable=False)
     confirmed_applicants: int = Field(default=0, nullable=False)
 
     def start_at(self) -> datetime:
-        return self.slot_start_time
+        return from_hour_key(self.hour_key)
 
     def end_at(self) -> datetime:
-        return self.slot_start_time + timedelta(hours=1)
+        return from_hour_key(self.hour_key + 1)
 
     def remain_applicants(self) -> int:
         return self.max_applicants - self.confirmed_applicants
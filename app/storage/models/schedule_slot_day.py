@@ -0,0 +1,43 @@
+from sqlalchemy import Column, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, SQLModel
+
+from app.storage.models.schedule_slot import ScheduleSlot, DEFAULT_MAX_APPLICANTS
+
+HOURS_PER_DAY: int = 24
+
+
+# day_key = hour_key // 24, 하루 24시간의 인원을 배열 한 row 에 저장
+class ScheduleSlotDay(SQLModel, table=True):
+    __tablename__ = "schedule_slot_day"
+
+    day_key: int = Field(primary_key=True)
+    max_applicants: list[int] = Field(
+        default_factory=lambda: [DEFAULT_MAX_APPLICANTS] * HOURS_PER_DAY,
+        sa_column=Column(ARRAY(Integer), nullable=False),
+    )
+    confirmed_applicants: list[int] = Field(
+        default_factory=lambda: [0] * HOURS_PER_DAY,
+        sa_column=Column(ARRAY(Integer), nullable=False),
+    )
+
+    def slot(self, hour_key: int) -> ScheduleSlot:
+        hour = hour_key - self.day_key * HOURS_PER_DAY
+        return ScheduleSlot(
+            hour_key=hour_key,
+            max_applicants=self.max_applicants[hour],
+            confirmed_applicants=self.confirmed_applicants[hour],
+        )
+
+    def remain_applicants(self, hour_key: int) -> int:
+        return self.slot(hour_key).remain_applicants()
+
+    # 배열은 제자리 변경이 감지되지 않으므로 새 배열로 교체
+    def set_confirmed_applicants(self, hour_key: int, confirmed: int) -> None:
+        confirmed_applicants = list(self.confirmed_applicants)
+        confirmed_applicants[hour_key - self.day_key * HOURS_PER_DAY] = confirmed
+        self.confirmed_applicants = confirmed_applicants
+
+
+def to_day_key(hour_key: int) -> int:
+    return hour_key // HOURS_PER_DAY
@@ -0,0 +1,10 @@
+from sqlmodel import Field, SQLModel
+
+
+class ScheduleSlotShard(SQLModel, table=True):
+    __tablename__ = "schedule_slot_shard"
+
+    hour_key: int = Field(primary_key=True)
+    shard: int = Field(primary_key=True)
+    max_applicants: int = Field(nullable=False)
+    confirmed_applicants: int = Field(default=0, nullable=False)
@@ -0,0 +1,126 @@
+import re
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, String, bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.statement_cache import named_statement
+
+# 월 단위 range partition 테이블과 partition key 컬럼, V006 migration 참고
+PARTITIONED_TABLES: dict[str, str] = {
+    "schedule": "start_at",
+    "schedule_slot": "hour_key",
+    "schedule_slot_shard": "hour_key",
+}
+MONTH_PARTITION_PATTERN = re.compile(
+    rf"^({'|'.join(PARTITIONED_TABLES)})_(\d{{4}})(\d{{2}})$"
+)
+ARCHIVED_PREFIX = "archived_"
+# 여러 프로세스의 worker 와 운영 명령이 같은 partition 을 동시에 만들거나 분리하지 않도록 사용
+PARTITION_LOCK_KEY = 20250302
+# DETACH 가 오래 걸리는 조회 뒤에서 기다리며 다른 요청까지 막지 않도록 제한
+DETACH_LOCK_TIMEOUT = "5s"
+
+TRY_PARTITION_LOCK = named_statement(
+    "partition.try_lock",
+    text("SELECT pg_try_advisory_xact_lock(:key)").bindparams(
+        bindparam("key", type_=BigInteger)
+    ),
+)
+PARTITION_LOCK = named_statement(
+    "partition.lock",
+    text("SELECT pg_advisory_xact_lock(:key)").bindparams(
+        bindparam("key", type_=BigInteger)
+    ),
+)
+
+ENSURE_MONTH_PARTITIONS = named_statement(
+    "partition.ensure_month_partitions",
+    text(
+        "SELECT ensure_month_partitions(:parent, :key_column, :from_month, :to_month)"
+    ).bindparams(
+        bindparam("parent", type_=String),
+        bindparam("key_column", type_=String),
+        bindparam("from_month", type_=Date),
+        bindparam("to_month", type_=Date),
+    ),
+)
+
+FIND_PARTITIONS = named_statement(
+    "partition.find_partitions",
+    text(
+        "SELECT child.relname FROM pg_inherits"
+        " JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+        " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+        " WHERE parent.relname = :parent AND child.relkind IN ('r', 'p')"
+    ).bindparams(bindparam("parent", type_=String)),
+)
+
+
+class PartitionRepository:
+    def __init__(self, sess: AsyncSession):
+        self.sess = sess
+
+    # [from_at 의 월, to_at 의 월] partition 을 모든 테이블에 생성
+    # 다른 프로세스가 작업 중이면 건너뛰고 다음 주기에 다시 확인, lock 은 트랜잭션이 끝날 때 해제
+    async def ensure_month_partitions(self, from_at: datetime, to_at: datetime) -> int:
+        locked = await self.sess.execute(
+            TRY_PARTITION_LOCK, {"key": PARTITION_LOCK_KEY}
+        )
+        if not locked.scalar_one():
+            return 0
+        created = 0
+        for parent, key_column in PARTITIONED_TABLES.items():
+            result = await self.sess.execute(
+                ENSURE_MONTH_PARTITIONS,
+                {
+                    "parent": parent,
+                    "key_column": key_column,
+                    "from_month": from_at.date(),
+                    "to_month": to_at.date(),
+                },
+            )
+            created += result.scalar_one()
+        return created
+
+    # before 의 월보다 이전 partition 을 분리해 archived_ 테이블로 남김, 백업 후 삭제는 운영에서 수행
+    # DETACH 는 부모 테이블을 ACCESS EXCLUSIVE 로 잠그므로 운영 명령(app.archive_partitions)에서만 호출
+    async def archive_month_partitions(self, before: datetime) -> list[str]:
+        await self.sess.execute(PARTITION_LOCK, {"key": PARTITION_LOCK_KEY})
+        await self.sess.execute(
+            text(f"SET LOCAL lock_timeout = '{DETACH_LOCK_TIMEOUT}'")
+        )
+        before_month = date(before.year, before.month, 1)
+        archived = []
+        for parent in PARTITIONED_TABLES:
+            result = await self.sess.execute(FIND_PARTITIONS, {"parent": parent})
+            for partition in result.scalars().all():
+                matched = MONTH_PARTITION_PATTERN.match(partition)
+                if matched is None or matched.group(1) != parent:
+                    continue
+                month = date(int(matched.group(2)), int(matched.group(3)), 1)
+                if month >= before_month:
+                    continue
+                await self.__archive(parent, partition)
+                archived.append(partition)
+        return archived
+
+    async def __archive(self, parent: str, partition: str) -> None:
+        if parent == "schedule":
+            # 분리되는 schedule 은 목록 total 에서도 제외
+            await self.sess.execute(
+                text(
+                    "UPDATE schedule_count SET total = schedule_count.total - archived.total"
+                    " FROM (SELECT account_id, status, count(*) AS total"
+                    f" FROM {partition} GROUP BY account_id, status) AS archived"
+                    " WHERE schedule_count.account_id = archived.account_id"
+                    " AND schedule_count.status = archived.status"
+                )
+            )
+        # 이름은 MONTH_PARTITION_PATTERN 으로 검증된 값만 사용
+        await self.sess.execute(
+            text(f"ALTER TABLE {parent} DETACH PARTITION {partition}")
+        )
+        await self.sess.execute(
+            text(f"ALTER TABLE {partition} RENAME TO {ARCHIVED_PREFIX}{partition}")
+        )
@@ -1,10 +1,165 @@
-from sqlmodel import func, select
+import re
+from datetime import datetime
+from functools import cache
+from typing import Any, Sequence, Mapping
+from uuid import UUID
+
+from sqlalchemy import (
+    tuple_,
+    inspect,
+    bindparam,
+    text,
+    Integer,
+    String,
+    literal_column,
+)
+from sqlmodel import func, select, col
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import literal
 
+from app.common.statement_cache import named_statement
 from app.service.models.page import SchedulePage
+from app.service.models.schedule_cursor import ScheduleCursor
 from app.service.models.schedule_query import ScheduleQuery
+from app.service.models.schedule_status import ScheduleStatus
+from app.storage.models.account import Account
 from app.storage.models.schedule import Schedule
+from app.storage.models.schedule_count import ScheduleCount
+
+# 목록 응답에 필요한 컬럼만 account 와 join 해서 한 번에 조회, entity 로 만들지 않음
+_columns = (
+    select(
+        col(Schedule.id),
+        col(Schedule.name),
+        col(Schedule.start_at),
+        col(Schedule.end_at),
+        col(Schedule.applicants),
+        col(Schedule.status),
+        col(Schedule.account_id),
+        col(Account.nickname),
+    )
+    .join(Account, col(Account.id) == col(Schedule.account_id))
+    .order_by(col(Schedule.start_at), col(Schedule.id))
+)
+_list_columns = _columns.limit(bindparam("limit", type_=Integer))
+_after_cursor = tuple_(Schedule.start_at, Schedule.id) > tuple_(
+    bindparam("cursor_start_at", type_=Schedule.__table__.c.start_at.type),
+    bindparam("cursor_id", type_=Integer),
+)
+_offset = bindparam("offset", type_=Integer)
+
+# ScheduleQuery.filters() 의 조건 이름별 where 절
+_filter_conditions = {
+    "account_id": col(Schedule.account_id)
+    == bindparam("account_id", type_=Schedule.__table__.c.account_id.type),
+    "status": col(Schedule.status)
+    == bindparam("status", type_=Schedule.__table__.c.status.type),
+    "start_from": col(Schedule.start_at)
+    >= bindparam("start_from", type_=Schedule.__table__.c.start_at.type),
+    "start_to": col(Schedule.start_at)
+    < bindparam("start_to", type_=Schedule.__table__.c.start_at.type),
+    # V010 의 pg_trgm 인덱스가 있으면 '%name%' 조회에 사용됨
+    "name": col(Schedule.name).ilike(bindparam("name", type_=String)),
+}
+# schedule 을 읽지 않고 schedule_count 로 total 을 구할 수 있는 조건
+_countable_filters = {
+    "account_id": col(ScheduleCount.account_id)
+    == bindparam("account_id", type_=ScheduleCount.__table__.c.account_id.type),
+    "status": col(ScheduleCount.status)
+    == bindparam("status", type_=ScheduleCount.__table__.c.status.type),
+}
+
+
+def _where(filters: tuple[str, ...]) -> list:
+    return [_filter_conditions[name] for name in filters]
+
+
+def _statement_name(name: str, filters: tuple[str, ...]) -> str:
+    return f"{name}[{','.join(filters)}]" if filters else name
+
+
+# 조건 조합별로 처음 한 번 만들어 재사용
+@cache
+def list_by_offset(filters: tuple[str, ...]):
+    return named_statement(
+        _statement_name("schedule.list_by_offset", filters),
+        _list_columns.where(*_where(filters)).offset(_offset),
+    )
+
+
+@cache
+def list_by_cursor(filters: tuple[str, ...], after_cursor: bool):
+    if after_cursor:
+        return named_statement(
+            _statement_name("schedule.list_after_cursor", filters),
+            _list_columns.where(*_where(filters), _after_cursor),
+        )
+    return named_statement(
+        _statement_name("schedule.list_first", filters),
+        _list_columns.where(*_where(filters)),
+    )
+
+
+@cache
+def count_total(filters: tuple[str, ...]):
+    if set(filters) <= _countable_filters.keys():
+        # schedule 테이블 대신 유지되는 계정, 상태별 수를 합산
+        return named_statement(
+            _statement_name("schedule_count.sum", filters),
+            select(func.coalesce(func.sum(ScheduleCount.total), 0)).where(
+                *[_countable_filters[name] for name in filters]
+            ),
+        )
+    return named_statement(
+        _statement_name("schedule.count", filters),
+        select(func.count()).select_from(Schedule).where(*_where(filters)),
+    )
+
+
+# tsrange(start_at, end_at, '[)') 식의 GiST 부분 인덱스로 겹치는 CONFIRMED schedule 조회
+# 인덱스 식, 조건과 맞도록 범위 형식과 status 는 파라미터가 아닌 상수, start_at 조건은 월 partition pruning 용
+_time_range = func.tsrange(Schedule.start_at, Schedule.end_at, literal_column("'[)'"))
+_range_start = bindparam("range_start", type_=Schedule.__table__.c.start_at.type)
+_range_end = bindparam("range_end", type_=Schedule.__table__.c.start_at.type)
+LIST_CONFIRMED_OVERLAPPING = named_statement(
+    "schedule.list_confirmed_overlapping",
+    _columns.where(
+        col(Schedule.status) == literal_column(f"'{ScheduleStatus.CONFIRMED.value}'"),
+        col(Schedule.start_at) < _range_end,
+        _time_range.op("&&")(func.tsrange(_range_start, _range_end, "[)")),
+    ),
+)
+
+# postgresql INSERT .. ON CONFLICT 구문은 compiled cache 대상이 아니므로 text 로 작성
+ADD_COUNT = named_statement(
+    "schedule_count.add",
+    text(
+        "INSERT INTO schedule_count (account_id, status, total)"
+        " VALUES (:account_id, :status, :amount)"
+        " ON CONFLICT (account_id, status)"
+        " DO UPDATE SET total = schedule_count.total + excluded.total"
+    ).bindparams(
+        bindparam("account_id", type_=ScheduleCount.__table__.c.account_id.type),
+        bindparam("status", type_=ScheduleCount.__table__.c.status.type),
+        bindparam("amount", type_=Integer),
+    ),
+)
+
+# 한 문장의 스냅샷에서 schedule 수와 schedule_count 의 차이를 구해 덧셈으로 반영
+# 서버는 두 테이블을 같은 트랜잭션에서 갱신하므로 실행 중인 쓰기와 겹쳐도 차이만 바로잡힘
+RECOUNT = named_statement(
+    "schedule_count.recount",
+    text(
+        "INSERT INTO schedule_count (account_id, status, total)"
+        " SELECT account_id, status,"
+        " coalesce(actual.total, 0) - coalesce(counted.total, 0)"
+        " FROM (SELECT account_id, status, count(*) AS total FROM schedule"
+        " GROUP BY account_id, status) actual"
+        " FULL JOIN schedule_count counted USING (account_id, status)"
+        " WHERE coalesce(actual.total, 0) <> coalesce(counted.total, 0)"
+        " ON CONFLICT (account_id, status)"
+        " DO UPDATE SET total = schedule_count.total + excluded.total"
+    ),
+)
 
 
 class ScheduleRepository:
@@ -12,34 +167,96 @@ class ScheduleRepository:
         self.sess = sess
 
     async def save(self, schedule: Schedule) -> Schedule:
+        state = inspect(schedule)
+        is_new = state.transient or state.pending
+        status_history = state.attrs.status.history
         self.sess.add(schedule)
         await self.sess.flush()
+
+        if is_new:
+            await self.__add_count(schedule.account_id, schedule.status, 1)
+        elif status_history.deleted:
+            await self.__add_count(schedule.account_id, status_history.deleted[0], -1)
+            await self.__add_count(schedule.account_id, schedule.status, 1)
         return schedule
 
+    async def refresh(self, schedule: Schedule) -> None:
+        await self.sess.refresh(schedule)
+
     async def find_by_id(self, schedule_id: int) -> Schedule | None:
         return await self.sess.get(Schedule, schedule_id)
 
     async def find_all(self, query: ScheduleQuery) -> SchedulePage:
-        filter_account = (
-            Schedule.account_id == query.account_id
-            if query.has_account_filter()
-            else literal(True)
-        )
+        if query.is_keyset():
+            return await self.__find_after_cursor(query)
 
-        list_query = (
-            select(Schedule)
-            .filter(filter_account)
-            .offset(query.offset())
-            .limit(query.limit())
+        filters = self.__filter_params(query)
+        result = await self.sess.execute(
+            list_by_offset(tuple(filters)),
+            {**filters, "offset": query.offset(), "limit": query.limit()},
+        )
+        return SchedulePage(
+            total=await self.__count(query) if query.include_total else None,
+            page_size=query.page_size,
+            page_number=query.page_number,
+            items=result.mappings().all(),
         )
-        schedules = (await self.sess.exec(list_query)).all()
 
-        total_query = select(func.count()).select_from(Schedule).filter(filter_account)
-        total = (await self.sess.exec(total_query)).one()
+    async def find_confirmed_overlapping(
+        self, start_at: datetime, end_at: datetime
+    ) -> Sequence[Mapping[str, Any]]:
+        result = await self.sess.execute(
+            LIST_CONFIRMED_OVERLAPPING, {"range_start": start_at, "range_end": end_at}
+        )
+        return result.mappings().all()
 
+    # (start_at, id) 인덱스를 cursor 위치부터 읽어 페이지 깊이와 상관없이 같은 비용
+    async def __find_after_cursor(self, query: ScheduleQuery) -> SchedulePage:
+        filters = self.__filter_params(query)
+        params = {**filters, "limit": query.limit() + 1}
+        if query.cursor:
+            params["cursor_start_at"] = query.cursor.start_at
+            params["cursor_id"] = query.cursor.id
+        result = await self.sess.execute(
+            list_by_cursor(tuple(filters), query.cursor is not None), params
+        )
+        schedules = result.mappings().all()
+        items = schedules[: query.limit()]
+        next_cursor = (
+            ScheduleCursor(items[-1]["start_at"], items[-1]["id"]).encode()
+            if len(schedules) > query.limit()
+            else None
+        )
         return SchedulePage(
-            total=total,
+            total=await self.__count(query) if query.include_total else None,
             page_size=query.page_size,
             page_number=query.page_number,
-            items=schedules,
+            items=items,
+            next_cursor=next_cursor,
+        )
+
+    # schedule_count 를 갱신하지 않는 이전 버전 서버가 남긴 차이를 바로잡음, 반복 실행해도 됨
+    async def recount(self) -> int:
+        result = await self.sess.execute(RECOUNT)
+        return result.rowcount
+
+    async def __count(self, query: ScheduleQuery) -> int:
+        filters = self.__filter_params(query)
+        result = await self.sess.execute(count_total(tuple(filters)), filters)
+        return result.scalar_one()
+
+    async def __add_count(
+        self, account_id: UUID, status: ScheduleStatus, amount: int
+    ) -> None:
+        await self.sess.execute(
+            ADD_COUNT, {"account_id": account_id, "status": status, "amount": amount}
         )
+
+    @staticmethod
+    def __filter_params(query: ScheduleQuery) -> dict[str, Any]:
+        filters = query.filters()
+        if "name" in filters:
+            # LIKE 특수문자는 문자 그대로 검색
+            escaped = re.sub(r"([\\%_])", r"\\\1", filters["name"])
+            filters["name"] = f"%{escaped}%"
+        return filters
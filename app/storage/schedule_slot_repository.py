@@ -1,140 +1,307 @@
-from datetime import datetime, timedelta
-from typing import Sequence
+from datetime import datetime
+from typing import Sequence, Callable, Any
 
+from sqlalchemy import Integer, cast, or_, and_, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, col, and_, update
+from sqlmodel import select, col, update, func
 
+from app.common.database import after_commit, on_close
+from app.common.exceptions import InternalServerException
+from app.common.statement_cache import named_statement
+from app.service.models.applicants_delta import ApplicantsDelta
+from app.service.models.hour_key import ceil_hour_key
 from app.service.models.page import ScheduleSlotPage
 from app.service.models.schedule_slot_query import ScheduleSlotQuery
 from app.service.models.time_range import TimeRange
-from app.storage.models.schedule_slot import ScheduleSlot
+from app.storage.models.schedule_slot import ScheduleSlot, DEFAULT_MAX_APPLICANTS
+
+
+# [start_key, end_key) 시간 범위 조건
+def hour_key_in_range(hour_key):
+    return and_(
+        hour_key >= bindparam("start_key", type_=Integer),
+        hour_key < bindparam("end_key", type_=Integer),
+    )
+
+
+def range_params(time_range: TimeRange) -> dict[str, int]:
+    return {"start_key": time_range.start_key(), "end_key": time_range.end_key()}
+
+
+# (hour_key, applicants) 변화량 배열을 테이블로 펼침, 파라미터는 changes_params 로 전달
+def unnest_changes(name: str):
+    return (
+        func.unnest(
+            cast(bindparam("hour_keys", type_=ARRAY(Integer)), ARRAY(Integer)),
+            cast(bindparam("deltas", type_=ARRAY(Integer)), ARRAY(Integer)),
+        )
+        .table_valued("hour_key", "applicants")
+        .render_derived(name=name)
+    )
+
+
+def changes_params(changes: dict[int, int]) -> dict[str, Any]:
+    return {"hour_keys": list(changes.keys()), "deltas": list(changes.values())}
+
+
+# ORM insert/update 에 파라미터 dict 를 넘기면 bulk 모드가 되므로 DML 은 Core 테이블 기준
+_slot = ScheduleSlot.__table__
+_room_slot = _slot.alias("room_slot")
+
+# postgresql INSERT .. ON CONFLICT 구문은 compiled cache 대상이 아니므로 text 로 작성
+UPSERT_CONFIRMED_APPLICANTS = named_statement(
+    "schedule_slot.upsert_confirmed_applicants",
+    select(ScheduleSlot)
+    .from_statement(
+        text(
+            "INSERT INTO schedule_slot (hour_key, confirmed_applicants)"
+            " VALUES (:hour_key, :confirmed_applicants)"
+            " ON CONFLICT (hour_key)"
+            " DO UPDATE SET confirmed_applicants = excluded.confirmed_applicants"
+            " RETURNING hour_key, max_applicants, confirmed_applicants"
+        )
+        .bindparams(
+            bindparam("hour_key", type_=Integer),
+            bindparam("confirmed_applicants", type_=Integer),
+        )
+        .columns(*_slot.c)
+    )
+    .execution_options(populate_existing=True),
+)
+
+MIN_REMAIN_IN_RANGE = named_statement(
+    "schedule_slot.min_remain_in_range",
+    select(
+        func.min(_slot.c.max_applicants - _slot.c.confirmed_applicants),
+        func.count(),
+    ).where(hour_key_in_range(_slot.c.hour_key)),
+)
+
+RELEASE_APPLICANTS = named_statement(
+    "schedule_slot.release_applicants",
+    update(_slot)
+    .where(hour_key_in_range(_slot.c.hour_key))
+    .values(
+        confirmed_applicants=_slot.c.confirmed_applicants
+        - bindparam("applicants", type_=Integer)
+    ),
+)
+
+FIND_ALL_IN_RANGE = named_statement(
+    "schedule_slot.find_all_in_range",
+    select(ScheduleSlot)
+    .where(hour_key_in_range(col(ScheduleSlot.hour_key)))
+    .order_by(col(ScheduleSlot.hour_key)),
+)
+
+CREATE_MISSING_SLOTS = named_statement(
+    "schedule_slot.create_missing_slots",
+    text(
+        "INSERT INTO schedule_slot (hour_key)"
+        " SELECT generate_series(:start_key, :end_key - 1)"
+        " ON CONFLICT (hour_key) DO NOTHING"
+    ).bindparams(
+        bindparam("start_key", type_=Integer), bindparam("end_key", type_=Integer)
+    ),
+)
+
+# 범위의 모든 시간이 존재하고 여유가 있을 때만 전체를 증가시킴
+# READ COMMITTED 에서 다른 트랜잭션의 커밋을 기다린 row 는 조건을 다시 검사하지만 count 부분 질의는 다시 실행되지 않아
+# 일부 시간만 증가될 수 있음, 반환된 row 수가 시간 수보다 적으면 반드시 롤백해야 함
+_applicants = bindparam("applicants", type_=Integer)
+INCREASE_APPLICANTS = named_statement(
+    "schedule_slot.increase_applicants",
+    update(_slot)
+    .where(
+        hour_key_in_range(_slot.c.hour_key),
+        _slot.c.confirmed_applicants + _applicants <= _slot.c.max_applicants,
+        select(func.count())
+        .where(
+            hour_key_in_range(_room_slot.c.hour_key),
+            _room_slot.c.confirmed_applicants + _applicants
+            <= _room_slot.c.max_applicants,
+        )
+        .scalar_subquery()
+        == bindparam("hours", type_=Integer),
+    )
+    .values(confirmed_applicants=_slot.c.confirmed_applicants + _applicants)
+    .returning(_slot.c.hour_key),
+)
+
+# 증가하는 시간만 여유를 검사하고, 모든 변화를 한 문장으로 반영
+# INCREASE_APPLICANTS 와 같이 일부 시간만 반영될 수 있으므로 반환된 row 수가 변화 수보다 적으면 롤백해야 함
+_changed = unnest_changes("changed")
+_increased = unnest_changes("increased")
+APPLY_CHANGES = named_statement(
+    "schedule_slot.apply_changes",
+    update(_slot)
+    .where(
+        _slot.c.hour_key == _changed.c.hour_key,
+        or_(
+            _changed.c.applicants < 0,
+            _slot.c.confirmed_applicants + _changed.c.applicants
+            <= _slot.c.max_applicants,
+        ),
+        select(func.count())
+        .select_from(_increased)
+        .join(_room_slot, _room_slot.c.hour_key == _increased.c.hour_key)
+        .where(
+            _increased.c.applicants > 0,
+            _room_slot.c.confirmed_applicants + _increased.c.applicants
+            <= _room_slot.c.max_applicants,
+        )
+        .scalar_subquery()
+        == bindparam("increased_count", type_=Integer),
+    )
+    .values(confirmed_applicants=_slot.c.confirmed_applicants + _changed.c.applicants)
+    .returning(_slot.c.hour_key),
+)
 
 
 class ScheduleSlotRepository:
+    SLOT_RANGE_SQL: str = (
+        "SELECT hour_key, max_applicants, confirmed_applicants FROM schedule_slot"
+        " WHERE hour_key >= $1 AND hour_key < $2"
+    )
+
     def __init__(self, sess: AsyncSession):
         self.sess = sess
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        after_commit(self.sess, callback)
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        on_close(self.sess, callback)
+
+    # 조회만 한 트랜잭션을 끝내 커넥션을 pool 에 돌려줌
+    async def end_read_transaction(self) -> None:
+        await self.sess.commit()
+
     async def find_by_start_at(self, start_at: datetime) -> ScheduleSlot:
-        slot_start = self.align_hour(start_at)
-        return await self._get_or_create_slot(slot_start)
+        hour_key = ceil_hour_key(start_at)
+        schedule_slot = await self.sess.get(ScheduleSlot, hour_key)
+        return (
+            ScheduleSlot(hour_key=hour_key) if schedule_slot is None else schedule_slot
+        )
 
     async def update_confirmed_applicants(
         self, slot_start: datetime, new_count: int
     ) -> ScheduleSlot:
-        slot = await self._get_or_create_slot(slot_start)
-        slot.confirmed_applicants = new_count
-
-        self.sess.add(slot)
-        await self.sess.flush()
-        return slot
-
-    async def find_schedules_by_range_with_lock(
-        self, time_range: TimeRange
-    ) -> Sequence[ScheduleSlot]:
-        await self.__missing_create_slot(time_range.start_at(), time_range.end_at())
-        query = (
-            select(ScheduleSlot)
-            .where(
-                and_(
-                    ScheduleSlot.slot_start_time >= time_range.start_at(),
-                    ScheduleSlot.slot_start_time <= time_range.end_at(),
-                )
-            )
-            .order_by(ScheduleSlot.slot_start_time)
-            .with_for_update()
+        result = await self.sess.execute(
+            UPSERT_CONFIRMED_APPLICANTS,
+            {
+                "hour_key": ceil_hour_key(slot_start),
+                "confirmed_applicants": new_count,
+            },
         )
-
-        result = await self.sess.execute(query)
-        return result.scalars().all()
+        return result.scalar_one()
 
     async def min_applicants_in_range(self, time_range: TimeRange) -> int:
-        await self.__missing_create_slot(time_range.start_at(), time_range.end_at())
-        query = (
-            select(ScheduleSlot)
-            .where(
-                and_(
-                    ScheduleSlot.slot_start_time >= time_range.start_at(),
-                    ScheduleSlot.slot_start_time <= time_range.end_at(),
-                )
-            )
-            .order_by((ScheduleSlot.max_applicants - ScheduleSlot.confirmed_applicants))
-            .limit(1)
-        )
+        result = await self.sess.execute(MIN_REMAIN_IN_RANGE, range_params(time_range))
+        min_remain, exist_count = result.one()
+        return self.min_remain_with_default(min_remain, exist_count, time_range)
 
-        result = await self.sess.execute(query)
-        min_slot = result.scalars().first()
-        return min_slot.max_applicants - min_slot.confirmed_applicants
-
-    async def add_applicants(self, time_range: TimeRange, applicants: int) -> None:
-        await self.__missing_create_slot(time_range.start_at(), time_range.end_at())
-        stmt = (
-            update(ScheduleSlot)
-            .where(
-                and_(
-                    ScheduleSlot.slot_start_time >= time_range.start_at(),
-                    ScheduleSlot.slot_start_time <= time_range.end_at(),
-                )
-            )
-            .values(confirmed_applicants=ScheduleSlot.confirmed_applicants + applicants)
-        )
-        await self.sess.execute(stmt)
+    async def reserve_applicants(self, time_range: TimeRange, applicants: int) -> bool:
+        if await self.__increase_applicants(time_range, applicants):
+            return True
+        # 미리 생성되지 않은 시간이 있었던 경우에만 생성 후 한번 더 시도
+        if await self.create_missing_slots(
+            time_range.start_key(), time_range.end_key()
+        ):
+            return await self.__increase_applicants(time_range, applicants)
+        return False
 
-    async def _get_or_create_slot(self, slot_start: datetime) -> ScheduleSlot:
-        stmt = select(ScheduleSlot).where(ScheduleSlot.slot_start_time == slot_start)
-        result = await self.sess.execute(stmt)
-        schedule_slot: ScheduleSlot | None = result.scalar_one_or_none()
+    async def apply_applicants_delta(self, delta: ApplicantsDelta) -> bool:
+        if await self.__apply_changes(delta):
+            return True
+        increased_keys = delta.increased_keys()
+        if increased_keys and await self.create_missing_slots(
+            increased_keys[0], increased_keys[-1] + 1
+        ):
+            return await self.__apply_changes(delta)
+        return False
 
-        if schedule_slot is None:
-            schedule_slot = ScheduleSlot(slot_start_time=slot_start)
-            self.sess.add(schedule_slot)
-            await self.sess.flush()
-        return schedule_slot
+    async def release_applicants(self, time_range: TimeRange, applicants: int) -> None:
+        await self.sess.execute(
+            RELEASE_APPLICANTS, {**range_params(time_range), "applicants": applicants}
+        )
 
     async def find_page(self, query: ScheduleSlotQuery) -> ScheduleSlotPage:
-        await self.__missing_create_slot(query.start_at, query.end_at)
-        schedule_slots = await self.__find_all(query.start_at, query.end_at)
-        return ScheduleSlotPage(items=schedule_slots)
-
-    async def __missing_create_slot(self, start_at: datetime, end_at: datetime) -> None:
-        exist_slots = await self.__find_all(start_at, end_at)
-        require_times = self.missing_slot(start_at, end_at, exist_slots)
-        await self.__create_all(require_times)
-
-    async def __find_all(
-        self, start_at: datetime, end_at: datetime
-    ) -> Sequence[ScheduleSlot]:
-        stmt = (
-            select(ScheduleSlot)
-            .where(
-                ScheduleSlot.slot_start_time >= start_at,
-                ScheduleSlot.slot_start_time < end_at,
-            )
-            .order_by(col(ScheduleSlot.slot_start_time))
+        return await self.find_range_page(query.start_key(), query.end_key())
+
+    async def find_range_page(self, start_key: int, end_key: int) -> ScheduleSlotPage:
+        rows = await self.fetch_raw(self.SLOT_RANGE_SQL, start_key, end_key)
+        return ScheduleSlotPage.from_rows(start_key, end_key, rows)
+
+    # ORM 을 거치지 않고 세션 커넥션의 asyncpg prepared statement 로 바로 조회
+    # asyncpg 로 바로 보내면 SQLAlchemy 가 첫 문장에서 보내는 BEGIN 을 거치지 않으므로
+    # 트랜잭션이 시작되지 않았으면 세션으로 빈 문장을 먼저 실행해 같은 트랜잭션 안에서 조회
+    async def fetch_raw(self, sql: str, *args) -> list[tuple]:
+        connection = await self.sess.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not driver_connection.is_in_transaction():
+            await connection.exec_driver_sql("SELECT 1")
+        return await driver_connection.fetch(sql, *args)
+
+    async def find_all(self, start_key: int, end_key: int) -> Sequence[ScheduleSlot]:
+        result = await self.sess.execute(
+            FIND_ALL_IN_RANGE, {"start_key": start_key, "end_key": end_key}
         )
-        result = await self.sess.execute(stmt)
         return result.scalars().all()
 
-    async def __create_all(self, start_times: list[datetime]) -> None:
-        if start_times:
-            slots_to_create = [
-                ScheduleSlot(slot_start_time=slot_time) for slot_time in start_times
-            ]
-            self.sess.add_all(slots_to_create)
-            await self.sess.flush()
-
-    def missing_slot(
-        self, start_at: datetime, end_at: datetime, exists: Sequence[ScheduleSlot]
-    ):
-        existing_slots = {s.slot_start_time for s in exists}
-        missing_slot = []
-        current_time = self.align_hour(start_at)
-        while current_time < end_at:
-            if current_time not in existing_slots:
-                missing_slot.append(current_time)
-            current_time += timedelta(hours=1)
-        return missing_slot
-
-    def align_hour(self, d: datetime) -> datetime:
-        if d.minute == 0 and d.second == 0 and d.microsecond == 0:
-            return d
-        return (d + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+    async def create_missing_slots(self, start_key: int, end_key: int) -> int:
+        result = await self.sess.execute(
+            CREATE_MISSING_SLOTS, {"start_key": start_key, "end_key": end_key}
+        )
+        return result.rowcount
+
+    async def __increase_applicants(
+        self, time_range: TimeRange, applicants: int
+    ) -> bool:
+        result = await self.sess.execute(
+            INCREASE_APPLICANTS,
+            {
+                **range_params(time_range),
+                "applicants": applicants,
+                "hours": time_range.hours(),
+            },
+        )
+        return self.__all_or_nothing(len(result.all()), time_range.hours())
+
+    async def __apply_changes(self, delta: ApplicantsDelta) -> bool:
+        changes = delta.changes()
+        if not changes:
+            return True
+        result = await self.sess.execute(
+            APPLY_CHANGES,
+            {
+                **changes_params(changes),
+                "increased_count": len(delta.increased_keys()),
+            },
+        )
+        return self.__all_or_nothing(len(result.all()), len(changes))
+
+    # 일부만 반영된 채로 False 를 돌려주면 호출한 쪽이 커밋하거나 다시 시도해 인원이 어긋나므로 예외로 롤백
+    @staticmethod
+    def __all_or_nothing(updated: int, expected: int) -> bool:
+        if 0 < updated < expected:
+            raise InternalServerException(
+                "schedule slot was partially updated by a concurrent change. "
+                + f"updated({updated}) < expected({expected})"
+            )
+        return updated == expected
+
+    @staticmethod
+    def min_remain_with_default(
+        min_remain: int | None, exist_count: int, time_range: TimeRange
+    ) -> int:
+        if exist_count < time_range.hours():
+            # row 가 없는 시간은 기본값(max_applicants, 0명 확정) 슬롯으로 취급
+            return (
+                min(min_remain, DEFAULT_MAX_APPLICANTS)
+                if exist_count
+                else DEFAULT_MAX_APPLICANTS
+            )
+        return min_remain
@@ -0,0 +1,17 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.enviroment import env
+from app.storage.day_schedule_slot_repository import DayScheduleSlotRepository
+from app.storage.schedule_slot_repository import ScheduleSlotRepository
+from app.storage.sharded_schedule_slot_repository import (
+    ShardedScheduleSlotRepository,
+)
+
+
+# 설정에 따라 slot 저장 방식을 선택
+def schedule_slot_repository(sess: AsyncSession) -> ScheduleSlotRepository:
+    if env.SLOT_DAY_ROWS:
+        return DayScheduleSlotRepository(sess)
+    if env.SLOT_SHARD_COUNT > 0:
+        return ShardedScheduleSlotRepository(sess, env.SLOT_SHARD_COUNT)
+    return ScheduleSlotRepository(sess)
@@ -0,0 +1,255 @@
+import random
+from collections import defaultdict
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import and_, or_, bindparam, Integer, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select, col, update, func
+
+from app.common.statement_cache import named_statement
+from app.service.models.applicants_delta import ApplicantsDelta
+from app.service.models.hour_key import ceil_hour_key
+from app.service.models.time_range import TimeRange
+from app.storage.models.schedule_slot import ScheduleSlot, DEFAULT_MAX_APPLICANTS
+from app.storage.models.schedule_slot_shard import ScheduleSlotShard
+from app.storage.schedule_slot_repository import (
+    ScheduleSlotRepository,
+    hour_key_in_range,
+    range_params,
+    unnest_changes,
+    changes_params,
+)
+
+_shard = ScheduleSlotShard.__table__
+_candidate = _shard.alias("candidate")
+
+
+def _has_room(shard, applicants):
+    return or_(
+        and_(applicants < 0, shard.c.confirmed_applicants + applicants >= 0),
+        and_(
+            applicants > 0,
+            shard.c.confirmed_applicants + applicants <= shard.c.max_applicants,
+        ),
+    )
+
+
+_sum_by_hour = (
+    select(
+        _shard.c.hour_key,
+        func.sum(_shard.c.max_applicants).label("max_applicants"),
+        func.sum(_shard.c.confirmed_applicants).label("confirmed_applicants"),
+    )
+    .where(hour_key_in_range(_shard.c.hour_key))
+    .group_by(_shard.c.hour_key)
+)
+SUM_BY_HOUR = named_statement(
+    "schedule_slot_shard.sum_by_hour", _sum_by_hour.order_by(_shard.c.hour_key)
+)
+
+_slots = _sum_by_hour.subquery()
+MIN_REMAIN_IN_RANGE = named_statement(
+    "schedule_slot_shard.min_remain_in_range",
+    select(
+        func.min(_slots.c.max_applicants - _slots.c.confirmed_applicants),
+        func.count(),
+    ).select_from(_slots),
+)
+
+# 기본 max_applicants 를 shard 수로 나누고 나머지는 앞 shard 부터 1명씩
+CREATE_MISSING_SHARDS = named_statement(
+    "schedule_slot_shard.create_missing_shards",
+    text(
+        "INSERT INTO schedule_slot_shard (hour_key, shard, max_applicants)"
+        " SELECT hours.hour_key, shards.shard,"
+        " :quotient + CASE WHEN shards.shard < :remainder THEN 1 ELSE 0 END"
+        " FROM generate_series(:start_key, :end_key - 1) AS hours(hour_key)"
+        " CROSS JOIN generate_series(0, :shard_count - 1) AS shards(shard)"
+        " ON CONFLICT (hour_key, shard) DO NOTHING"
+    ).bindparams(
+        *[
+            bindparam(name, type_=Integer)
+            for name in ["quotient", "remainder", "start_key", "end_key", "shard_count"]
+        ]
+    ),
+)
+
+# 시간마다 여유가 있는 shard 하나를 임의의 시작 위치부터 골라 한 문장으로 반영
+_changed = unnest_changes("changed")
+_picked = (
+    select(_candidate.c.hour_key, _candidate.c.shard, _changed.c.applicants)
+    .select_from(_candidate)
+    .join(_changed, _changed.c.hour_key == _candidate.c.hour_key)
+    .where(_has_room(_candidate, _changed.c.applicants))
+    .distinct(_candidate.c.hour_key)
+    .order_by(
+        _candidate.c.hour_key,
+        (_candidate.c.shard + bindparam("offset", type_=Integer))
+        % bindparam("shard_count", type_=Integer),
+    )
+    .cte("picked")
+)
+APPLY_TO_ONE_SHARD = named_statement(
+    "schedule_slot_shard.apply_to_one_shard",
+    update(_shard)
+    .where(
+        _shard.c.hour_key == _picked.c.hour_key,
+        _shard.c.shard == _picked.c.shard,
+        _has_room(_shard, _picked.c.applicants),
+        select(func.count()).select_from(_picked).scalar_subquery()
+        == bindparam("changed_count", type_=Integer),
+    )
+    .values(confirmed_applicants=_shard.c.confirmed_applicants + _picked.c.applicants)
+    .returning(_shard.c.hour_key),
+)
+
+LOCK_SHARDS = named_statement(
+    "schedule_slot_shard.lock_shards",
+    select(ScheduleSlotShard)
+    .where(col(ScheduleSlotShard.hour_key).in_(bindparam("hour_keys", expanding=True)))
+    .order_by(col(ScheduleSlotShard.hour_key), col(ScheduleSlotShard.shard))
+    .with_for_update()
+    .execution_options(populate_existing=True),
+)
+
+
+# 한 시간의 confirmed_applicants 를 shard row 로 나눠 저장, 조회는 shard 합계
+class ShardedScheduleSlotRepository(ScheduleSlotRepository):
+    SLOT_RANGE_SQL: str = (
+        "SELECT hour_key, sum(max_applicants), sum(confirmed_applicants)"
+        " FROM schedule_slot_shard WHERE hour_key >= $1 AND hour_key < $2"
+        " GROUP BY hour_key"
+    )
+
+    def __init__(self, sess: AsyncSession, shard_count: int):
+        super().__init__(sess)
+        self.shard_count: int = shard_count
+
+    async def find_by_start_at(self, start_at: datetime) -> ScheduleSlot:
+        hour_key = ceil_hour_key(start_at)
+        slots = await self.find_all(hour_key, hour_key + 1)
+        return slots[0] if slots else ScheduleSlot(hour_key=hour_key)
+
+    async def update_confirmed_applicants(
+        self, slot_start: datetime, new_count: int
+    ) -> ScheduleSlot:
+        hour_key = ceil_hour_key(slot_start)
+        await self.create_missing_slots(hour_key, hour_key + 1)
+        shards = await self.__lock_shards([hour_key])
+        for shard in shards:
+            shard.confirmed_applicants = 0
+        self.__distribute(shards, new_count)
+        await self.sess.flush()
+        return self.__sum_shards(hour_key, shards)
+
+    async def min_applicants_in_range(self, time_range: TimeRange) -> int:
+        result = await self.sess.execute(MIN_REMAIN_IN_RANGE, range_params(time_range))
+        min_remain, exist_count = result.one()
+        return self.min_remain_with_default(min_remain, exist_count, time_range)
+
+    async def reserve_applicants(self, time_range: TimeRange, applicants: int) -> bool:
+        return await self.apply_applicants_delta(
+            ApplicantsDelta().add(time_range, applicants)
+        )
+
+    async def release_applicants(self, time_range: TimeRange, applicants: int) -> None:
+        await self.apply_applicants_delta(
+            ApplicantsDelta().add(time_range, -applicants)
+        )
+
+    async def apply_applicants_delta(self, delta: ApplicantsDelta) -> bool:
+        changes = delta.changes()
+        if not changes:
+            return True
+        savepoint = await self.sess.begin_nested()
+        if await self.__apply_to_one_shard(changes):
+            await savepoint.commit()
+            return True
+        await savepoint.rollback()
+        # 한 shard 에 담을 수 없거나 경합으로 실패하면 시간의 shard 를 모두 잠그고 나눠 반영
+        await self.create_missing_slots(min(changes), max(changes) + 1)
+        return await self.__apply_across_shards(changes)
+
+    async def find_all(self, start_key: int, end_key: int) -> Sequence[ScheduleSlot]:
+        result = await self.sess.execute(
+            SUM_BY_HOUR, {"start_key": start_key, "end_key": end_key}
+        )
+        return [
+            ScheduleSlot(
+                hour_key=hour_key,
+                max_applicants=max_applicants,
+                confirmed_applicants=confirmed_applicants,
+            )
+            for hour_key, max_applicants, confirmed_applicants in result.all()
+        ]
+
+    async def create_missing_slots(self, start_key: int, end_key: int) -> int:
+        quotient, remainder = divmod(DEFAULT_MAX_APPLICANTS, self.shard_count)
+        result = await self.sess.execute(
+            CREATE_MISSING_SHARDS,
+            {
+                "quotient": quotient,
+                "remainder": remainder,
+                "start_key": start_key,
+                "end_key": end_key,
+                "shard_count": self.shard_count,
+            },
+        )
+        return result.rowcount
+
+    async def __apply_to_one_shard(self, changes: dict[int, int]) -> bool:
+        result = await self.sess.execute(
+            APPLY_TO_ONE_SHARD,
+            {
+                **changes_params(changes),
+                "offset": random.randrange(self.shard_count),
+                "shard_count": self.shard_count,
+                "changed_count": len(changes),
+            },
+        )
+        return len(result.all()) == len(changes)
+
+    async def __apply_across_shards(self, changes: dict[int, int]) -> bool:
+        shards_by_hour: dict[int, list[ScheduleSlotShard]] = defaultdict(list)
+        for shard in await self.__lock_shards(list(changes)):
+            shards_by_hour[shard.hour_key].append(shard)
+        for hour_key, applicants in changes.items():
+            shards = shards_by_hour[hour_key]
+            remain = sum(s.max_applicants - s.confirmed_applicants for s in shards)
+            if applicants > remain:
+                return False
+            self.__distribute(shards, applicants)
+        await self.sess.flush()
+        return True
+
+    async def __lock_shards(self, hour_keys: list[int]) -> Sequence[ScheduleSlotShard]:
+        result = await self.sess.execute(LOCK_SHARDS, {"hour_keys": hour_keys})
+        return result.scalars().all()
+
+    @staticmethod
+    def __sum_shards(
+        hour_key: int, shards: Sequence[ScheduleSlotShard]
+    ) -> ScheduleSlot:
+        return ScheduleSlot(
+            hour_key=hour_key,
+            max_applicants=sum(s.max_applicants for s in shards),
+            confirmed_applicants=sum(s.confirmed_applicants for s in shards),
+        )
+
+    # 증가는 여유가 있는 shard 부터, 감소는 확정 인원이 있는 shard 부터 채우거나 뺌
+    @staticmethod
+    def __distribute(shards: Sequence[ScheduleSlotShard], applicants: int) -> None:
+        for shard in shards:
+            if applicants > 0:
+                moved = min(
+                    applicants,
+                    max(shard.max_applicants - shard.confirmed_applicants, 0),
+                )
+            else:
+                moved = max(applicants, -max(shard.confirmed_applicants, 0))
+            shard.confirmed_applicants += moved
+            applicants -= moved
+        if applicants and shards:
+            # 단일 row 모드와 같이 남은 인원은 범위를 넘더라도 마지막 shard 에 반영
+            shards[-1].confirmed_applicants += applicants
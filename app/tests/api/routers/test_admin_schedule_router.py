@@ -38,6 +38,43 @@ async def test_admin_get_all_schedule(client: AsyncClient, tokens: Tokens) -> No
     assert items[1]["profile"] == tokens.second_profile()
 
 
+@pytest.mark.anyio
+async def test_admin_get_all_schedule_total_after_status_change(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    await confirmed_schedule(client, tokens, start_at, 1)
+    await canceled_schedule(client, tokens, start_at, 1)
+    await pending_schedule(client, tokens.second_token(), start_at, 1)
+
+    response = await client.get(
+        "/admin/schedules", headers=tokens.admin_token(), params={"page-size": 5}
+    )
+    without_total = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={"page-size": 5, "include-total": "false"},
+    )
+
+    assert response.json()["total"] == 3
+    assert without_total.json()["total"] is None
+    assert len(without_total.json()["items"]) == 3
+
+
+@pytest.mark.anyio
+async def test_admin_get_all_schedule_invalid_cursor(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    response = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={"page-size": 5, "cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["code"] == "INVALID_ARGUMENT"
+
+
 @pytest.mark.anyio
 async def test_admin_change_schedule(client: AsyncClient, tokens: Tokens) -> None:
     start_at = datetime(2100, 1, 1, 0, 0, 0)
@@ -136,3 +173,172 @@ async def test_admin_schedule_confirmed_to_canceled(
     assert response.status_code == status.HTTP_200_OK
     json = response.json()
     assert json["status"] == "CANCELED"
+
+
+@pytest.mark.anyio
+async def test_admin_schedule_confirm_over_limit(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    schedule_id = await pending_schedule(client, tokens.first_token(), start_at, 30_000)
+    await confirmed_schedule(client, tokens, start_at, 30_000)
+
+    response = await client.put(
+        f"/admin/schedules/{schedule_id}/status",
+        headers=tokens.admin_token(),
+        json={"status": "CONFIRMED"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["code"] == "INVALID_ARGUMENT"
+
+
+@pytest.mark.anyio
+async def test_admin_get_metrics(client: AsyncClient, tokens: Tokens) -> None:
+    for _ in range(2):
+        await client.get("/admin/schedules", headers=tokens.admin_token())
+
+    response = await client.get("/admin/metrics", headers=tokens.admin_token())
+
+    assert response.status_code == status.HTTP_200_OK
+    json = response.json()
+    assert "hit_rate" in json["slot_page_cache"]
+    assert json["statement_cache"]["schedule.list_by_offset"]["hits"] >= 1
+
+
+@pytest.mark.anyio
+async def test_customer_get_metrics(client: AsyncClient, tokens: Tokens) -> None:
+    response = await client.get("/admin/metrics", headers=tokens.first_token())
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_admin_change_confirmed_schedule_overlap(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    schedule_id = await pending_schedule(client, tokens.first_token(), start_at, 1)
+    body = {
+        "name": "two_hours",
+        "start_at": datetime_to_str(start_at),
+        "end_at": datetime_to_str(datetime(2100, 1, 1, 2, 0, 0)),
+        "applicants": 50_000,
+    }
+    await client.put(
+        f"/admin/schedules/{schedule_id}", headers=tokens.admin_token(), json=body
+    )
+    await client.put(
+        f"/admin/schedules/{schedule_id}/status",
+        headers=tokens.admin_token(),
+        json={"status": "CONFIRMED"},
+    )
+
+    body["start_at"] = datetime_to_str(datetime(2100, 1, 1, 1, 0, 0))
+    body["end_at"] = datetime_to_str(datetime(2100, 1, 1, 3, 0, 0))
+    response = await client.put(
+        f"/admin/schedules/{schedule_id}", headers=tokens.admin_token(), json=body
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    slots = await client.get(
+        "/schedule-slot",
+        params={
+            "start-at": datetime_to_str(start_at),
+            "end-at": datetime_to_str(datetime(2100, 1, 1, 4, 0, 0)),
+        },
+    )
+    confirmed = [slot["confirmed_applicants"] for slot in slots.json()["items"]]
+    assert confirmed == [0, 50_000, 50_000, 0]
+
+
+@pytest.mark.anyio
+async def test_admin_get_slot_schedules(client: AsyncClient, tokens: Tokens) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    first_id = await confirmed_schedule(client, tokens, start_at, 100)
+    await pending_schedule(client, tokens.second_token(), start_at, 200)
+    await confirmed_schedule(client, tokens, datetime(2100, 1, 1, 1, 0, 0), 300)
+    body = {
+        "name": "two_hours",
+        "start_at": datetime_to_str(datetime(2099, 12, 31, 23, 0, 0)),
+        "end_at": datetime_to_str(datetime(2100, 1, 1, 1, 0, 0)),
+        "applicants": 400,
+    }
+    second = await client.post("/schedules", headers=tokens.second_token(), json=body)
+    await client.put(
+        f"/admin/schedules/{second.json()['id']}/status",
+        headers=tokens.admin_token(),
+        json={"status": "CONFIRMED"},
+    )
+
+    response = await client.get(
+        f"/admin/schedule-slot/{datetime_to_str(start_at)}/schedules",
+        headers=tokens.admin_token(),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    json = response.json()
+    assert json["start_at"] == "2100-01-01T00:00:00"
+    assert json["confirmed_applicants"] == 500
+    assert json["applicants"] == 500
+    assert [item["id"] for item in json["items"]] == [second.json()["id"], first_id]
+    assert json["items"][0]["profile"] == tokens.second_profile()
+
+
+@pytest.mark.anyio
+async def test_admin_search_schedule(client: AsyncClient, tokens: Tokens) -> None:
+    await confirmed_schedule(client, tokens, datetime(2100, 1, 1, 0, 0, 0), 1)
+    await confirmed_schedule(client, tokens, datetime(2100, 1, 2, 0, 0, 0), 1)
+    await pending_schedule(
+        client, tokens.second_token(), datetime(2100, 1, 1, 5, 0, 0), 1
+    )
+    body = {
+        "name": "100%_special",
+        "start_at": datetime_to_str(datetime(2100, 1, 1, 1, 0, 0)),
+        "end_at": datetime_to_str(datetime(2100, 1, 1, 2, 0, 0)),
+        "applicants": 1,
+    }
+    await client.post("/schedules", headers=tokens.second_token(), json=body)
+
+    by_status_window = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={
+            "status": "CONFIRMED",
+            "start-from": "2100-01-01T00:00:00",
+            "start-to": "2100-01-02T00:00:00",
+        },
+    )
+    by_account_status = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={"account-id": str(tokens.second.id), "status": "PENDING", "cursor": ""},
+    )
+    by_name = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={"name": "0%_s"},
+    )
+
+    assert by_status_window.json()["total"] == 1
+    assert [i["start_at"] for i in by_status_window.json()["items"]] == [
+        "2100-01-01T00:00:00"
+    ]
+    assert by_account_status.json()["total"] == 2
+    assert len(by_account_status.json()["items"]) == 2
+    assert by_name.json()["total"] == 1
+    assert by_name.json()["items"][0]["name"] == "100%_special"
+
+
+@pytest.mark.anyio
+async def test_admin_search_schedule_invalid_window(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    response = await client.get(
+        "/admin/schedules",
+        headers=tokens.admin_token(),
+        params={"start-from": "2100-01-02T00:00:00", "start-to": "2100-01-01T00:00:00"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["code"] == "INVALID_ARGUMENT"
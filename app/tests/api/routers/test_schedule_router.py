@@ -1,9 +1,12 @@
+import asyncio
 from datetime import datetime, timedelta
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from app.service.hour_lock_table import hour_lock_table
+from app.service.models.hour_key import to_hour_key
 from app.tests.conftest import Tokens
 from app.tests.fixture_util import (
     pending_schedule,
@@ -34,6 +37,46 @@ async def test_customer_get_own_schedule(client: AsyncClient, tokens: Tokens) ->
     assert items[0]["profile"] == tokens.first_profile()
 
 
+@pytest.mark.anyio
+async def test_customer_get_own_schedule_by_cursor(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    for hours in [2, 0, 1]:
+        await pending_schedule(
+            client, tokens.first_token(), start_at + timedelta(hours=hours), 1
+        )
+    await pending_schedule(client, tokens.second_token(), start_at, 1)
+
+    first = await client.get(
+        "/schedules",
+        headers=tokens.first_token(),
+        params={"page-size": 2, "cursor": ""},
+    )
+    first_json = first.json()
+    # 첫 페이지 이후에 추가된 더 이른 schedule 은 다음 페이지에 영향을 주지 않음
+    await pending_schedule(
+        client, tokens.first_token(), start_at - timedelta(hours=1), 1
+    )
+    second = await client.get(
+        "/schedules",
+        headers=tokens.first_token(),
+        params={"page-size": 2, "cursor": first_json["next_cursor"]},
+    )
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first_json["total"] == 3
+    assert [i["start_at"] for i in first_json["items"]] == [
+        datetime_to_str(start_at),
+        datetime_to_str(start_at + timedelta(hours=1)),
+    ]
+    second_json = second.json()
+    assert [i["start_at"] for i in second_json["items"]] == [
+        datetime_to_str(start_at + timedelta(hours=2))
+    ]
+    assert second_json["next_cursor"] is None
+
+
 @pytest.mark.anyio
 async def test_create_schedule_success(client: AsyncClient, tokens: Tokens) -> None:
     body = schedule_create_request(datetime(2101, 1, 1, 0, 0, 0), 1)
@@ -180,6 +223,32 @@ async def test_cancel_schedule(client: AsyncClient, tokens: Tokens) -> None:
     assert json["status"] == "CANCELED"
 
 
+@pytest.mark.anyio
+async def test_cancel_schedule_waits_for_hour_lock(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 1, 1, 0, 0, 0)
+    schedule_id = await pending_schedule(client, tokens.first_token(), start_at, 10)
+    stripes = hour_lock_table.stripes([to_hour_key(start_at)])
+    await hour_lock_table.acquire(stripes)
+
+    cancel = asyncio.create_task(
+        client.put(
+            f"/schedules/{schedule_id}/status",
+            headers=tokens.first_token(),
+            json={"status": "CANCELED"},
+        )
+    )
+    await asyncio.sleep(0.1)
+    # 같은 시간의 stripe 를 다른 요청이 잡고 있는 동안 기다림
+    assert not cancel.done()
+    hour_lock_table.release(stripes)
+    response = await cancel
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "CANCELED"
+
+
 @pytest.mark.anyio
 async def test_cancel_schedule_fail(client: AsyncClient, tokens: Tokens) -> None:
     start_at = datetime(2100, 1, 1, 0, 0, 0)
@@ -1,10 +1,16 @@
+import struct
 from datetime import datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.common.enviroment import env
+from app.service.models.hour_key import to_hour_key
+from app.storage.models.schedule_slot import ScheduleSlot
 from app.tests.conftest import Tokens
-from app.tests.fixture_util import datetime_to_str
+from app.tests.fixture_util import datetime_to_str, confirmed_schedule
 
 
 @pytest.mark.anyio
@@ -40,3 +46,143 @@ async def test_get_schedule_slot(client: AsyncClient, tokens: Tokens) -> None:
         ],
     }
     assert response.json() == expected_response
+
+
+@pytest.mark.anyio
+async def test_get_schedule_slot_not_create_slot(
+    client: AsyncClient, tokens: Tokens, db: AsyncSession
+) -> None:
+    start_at = datetime(2100, 2, 1, 0, 0, 0)
+    await confirmed_schedule(client, tokens, start_at, 10)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(days=14)),
+    }
+
+    response = await client.get("/schedule-slot", params=query_param)
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 14 * 24
+    assert items[0]["confirmed_applicants"] == 10
+    assert all(item["confirmed_applicants"] == 0 for item in items[1:])
+    slot_count = (await db.exec(select(func.count()).select_from(ScheduleSlot))).one()
+    assert slot_count == 1
+
+
+@pytest.mark.anyio
+async def test_get_schedule_slot_after_confirm(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    start_at = datetime(2100, 3, 1, 0, 0, 0)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(hours=2)),
+    }
+    await client.get("/schedule-slot", params=query_param)
+
+    await confirmed_schedule(client, tokens, start_at, 10)
+    response = await client.get("/schedule-slot", params=query_param)
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert items[0]["confirmed_applicants"] == 10
+    assert items[1]["confirmed_applicants"] == 0
+
+
+@pytest.mark.anyio
+async def test_get_schedule_slot_columnar(client: AsyncClient, tokens: Tokens) -> None:
+    start_at = datetime(2100, 4, 1, 0, 0, 0)
+    await confirmed_schedule(client, tokens, start_at + timedelta(hours=1), 10)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(hours=3)),
+    }
+
+    response = await client.get(
+        "/schedule-slot",
+        params=query_param,
+        headers={"Accept": "application/vnd.schedule-slot.columnar+json"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(
+        "application/vnd.schedule-slot.columnar+json"
+    )
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+    assert response.json() == {
+        "start_at": "2100-04-01T00:00:00",
+        "end_at": "2100-04-01T03:00:00",
+        "step_seconds": 3600,
+        "max_applicants": [50000, 50000, 50000],
+        "confirmed_applicants": [0, 10, 0],
+    }
+
+
+@pytest.mark.anyio
+async def test_get_schedule_slot_int32(client: AsyncClient, tokens: Tokens) -> None:
+    start_at = datetime(2100, 4, 1, 0, 0, 0)
+    await confirmed_schedule(client, tokens, start_at, 7)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(hours=2)),
+    }
+
+    response = await client.get(
+        "/schedule-slot",
+        params=query_param,
+        headers={"Accept": "application/vnd.schedule-slot.int32"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.schedule-slot.int32"
+    values = struct.unpack("<6i", response.content)
+    assert values == (to_hour_key(start_at), 2, 50000, 50000, 7, 0)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fast_json_response", [False, True])
+async def test_get_schedule_slot_prefers_higher_quality(
+    client: AsyncClient,
+    tokens: Tokens,
+    monkeypatch: pytest.MonkeyPatch,
+    fast_json_response: bool,
+) -> None:
+    monkeypatch.setattr(env, "FAST_JSON_RESPONSE", fast_json_response)
+    start_at = datetime(2100, 4, 1, 0, 0, 0)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(hours=2)),
+    }
+
+    response = await client.get(
+        "/schedule-slot",
+        params=query_param,
+        headers={
+            "Accept": "application/vnd.schedule-slot.int32;q=0.5, application/json"
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    assert response.headers.get_list("vary") == ["Accept, Accept-Encoding"]
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.anyio
+async def test_get_schedule_slot_gzip(client: AsyncClient, tokens: Tokens) -> None:
+    start_at = datetime(2100, 5, 1, 0, 0, 0)
+    query_param = {
+        "start-at": datetime_to_str(start_at),
+        "end-at": datetime_to_str(start_at + timedelta(days=14)),
+    }
+
+    response = await client.get(
+        "/schedule-slot", params=query_param, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()["items"]) == 14 * 24
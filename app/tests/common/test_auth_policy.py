@@ -0,0 +1,46 @@
+import pytest
+from fastapi import status
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from app.common.auth_policy import authorize_admin, authenticate
+from app.main import app
+from app.tests.conftest import Tokens
+
+
+def route_policy_calls(route: APIRoute) -> set:
+    return {dependency.call for dependency in route.dependant.dependencies}
+
+
+@pytest.mark.anyio
+async def test_routes_declare_auth_policy() -> None:
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        calls = route_policy_calls(route)
+        if route.path.startswith("/admin"):
+            assert authorize_admin in calls, route.path
+        elif route.path.startswith("/schedules"):
+            assert authenticate in calls, route.path
+        else:
+            assert not calls & {authorize_admin, authenticate}, route.path
+
+
+@pytest.mark.anyio
+async def test_customer_route_without_token(client: AsyncClient) -> None:
+    response = await client.get("/schedules")
+    malformed = await client.get("/schedules", headers={"Authorization": "Basic abc"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["code"] == "NO_AUTHENTICATE"
+    assert malformed.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_admin_route_with_customer_token(
+    client: AsyncClient, tokens: Tokens
+) -> None:
+    response = await client.get("/admin/schedules", headers=tokens.first_token())
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json()["code"] == "ACCESS_DENIED"
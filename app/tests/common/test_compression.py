@@ -0,0 +1,181 @@
+import asyncio
+import gzip
+import zlib
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.common import compression
+from app.common.compression import (
+    CompressionMiddleware,
+    CompressionStats,
+    Encoding,
+    compression_level,
+    negotiate,
+)
+
+LARGE_BODY = "".join(f"slot {i} confirmed {i % 7}\n" for i in range(500))
+SMALL_BODY = "small"
+
+stats = CompressionStats()
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024, stats=stats)
+
+
+@app.get("/large")
+async def large() -> PlainTextResponse:
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/small")
+async def small() -> PlainTextResponse:
+    return PlainTextResponse(SMALL_BODY)
+
+
+@app.get("/fast", dependencies=compression_level(gzip=1))
+async def fast() -> PlainTextResponse:
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/disabled", dependencies=compression_level(gzip=0))
+async def disabled() -> PlainTextResponse:
+    return PlainTextResponse(LARGE_BODY)
+
+
+@app.get("/encoded")
+async def encoded() -> PlainTextResponse:
+    return PlainTextResponse(
+        gzip.compress(LARGE_BODY.encode()), headers={"Content-Encoding": "gzip"}
+    )
+
+
+async def get(path: str, accept_encoding: str = "gzip"):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+@pytest.fixture(autouse=True)
+def clear_stats() -> None:
+    stats.clear()
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate", Encoding.GZIP),
+        ("GZIP;q=0.5", Encoding.GZIP),
+        ("*", Encoding.GZIP),
+        ("gzip;q=0, *", None),
+        ("identity", None),
+        ("", None),
+    ],
+)
+@pytest.mark.anyio
+async def test_negotiate(accept_encoding: str, expected: Encoding | None) -> None:
+    assert negotiate(accept_encoding) == expected
+
+
+@pytest.mark.anyio
+async def test_negotiate_prefers_brotli_when_installed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(compression, "brotli", object())
+
+    assert negotiate("gzip, br") == Encoding.BROTLI
+    assert negotiate("gzip, br;q=0.5") == Encoding.GZIP
+
+
+def test_compression_level_dependency_runs_on_event_loop() -> None:
+    # 동기 의존성은 FastAPI 가 요청마다 threadpool 로 실행
+    (dependency,) = compression_level(gzip=1)
+
+    assert asyncio.iscoroutinefunction(dependency.dependency)
+
+
+@pytest.mark.anyio
+async def test_compress_large_response() -> None:
+    response = await get("/large")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(LARGE_BODY)
+    assert response.text == LARGE_BODY
+    assert stats.stats()["gzip"]["responses"] == 1
+    assert stats.stats()["gzip"]["bytes_in"] == len(LARGE_BODY)
+
+
+@pytest.mark.anyio
+async def test_not_compress_below_minimum_size() -> None:
+    response = await get("/small")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == SMALL_BODY
+    assert stats.stats()["skipped"] == {"below_minimum_size": 1}
+
+
+@pytest.mark.anyio
+async def test_not_compress_without_accept_encoding() -> None:
+    response = await get("/large", accept_encoding="identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.anyio
+async def test_route_compression_level() -> None:
+    response = await get("/fast")
+
+    assert int(response.headers["content-length"]) == len(
+        gzip.compress(LARGE_BODY.encode(), compresslevel=1)
+    )
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.anyio
+async def test_route_compression_disabled() -> None:
+    response = await get("/disabled")
+
+    assert "content-encoding" not in response.headers
+    assert stats.stats()["skipped"] == {"disabled": 1}
+
+
+@pytest.mark.anyio
+async def test_not_compress_encoded_response() -> None:
+    response = await get("/encoded")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE_BODY
+    assert stats.stats()["skipped"] == {"encoded": 1}
+
+
+@pytest.mark.anyio
+async def test_compress_streaming_response() -> None:
+    lines = [line.encode() for line in LARGE_BODY.splitlines(keepends=True)[:3]]
+
+    async def streaming_app(scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for line in lines:
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+    await CompressionMiddleware(streaming_app, stats=stats)(scope, None, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    chunks = [message["body"] for message in sent[1:]]
+    # 각 chunk 가 flush 되어 받은 부분까지 바로 풀 수 있음
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    assert decompressor.decompress(chunks[0]) == lines[0]
+    assert gzip.decompress(b"".join(chunks)) == b"".join(lines)
+    assert stats.stats()["gzip"]["responses"] == 1
@@ -0,0 +1,31 @@
+import pytest
+
+from app.common.content_negotiation import negotiate_media_type
+
+offered = [
+    "application/json",
+    "application/vnd.schedule-slot.columnar+json",
+    "application/vnd.schedule-slot.int32",
+]
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        ("application/vnd.schedule-slot.int32", offered[2]),
+        ("Application/VND.Schedule-Slot.Columnar+JSON", offered[1]),
+        ("application/vnd.schedule-slot.int32;q=0.5, application/json", offered[0]),
+        (
+            "application/vnd.schedule-slot.columnar+json;v=1;q=0.9, */*;q=0.1",
+            offered[1],
+        ),
+        ("application/*, application/json;q=0", offered[1]),
+        ("text/html, */*;q=0.8", offered[0]),
+        # 부분 문자열로는 일치하지 않음
+        ("application/vnd.schedule-slot.int32x", None),
+        ("application/vnd.schedule-slot.int32;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate_media_type(accept: str, expected: str | None) -> None:
+    assert negotiate_media_type(accept, offered) == expected
@@ -0,0 +1,54 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.api.routes.dto.schedule_dto import PaginatedScheduleResponse
+from app.common import fast_json
+from app.common.fast_json import FastJSONResponse
+from app.service.models.page import SchedulePage
+from app.service.models.schedule_status import ScheduleStatus
+
+page = SchedulePage(
+    total=1,
+    page_size=10,
+    page_number=0,
+    items=[
+        {
+            "id": 1,
+            "name": "시험",
+            "start_at": datetime(2100, 1, 1, 10),
+            "end_at": datetime(2100, 1, 1, 12, 30, 0, 1),
+            "applicants": 100,
+            "status": ScheduleStatus.CONFIRMED,
+            "account_id": UUID("00000000-0000-4000-0000-000000000001"),
+            "nickname": "first_customer",
+        }
+    ],
+)
+
+
+def validated_body() -> bytes:
+    content = PaginatedScheduleResponse.page_to_dict(page)
+    validated = PaginatedScheduleResponse.model_validate(content)
+    return json.dumps(
+        jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@pytest.mark.anyio
+async def test_fast_json_same_as_response_model() -> None:
+    response = FastJSONResponse(PaginatedScheduleResponse.page_to_dict(page))
+
+    assert response.body == validated_body()
+
+
+@pytest.mark.anyio
+async def test_fast_json_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fast_json, "orjson", None)
+
+    response = FastJSONResponse(PaginatedScheduleResponse.page_to_dict(page))
+
+    assert response.body == validated_body()
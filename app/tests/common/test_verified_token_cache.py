@@ -0,0 +1,73 @@
+from uuid import UUID
+
+import pytest
+
+from app.common.authentication import Authentication
+from app.common.exceptions import AuthenticateException
+from app.common.jwt_token import JwtTokenUtil
+from app.common.verified_token_cache import VerifiedTokenCache, token_key
+from app.service.models.role import Role
+
+
+class CountingJwtTokenUtil(JwtTokenUtil):
+    def __init__(self):
+        self.verify_count: int = 0
+
+    def verify_access_token_with_exp(
+        self, token: str
+    ) -> tuple[Authentication, float | None]:
+        self.verify_count += 1
+        return super().verify_access_token_with_exp(token)
+
+
+user = Authentication(UUID("00000000-0000-4000-0000-000000000001"), Role.CUSTOMER)
+
+
+def test_verified_token_reused() -> None:
+    token_util = CountingJwtTokenUtil()
+    cache = VerifiedTokenCache(token_util, 10, 10, 10)
+    token = token_util.create_access_token(user)
+
+    first = cache.verify(token)
+    second = cache.verify(token)
+
+    assert token_util.verify_count == 1
+    assert second is first
+    assert second.account_id == user.account_id
+    assert cache.verified.stats()["hits"] == 1
+
+
+def test_rejected_token_reused() -> None:
+    token_util = CountingJwtTokenUtil()
+    cache = VerifiedTokenCache(token_util, 10, 10, 10)
+
+    for _ in range(3):
+        with pytest.raises(AuthenticateException):
+            cache.verify("invalid")
+
+    assert token_util.verify_count == 1
+    assert cache.rejected.stats()["hits"] == 2
+
+
+def test_verified_token_expires_with_exp() -> None:
+    token_util = CountingJwtTokenUtil()
+    cache = VerifiedTokenCache(token_util, 10, 10, 10)
+    token = token_util.create_access_token(user)
+    cache.verified.put(token_key(token), user, -1)
+
+    cache.verify(token)
+
+    assert token_util.verify_count == 1
+    assert cache.verified.stats()["expirations"] == 1
+
+
+def test_long_token_stored_as_digest() -> None:
+    token_util = CountingJwtTokenUtil()
+    cache = VerifiedTokenCache(token_util, 10, 10, 10)
+    token = "invalid" * 10_000
+
+    with pytest.raises(AuthenticateException):
+        cache.verify(token)
+
+    assert len(token_key(token)) == 32
+    assert cache.rejected.get(token_key(token)) is not None
@@ -10,9 +10,13 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.common.enviroment import env
 from app.main import app
 from app.service.models.role import Role
+from app.service.slot_page_cache import slot_page_cache
 from app.storage.models.account import Account
 from app.storage.models.schedule import Schedule
+from app.storage.models.schedule_count import ScheduleCount
 from app.storage.models.schedule_slot import ScheduleSlot
+from app.storage.models.schedule_slot_day import ScheduleSlotDay
+from app.storage.models.schedule_slot_shard import ScheduleSlotShard
 
 async_engine = create_async_engine(str(env.DATABASE_URL), echo=True)
 AsyncSessionLocal = async_sessionmaker(
@@ -38,7 +42,8 @@ init_users = [
 ]
 
 
-@pytest.fixture(scope="session")
+# 동기 테스트에서도 autouse 인 비동기 db fixture 가 anyio 로 실행되도록 항상 사용
+@pytest.fixture(scope="session", autouse=True)
 def anyio_backend():
     return "asyncio"
 
@@ -65,8 +70,12 @@ async def db() -> AsyncGenerator[AsyncSession, None]:
 @pytest.fixture(scope="class", autouse=True)
 async def tear_down_db(db: AsyncSession) -> None:
     await db.exec(delete(ScheduleSlot))
+    await db.exec(delete(ScheduleSlotShard))
+    await db.exec(delete(ScheduleSlotDay))
     await db.exec(delete(Schedule))
+    await db.exec(delete(ScheduleCount))
     await db.commit()
+    slot_page_cache.clear()
 
 
 @pytest.fixture(scope="session")
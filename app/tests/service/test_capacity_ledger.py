@@ -0,0 +1,68 @@
+import pytest
+
+from app.service.capacity_ledger import CapacityLedger
+from app.service.models.page import ScheduleSlotPage
+
+
+class StubRepository:
+    def __init__(self, confirmed_applicants: int):
+        self.confirmed_applicants: int = confirmed_applicants
+
+    async def find_range_page(self, start_key: int, end_key: int) -> ScheduleSlotPage:
+        return ScheduleSlotPage.from_rows(
+            start_key, end_key, [(start_key, 40_000, self.confirmed_applicants)]
+        )
+
+
+@pytest.mark.anyio
+async def test_page_from_hydrated_window() -> None:
+    ledger = CapacityLedger(1, refresh_seconds=60)
+    await ledger.hydrate(StubRepository(100))
+    start_key, end_key = ledger.window()
+
+    ledger.add_applicants(start_key + 1, start_key + 3, 7)
+    page = ledger.page(start_key, start_key + 3)
+
+    assert list(page.rows()) == [
+        (start_key, 40_000, 100),
+        (start_key + 1, 50_000, 7),
+        (start_key + 2, 50_000, 7),
+    ]
+    # 장부 범위를 벗어나면 데이터베이스에서 조회
+    assert ledger.page(start_key - 1, start_key + 1) is None
+    assert ledger.page(end_key - 1, end_key + 1) is None
+
+
+@pytest.mark.anyio
+async def test_returned_page_not_changed_by_later_commit() -> None:
+    ledger = CapacityLedger(1, refresh_seconds=60)
+    await ledger.hydrate(StubRepository(0))
+    start_key, _ = ledger.window()
+    page = ledger.page(start_key, start_key + 1)
+
+    ledger.add_applicants(start_key, start_key + 1, 5)
+
+    assert list(page.confirmed_applicants) == [0]
+    assert list(ledger.page(start_key, start_key + 1).confirmed_applicants) == [5]
+
+
+@pytest.mark.anyio
+async def test_stale_ledger_not_used() -> None:
+    ledger = CapacityLedger(1, refresh_seconds=60)
+    start_key, _ = ledger.window()
+    assert ledger.page(start_key, start_key + 1) is None
+
+    await ledger.hydrate(StubRepository(0))
+    ledger.loaded_at -= 120
+
+    # 다시 읽기가 멈춘 장부는 조회에 쓰지 않음
+    assert ledger.page(start_key, start_key + 1) is None
+
+
+def test_disabled_ledger_not_started() -> None:
+    ledger = CapacityLedger(0, refresh_seconds=60)
+
+    ledger.start()
+
+    assert not ledger.is_enabled()
+    assert ledger.page(0, 1) is None
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+import pytest
+
+from app.service.models.hour_key import to_hour_key
+from app.service.models.page import ScheduleSlotPage
+
+
+@pytest.mark.anyio
+async def test_from_rows_fill_default_slot() -> None:
+    start_key = to_hour_key(datetime(2100, 1, 1, 0))
+
+    page = ScheduleSlotPage.from_rows(
+        start_key, start_key + 3, [(start_key + 1, 50_000, 700)]
+    )
+
+    assert page.start_at() == datetime(2100, 1, 1, 0)
+    assert page.end_at() == datetime(2100, 1, 1, 3)
+    assert list(page.rows()) == [
+        (start_key, 50_000, 0),
+        (start_key + 1, 50_000, 700),
+        (start_key + 2, 50_000, 0),
+    ]
@@ -0,0 +1,136 @@
+from datetime import datetime
+
+import pytest
+
+from app.service.models.applicants_delta import ApplicantsDelta
+from app.service.models.schedule_slot_query import ScheduleSlotQuery
+from app.service.models.time_range import TimeRange
+from app.storage.day_schedule_slot_repository import DayScheduleSlotRepository
+from app.storage.models.schedule_slot import ScheduleSlot
+from app.tests.conftest import AsyncSessionLocal
+
+# 하루 경계를 넘는 범위
+time_range = TimeRange(datetime(2150, 1, 1, 22), datetime(2150, 1, 2, 2))
+
+
+@pytest.mark.anyio
+async def test_reserve_across_days() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = DayScheduleSlotRepository(sess)
+
+        assert await repository.reserve_applicants(time_range, 30_000)
+        assert not await repository.reserve_applicants(time_range, 20_001)
+        await sess.commit()
+
+        slots = await repository.find_all(time_range.start_key(), time_range.end_key())
+        assert [s.start_at() for s in slots] == [
+            datetime(2150, 1, 1, 22),
+            datetime(2150, 1, 1, 23),
+            datetime(2150, 1, 2, 0),
+            datetime(2150, 1, 2, 1),
+        ]
+        assert [s.confirmed_applicants for s in slots] == [30_000] * 4
+        assert await repository.min_applicants_in_range(time_range) == 20_000
+
+
+@pytest.mark.anyio
+async def test_apply_delta_and_page() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = DayScheduleSlotRepository(sess)
+        await repository.reserve_applicants(time_range, 10_000)
+        moved = TimeRange(datetime(2150, 1, 2, 0), datetime(2150, 1, 2, 4))
+
+        assert await repository.apply_applicants_delta(
+            ApplicantsDelta().add(time_range, -10_000).add(moved, 10_000)
+        )
+        await sess.commit()
+
+        page = await repository.find_page(
+            ScheduleSlotQuery(
+                start_at=datetime(2150, 1, 1, 23), end_at=datetime(2150, 1, 2, 5)
+            )
+        )
+        assert [confirmed for _, _, confirmed in page.rows()] == [
+            0,
+            10_000,
+            10_000,
+            10_000,
+            10_000,
+            0,
+        ]
+
+
+@pytest.mark.anyio
+async def test_apply_delta_creates_only_changed_days() -> None:
+    first = TimeRange(datetime(2153, 1, 1, 10), datetime(2153, 1, 1, 11))
+    last = TimeRange(datetime(2153, 1, 10, 10), datetime(2153, 1, 10, 11))
+    async with AsyncSessionLocal() as sess:
+        repository = DayScheduleSlotRepository(sess)
+
+        assert await repository.apply_applicants_delta(
+            ApplicantsDelta().add(last, 200).add(first, 100)
+        )
+        await sess.commit()
+
+        # 사이의 날짜는 만들거나 잠그지 않음
+        slots = await repository.find_all(first.start_key(), last.end_key())
+        assert {s.start_at().date() for s in slots} == {
+            datetime(2153, 1, 1).date(),
+            datetime(2153, 1, 10).date(),
+        }
+        assert [s.confirmed_applicants for s in slots if s.confirmed_applicants] == [
+            100,
+            200,
+        ]
+
+
+@pytest.mark.anyio
+async def test_backfill_from_hour_slots() -> None:
+    day_start = TimeRange(datetime(2151, 1, 1, 0), datetime(2151, 1, 1, 1))
+    async with AsyncSessionLocal() as sess:
+        repository = DayScheduleSlotRepository(sess)
+        sess.add_all(
+            [
+                ScheduleSlot(
+                    hour_key=day_start.start_key() + 1,
+                    max_applicants=40_000,
+                    confirmed_applicants=100,
+                ),
+                ScheduleSlot(
+                    hour_key=day_start.start_key() + 23, confirmed_applicants=200
+                ),
+            ]
+        )
+        await sess.commit()
+
+        assert await repository.backfill_from_hour_slots() >= 1
+        await sess.commit()
+
+        slots = await repository.find_all(
+            day_start.start_key(), day_start.start_key() + 24
+        )
+        assert len(slots) == 24
+        assert [(s.max_applicants, s.confirmed_applicants) for s in slots][:3] == [
+            (50_000, 0),
+            (40_000, 100),
+            (50_000, 0),
+        ]
+        assert slots[23].confirmed_applicants == 200
+        # 이미 옮긴 day row 는 다시 덮어쓰지 않음
+        await repository.reserve_applicants(day_start, 10)
+        assert await repository.backfill_from_hour_slots() == 0
+        slots = await repository.find_all(day_start.start_key(), day_start.end_key())
+        assert slots[0].confirmed_applicants == 10
+
+
+@pytest.mark.anyio
+async def test_raw_read_runs_in_session_transaction() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = DayScheduleSlotRepository(sess)
+
+        # 세션의 첫 문장이 asyncpg 로 바로 보내는 조회여도 트랜잭션 안에서 실행
+        await repository.min_applicants_in_range(time_range)
+
+        connection = await sess.connection()
+        raw_connection = await connection.get_raw_connection()
+        assert raw_connection.driver_connection.is_in_transaction()
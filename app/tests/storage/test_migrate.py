@@ -0,0 +1,185 @@
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncGenerator
+from uuid import UUID
+
+import asyncpg
+import pytest
+
+from app.migrate import Migration, database_dsn, load_migrations, migrate
+from app.service.models.hour_key import to_hour_key
+
+LEGACY_DATABASE = "grepp_migrate_test"
+account_id = UUID("00000000-0000-4000-0000-000000000001")
+
+
+@pytest.fixture
+async def legacy_dsn() -> AsyncGenerator[str, None]:
+    conn = await asyncpg.connect(database_dsn())
+    try:
+        await conn.execute(f"DROP DATABASE IF EXISTS {LEGACY_DATABASE}")
+        await conn.execute(f"CREATE DATABASE {LEGACY_DATABASE}")
+        yield database_dsn(LEGACY_DATABASE)
+        await conn.execute(f"DROP DATABASE IF EXISTS {LEGACY_DATABASE} WITH (FORCE)")
+    finally:
+        await conn.close()
+
+
+def test_load_migrations_in_version_order(tmp_path: Path) -> None:
+    (tmp_path / "V010__later.sql").write_text("SELECT 1;")
+    (tmp_path / "V002__concurrent.sql").write_text(
+        "-- migrate: no-transaction\nCREATE INDEX CONCURRENTLY a ON b (c);\n"
+        "CREATE INDEX CONCURRENTLY d ON e (f);\n"
+    )
+    (tmp_path / "README.md").write_text("not a migration")
+
+    migrations = load_migrations(tmp_path)
+
+    assert [m.version for m in migrations] == [2, 10]
+    assert not migrations[0].is_transactional()
+    assert migrations[0].statements() == [
+        "CREATE INDEX CONCURRENTLY a ON b (c)",
+        "CREATE INDEX CONCURRENTLY d ON e (f)",
+    ]
+    assert migrations[1].is_transactional()
+    assert migrations[1].required_extension() is None
+
+
+def test_statements_keep_quoted_semicolons() -> None:
+    migration = Migration(
+        1,
+        "quoted",
+        "-- migrate: no-transaction\n"
+        "CREATE FUNCTION f() RETURNS TEXT AS $body$ SELECT 'a;b' $body$ LANGUAGE sql;\n"
+        "/* c; d */ SELECT ';', \"e;f\", 'it''s;';\n"
+        "-- trailing; comment\n",
+    )
+
+    assert migration.statements() == [
+        "CREATE FUNCTION f() RETURNS TEXT AS $body$ SELECT 'a;b' $body$ LANGUAGE sql",
+        "SELECT ';', \"e;f\", 'it''s;'",
+    ]
+
+
+@pytest.mark.anyio
+async def test_migrate_skip_applied_migrations() -> None:
+    assert await migrate() == []
+
+
+@pytest.mark.anyio
+async def test_migrate_database_created_by_init_sql(legacy_dsn: str) -> None:
+    migrations = load_migrations()
+    slot_start = datetime(2100, 1, 1, 10)
+    conn = await asyncpg.connect(legacy_dsn)
+    try:
+        # init.sql 로 만들어져 운영 중이던 데이터베이스
+        await conn.execute(migrations[0].sql)
+        await conn.execute(
+            "INSERT INTO account VALUES ($1, 'customer', 'CUSTOMER')", account_id
+        )
+        await conn.executemany(
+            "INSERT INTO schedule (name, start_at, end_at, applicants, status, account_id)"
+            " VALUES ('legacy', $1, $2, 10, $3, $4)",
+            [
+                (slot_start, datetime(2100, 1, 1, 12), "CONFIRMED", account_id),
+                (slot_start, datetime(2100, 1, 1, 12), "PENDING", account_id),
+            ],
+        )
+        # unique 제약이 없던 시기의 중복 slot
+        await conn.executemany(
+            "INSERT INTO schedule_slot (slot_start_time, max_applicants, confirmed_applicants)"
+            " VALUES ($1, $2, $3)",
+            [
+                (slot_start, 50000, 10),
+                (slot_start, 50000, 20),
+                (datetime(2100, 1, 1, 11), 40000, 0),
+            ],
+        )
+
+        applied = await migrate(dsn=legacy_dsn)
+
+        recorded = await conn.fetch(
+            "SELECT version FROM schema_migrations WHERE version > 1 ORDER BY version"
+        )
+        assert [m.version for m in applied] == [row["version"] for row in recorded]
+        assert {
+            m.version for m in migrations[1:] if m.required_extension() is None
+        } <= {m.version for m in applied}
+        slots = await conn.fetch(
+            "SELECT hour_key, max_applicants, confirmed_applicants"
+            " FROM schedule_slot ORDER BY hour_key"
+        )
+        assert [tuple(slot) for slot in slots] == [
+            (to_hour_key(slot_start), 50000, 20),
+            (to_hour_key(slot_start) + 1, 40000, 0),
+        ]
+        assert await conn.fetchval("SELECT count(*) FROM schedule") == 2
+        counts = await conn.fetch(
+            "SELECT account_id, status, total FROM schedule_count ORDER BY status"
+        )
+        assert [tuple(count) for count in counts] == [
+            (account_id, "CONFIRMED", 1),
+            (account_id, "PENDING", 1),
+        ]
+        assert await migrate(dsn=legacy_dsn) == []
+    finally:
+        await conn.close()
+
+
+@pytest.mark.anyio
+async def test_migrate_concurrent_index_on_partitioned_table(
+    legacy_dsn: str, tmp_path: Path
+) -> None:
+    (tmp_path / "V001__event.sql").write_text(
+        "CREATE TABLE event (at INTEGER NOT NULL) PARTITION BY RANGE (at);\n"
+        "CREATE TABLE event_1 PARTITION OF event FOR VALUES FROM (0) TO (10);\n"
+        "CREATE TABLE event_default PARTITION OF event DEFAULT;\n"
+        "CREATE INDEX event_default_at_idx ON event_default (at) WHERE at > 0;\n"
+        "UPDATE pg_index SET indisvalid = FALSE"
+        " WHERE indexrelid = 'event_default_at_idx'::regclass;\n"
+    )
+    (tmp_path / "V002__event_index.sql").write_text(
+        "-- migrate: no-transaction\n"
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS event_at_idx ON event (at) WHERE at > 0;\n"
+    )
+
+    await migrate(tmp_path, legacy_dsn)
+
+    conn = await asyncpg.connect(legacy_dsn)
+    try:
+        indexes = await conn.fetch(
+            "SELECT indexrelid::regclass::text AS name, indisvalid FROM pg_index"
+            " WHERE indrelid IN ('event'::regclass, 'event_1'::regclass,"
+            " 'event_default'::regclass) ORDER BY 1"
+        )
+        attached = await conn.fetchval(
+            "SELECT count(*) FROM pg_inherits WHERE inhparent = 'event_at_idx'::regclass"
+        )
+    finally:
+        await conn.close()
+    # 실패로 남은 INVALID partition 인덱스는 다시 만들어 attach
+    assert [tuple(index) for index in indexes] == [
+        ("event_1_at_idx", True),
+        ("event_at_idx", True),
+        ("event_default_at_idx", True),
+    ]
+    assert attached == 2
+
+
+@pytest.mark.anyio
+async def test_migrate_skip_migration_requiring_unavailable_extension(
+    legacy_dsn: str, tmp_path: Path
+) -> None:
+    (tmp_path / "V001__account.sql").write_text("CREATE TABLE account (id INTEGER);")
+    (tmp_path / "V002__optional.sql").write_text(
+        "-- migrate: no-transaction\n-- migrate: requires-extension not_installed\n"
+        "CREATE EXTENSION not_installed;\n"
+    )
+    (tmp_path / "V003__later.sql").write_text("CREATE TABLE later (id INTEGER);")
+
+    applied = await migrate(tmp_path, legacy_dsn)
+
+    assert [m.version for m in applied] == [1, 3]
+    assert not load_migrations(tmp_path)[1].is_transactional()
+    # 기록하지 않으므로 매번 다시 확인하고, 설치 전에는 계속 건너뜀
+    assert await migrate(tmp_path, legacy_dsn) == []
@@ -0,0 +1,131 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.archive_partitions import retention_start
+from app.service.models.schedule_status import ScheduleStatus
+from app.storage.models.schedule import Schedule
+from app.storage.models.schedule_count import ScheduleCount
+from app.storage.partition_repository import PartitionRepository, PARTITION_LOCK_KEY
+from app.storage.schedule_repository import ScheduleRepository
+from app.tests.conftest import AsyncSessionLocal, init_users
+
+admin = init_users[0]
+
+
+async def partition_exists(sess: AsyncSession, partition: str) -> bool:
+    return await sess.scalar(
+        text("SELECT to_regclass(:partition) IS NOT NULL"), {"partition": partition}
+    )
+
+
+async def save_schedule(sess: AsyncSession, start_at: datetime) -> Schedule:
+    return await ScheduleRepository(sess).save(
+        Schedule(
+            name="partition",
+            start_at=start_at,
+            end_at=start_at.replace(hour=start_at.hour + 2),
+            applicants=10,
+            status=ScheduleStatus.PENDING,
+            account_id=admin.id,
+        )
+    )
+
+
+@pytest.mark.anyio
+async def test_ensure_partition_moves_default_rows() -> None:
+    async with AsyncSessionLocal() as sess:
+        schedule = await save_schedule(sess, datetime(2200, 1, 10, 10))
+        await sess.commit()
+
+        repository = PartitionRepository(sess)
+        await repository.ensure_month_partitions(
+            datetime(2200, 1, 1), datetime(2200, 1, 31)
+        )
+        await sess.commit()
+
+        for partition in ["schedule", "schedule_slot", "schedule_slot_shard"]:
+            assert await partition_exists(sess, f"{partition}_220001")
+        partition = await sess.scalar(
+            text("SELECT tableoid::regclass::text FROM schedule WHERE id = :id"),
+            {"id": schedule.id},
+        )
+        assert partition == "schedule_220001"
+        assert (
+            await repository.ensure_month_partitions(
+                datetime(2200, 1, 1), datetime(2200, 1, 31)
+            )
+            == 0
+        )
+
+
+@pytest.mark.anyio
+async def test_ensure_partition_skips_history_months() -> None:
+    async with AsyncSessionLocal() as sess:
+        schedule = await save_schedule(sess, datetime(1990, 1, 10, 10))
+        await sess.commit()
+
+        created = await PartitionRepository(sess).ensure_month_partitions(
+            datetime(1990, 1, 1), datetime(1990, 1, 31)
+        )
+        await sess.commit()
+
+        # migration 이전 row 를 담는 history partition 범위는 월 partition 을 만들지 않음
+        assert created == 0
+        assert not await partition_exists(sess, "schedule_199001")
+        partition = await sess.scalar(
+            text("SELECT tableoid::regclass::text FROM schedule WHERE id = :id"),
+            {"id": schedule.id},
+        )
+        assert partition == "schedule_history"
+
+
+@pytest.mark.anyio
+async def test_ensure_partition_skipped_while_locked() -> None:
+    async with AsyncSessionLocal() as holder, AsyncSessionLocal() as sess:
+        await holder.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY}
+        )
+
+        created = await PartitionRepository(sess).ensure_month_partitions(
+            datetime(2201, 1, 1), datetime(2201, 1, 31)
+        )
+        await sess.commit()
+        await holder.rollback()
+
+        assert created == 0
+        assert not await partition_exists(sess, "schedule_220101")
+
+
+@pytest.mark.anyio
+async def test_archive_partition_excludes_count() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = PartitionRepository(sess)
+        await repository.ensure_month_partitions(
+            datetime(2200, 1, 1), datetime(2200, 1, 31)
+        )
+        await save_schedule(sess, datetime(2200, 1, 10, 10))
+        await sess.commit()
+
+        archived = await repository.archive_month_partitions(datetime(2200, 2, 1))
+        await sess.commit()
+
+        assert {
+            "schedule_220001",
+            "schedule_slot_220001",
+            "schedule_slot_shard_220001",
+        } <= set(archived)
+        assert not await partition_exists(sess, "schedule_220001")
+        count = await sess.get(ScheduleCount, (admin.id, ScheduleStatus.PENDING))
+        await sess.refresh(count)
+        assert count.total == 0
+        for partition in archived:
+            await sess.execute(text(f"DROP TABLE archived_{partition}"))
+        await sess.commit()
+
+
+def test_retention_start() -> None:
+    assert retention_start(datetime(2025, 3, 15), 3) == datetime(2024, 12, 1)
+    assert retention_start(datetime(2025, 3, 15), 14) == datetime(2024, 1, 1)
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.service.models.schedule_status import ScheduleStatus
+from app.storage.models.schedule import Schedule
+from app.storage.schedule_repository import ScheduleRepository
+from app.tests.conftest import AsyncSessionLocal, init_users
+
+admin = init_users[0]
+
+
+async def counts(sess: AsyncSession) -> tuple[int, int]:
+    params = {"account_id": admin.id, "status": ScheduleStatus.PENDING.value}
+    actual = await sess.scalar(
+        text(
+            "SELECT count(*) FROM schedule"
+            " WHERE account_id = :account_id AND status = :status"
+        ),
+        params,
+    )
+    counted = await sess.scalar(
+        text(
+            "SELECT coalesce(sum(total), 0) FROM schedule_count"
+            " WHERE account_id = :account_id AND status = :status"
+        ),
+        params,
+    )
+    return actual, counted
+
+
+@pytest.mark.anyio
+async def test_recount_corrects_schedules_saved_without_count() -> None:
+    async with AsyncSessionLocal() as sess:
+        await ScheduleRepository(sess).recount()
+        await sess.commit()
+        # schedule_count 를 갱신하지 않던 이전 버전 서버의 저장
+        sess.add(
+            Schedule(
+                name="recount",
+                start_at=datetime(2201, 1, 10, 10),
+                end_at=datetime(2201, 1, 10, 12),
+                applicants=10,
+                status=ScheduleStatus.PENDING,
+                account_id=admin.id,
+            )
+        )
+        await sess.commit()
+        actual, counted = await counts(sess)
+        assert counted == actual - 1
+
+        assert await ScheduleRepository(sess).recount() == 1
+        await sess.commit()
+
+        assert await counts(sess) == (actual, actual)
+        assert await ScheduleRepository(sess).recount() == 0
@@ -0,0 +1,48 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.common.exceptions import InternalServerException
+from app.service.models.time_range import TimeRange
+from app.storage.schedule_slot_repository import ScheduleSlotRepository
+from app.tests.conftest import AsyncSessionLocal
+
+time_range = TimeRange(datetime(2152, 1, 1, 10), datetime(2152, 1, 1, 12))
+
+
+@pytest.mark.anyio
+async def test_reserve_rolls_back_when_concurrent_change_fails_recheck() -> None:
+    async with AsyncSessionLocal() as sess:
+        await ScheduleSlotRepository(sess).create_missing_slots(
+            time_range.start_key(), time_range.end_key()
+        )
+        await sess.commit()
+
+    async with AsyncSessionLocal() as other, AsyncSessionLocal() as sess:
+        # 두 번째 시간을 먼저 잠가, 예약이 그 row 에서 커밋을 기다린 뒤 조건을 다시 검사하게 만듦
+        await other.execute(
+            text(
+                "UPDATE schedule_slot SET confirmed_applicants = 25000"
+                " WHERE hour_key = :hour_key"
+            ),
+            {"hour_key": time_range.start_key() + 1},
+        )
+        reserve = asyncio.create_task(
+            ScheduleSlotRepository(sess).reserve_applicants(time_range, 30_000)
+        )
+        await asyncio.sleep(0.1)
+        assert not reserve.done()
+        await other.commit()
+
+        # 첫 시간만 증가된 상태로 성공/실패를 돌려주지 않고 예외로 롤백을 강제
+        with pytest.raises(InternalServerException):
+            await reserve
+        await sess.rollback()
+
+    async with AsyncSessionLocal() as sess:
+        slots = await ScheduleSlotRepository(sess).find_all(
+            time_range.start_key(), time_range.end_key()
+        )
+        assert [s.confirmed_applicants for s in slots] == [0, 25_000]
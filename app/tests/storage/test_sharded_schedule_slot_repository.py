@@ -0,0 +1,43 @@
+from datetime import datetime
+
+import pytest
+
+from app.service.models.time_range import TimeRange
+from app.storage.sharded_schedule_slot_repository import (
+    ShardedScheduleSlotRepository,
+)
+from app.tests.conftest import AsyncSessionLocal
+
+time_range = TimeRange(datetime(2150, 1, 1, 10), datetime(2150, 1, 1, 12))
+
+
+@pytest.mark.anyio
+async def test_reserve_across_shards() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = ShardedScheduleSlotRepository(sess, 4)
+
+        assert await repository.reserve_applicants(time_range, 5_000)
+        # shard 하나(12,500명)에 담을 수 없는 인원은 여러 shard 에 나눠 반영
+        assert await repository.reserve_applicants(time_range, 20_000)
+        assert await repository.reserve_applicants(time_range, 20_000)
+        assert not await repository.reserve_applicants(time_range, 5_001)
+        await sess.commit()
+
+        slots = await repository.find_all(time_range.start_key(), time_range.end_key())
+        assert [s.confirmed_applicants for s in slots] == [45_000, 45_000]
+        assert [s.remain_applicants() for s in slots] == [5_000, 5_000]
+        assert await repository.min_applicants_in_range(time_range) == 5_000
+
+
+@pytest.mark.anyio
+async def test_release_across_shards() -> None:
+    async with AsyncSessionLocal() as sess:
+        repository = ShardedScheduleSlotRepository(sess, 4)
+        await repository.reserve_applicants(time_range, 30_000)
+
+        await repository.release_applicants(time_range, 25_000)
+        await sess.commit()
+
+        slot = await repository.find_by_start_at(time_range.start_at())
+        assert slot.confirmed_applicants == 5_000
+        assert slot.remain_applicants() == 45_000
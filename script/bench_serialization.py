@@ -0,0 +1,148 @@
+# 목록 응답 encoding 비용 비교, 데이터베이스 없이 실행
+# usage: PYTHONPATH=. python script/bench_serialization.py [repeat]
+import sys
+import timeit
+from array import array
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from fastapi.utils import create_model_field
+
+from app.api.routes.dto.account_dto import ProfileResponse
+from app.api.routes.dto.schedule_dto import ScheduleResponse, PaginatedScheduleResponse
+from app.api.routes.dto.schedule_slot_dto import (
+    ScheduleSlotResponse,
+    PaginatedScheduleSlotResponse,
+)
+from app.common.fast_json import FastJSONResponse, orjson
+from app.service.models.hour_key import to_hour_key, from_hour_key
+from app.service.models.page import SchedulePage, ScheduleSlotPage
+from app.service.models.schedule_status import ScheduleStatus
+
+SCHEDULES = 100
+SLOTS = 14 * 24
+
+start_at = datetime(2100, 1, 1)
+schedule_page = SchedulePage(
+    total=SCHEDULES,
+    page_size=SCHEDULES,
+    page_number=0,
+    items=[
+        {
+            "id": i,
+            "name": f"schedule {i}",
+            "start_at": start_at + timedelta(hours=i),
+            "end_at": start_at + timedelta(hours=i + 2),
+            "applicants": 1_000 + i,
+            "status": ScheduleStatus.CONFIRMED,
+            "account_id": UUID(int=i),
+            "nickname": f"customer {i}",
+        }
+        for i in range(SCHEDULES)
+    ],
+)
+start_key = to_hour_key(start_at)
+slot_page = ScheduleSlotPage(
+    start_key,
+    array("i", [50_000]) * SLOTS,
+    array("i", [i * 10 for i in range(SLOTS)]),
+)
+
+
+# 항목마다 pydantic 모델을 만든 뒤 response_model 로 다시 검증하는 기존 방식
+def schedules_by_models() -> PaginatedScheduleResponse:
+    return PaginatedScheduleResponse(
+        total=schedule_page.total,
+        page_number=schedule_page.page_number,
+        page_size=schedule_page.page_size,
+        items=[
+            ScheduleResponse(
+                id=row["id"],
+                name=row["name"],
+                start_at=row["start_at"],
+                end_at=row["end_at"],
+                applicants=row["applicants"],
+                status=row["status"],
+                profile=ProfileResponse(id=row["account_id"], nickname=row["nickname"]),
+            )
+            for row in schedule_page.items
+        ],
+    )
+
+
+def slots_by_models() -> PaginatedScheduleSlotResponse:
+    return PaginatedScheduleSlotResponse(
+        start_at=slot_page.start_at(),
+        end_at=slot_page.end_at(),
+        items=[
+            ScheduleSlotResponse(
+                start_at=from_hour_key(hour_key),
+                end_at=from_hour_key(hour_key + 1),
+                max_applicants=max_applicants,
+                confirmed_applicants=confirmed_applicants,
+            )
+            for hour_key, max_applicants, confirmed_applicants in slot_page.rows()
+        ],
+    )
+
+
+# async endpoint 에서 fastapi.routing.serialize_response 가 하는 검증과 직렬화
+def fastapi_path(response_model, build):
+    field = create_model_field("response", response_model, mode="serialization")
+
+    def run() -> bytes:
+        value, _ = field.validate(build(), {}, loc=("response",))
+        return JSONResponse(field.serialize(value)).body
+
+    return run
+
+
+def fast_path(build):
+    return lambda: FastJSONResponse(build()).body
+
+
+def measure(name: str, items: int, run, repeat: int) -> None:
+    seconds = min(timeit.repeat(run, number=repeat, repeat=5)) / repeat
+    print(
+        f"{name:<40} {seconds * 1e6:>10.1f} us/response"
+        f" {seconds * 1e6 / items:>8.2f} us/item"
+    )
+
+
+def main(repeat: int) -> None:
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}")
+    cases = [
+        (
+            f"schedules({SCHEDULES})",
+            SCHEDULES,
+            PaginatedScheduleResponse,
+            schedules_by_models,
+            lambda: PaginatedScheduleResponse.page_to_dict(schedule_page),
+        ),
+        (
+            f"slots({SLOTS})",
+            SLOTS,
+            PaginatedScheduleSlotResponse,
+            slots_by_models,
+            lambda: PaginatedScheduleSlotResponse.page_to_dict(slot_page),
+        ),
+    ]
+    for name, items, model, by_models, to_dict in cases:
+        measure(
+            f"{name} models + response_model",
+            items,
+            fastapi_path(model, by_models),
+            repeat,
+        )
+        measure(
+            f"{name} dict + response_model",
+            items,
+            fastapi_path(model, to_dict),
+            repeat,
+        )
+        measure(f"{name} dict + FastJSONResponse", items, fast_path(to_dict), repeat)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,22 @@
+-- schedule_slot 의 slot_start_time(TIMESTAMP) 을 정수 hour_key 로 바꾸고 hour_key 를 primary key 로 사용
+-- hour_key: 1970-01-01 00:00 부터 슬롯 시작 시각까지의 시간(hour) 수
+-- 옮기는 동안 기존 서버의 쓰기를 막음, 시간당 한 row 인 작은 테이블
+LOCK TABLE schedule_slot IN EXCLUSIVE MODE;
+
+CREATE TABLE schedule_slot_hour_key (
+    hour_key INTEGER PRIMARY KEY NOT NULL,
+    max_applicants INT NOT NULL DEFAULT 50000,
+    confirmed_applicants INT NOT NULL DEFAULT 0
+);
+
+-- unique 제약이 없던 시기에 생긴 같은 시각의 중복 row 는 남은 인원이 가장 적은 값으로 합침
+INSERT INTO schedule_slot_hour_key (hour_key, max_applicants, confirmed_applicants)
+SELECT ceil(extract(epoch FROM slot_start_time) / 3600)::INTEGER,
+    min(max_applicants),
+    max(confirmed_applicants)
+FROM schedule_slot
+GROUP BY 1;
+
+DROP TABLE schedule_slot;
+ALTER TABLE schedule_slot_hour_key RENAME TO schedule_slot;
+ALTER INDEX schedule_slot_hour_key_pkey RENAME TO schedule_slot_pkey;
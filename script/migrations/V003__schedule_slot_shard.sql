@@ -0,0 +1,8 @@
+-- SLOT_SHARD_COUNT > 0 일 때 사용, 한 시간의 인원을 여러 row 로 나눠 row lock 경합을 분산
+CREATE TABLE schedule_slot_shard (
+    hour_key INTEGER NOT NULL,
+    shard SMALLINT NOT NULL,
+    max_applicants INT NOT NULL,
+    confirmed_applicants INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour_key, shard)
+);
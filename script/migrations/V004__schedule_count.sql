@@ -0,0 +1,16 @@
+-- 계정, 상태별 schedule 수, schedule 저장과 같은 트랜잭션에서 갱신
+CREATE TABLE schedule_count (
+    account_id UUID NOT NULL,
+    status VARCHAR(20) NOT NULL CHECK (status IN ('PENDING', 'CONFIRMED', 'CANCELED')),
+    total INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (account_id, status),
+    FOREIGN KEY (account_id) REFERENCES account(id)
+);
+
+-- 기존 schedule 로 초기값을 채움, 이후에는 schedule 저장과 함께 갱신
+-- 무중단 배포 중에는 이전 버전 서버가 schedule_count 없이 schedule 을 저장해 값이 어긋남
+-- 배포 동안 쓰기를 멈추거나, 이전 버전 서버가 모두 내려간 뒤 python -m app.recount_schedules 로 다시 맞춰야 함
+INSERT INTO schedule_count (account_id, status, total)
+SELECT account_id, status, count(*)
+FROM schedule
+GROUP BY account_id, status;
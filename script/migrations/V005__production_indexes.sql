@@ -0,0 +1,13 @@
+-- migrate: no-transaction
+-- 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY 로 생성, 문장 단위로 실행됨
+-- 실패로 남은 INVALID 인덱스는 다시 실행할 때 runner 가 지우고 새로 생성
+
+-- 목록 조회의 (start_at, id) 정렬과 cursor 조회용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_start_at_id_idx ON schedule (start_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_account_id_start_at_id_idx ON schedule (account_id, start_at, id);
+
+-- 계정별 schedule 조회, account 삭제 시 외래키 검사용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_account_id_id_idx ON schedule (account_id, id);
+
+-- 상태별 기간 조회용
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_status_start_at_idx ON schedule (status, start_at);
@@ -0,0 +1,217 @@
+-- migrate: no-transaction
+-- schedule.start_at, schedule_slot(_shard).hour_key 기준 월 단위 range partition
+-- 기존 테이블은 복사하지 않고 이전 row 를 모두 담는 <table>_history partition 으로 attach
+-- 긴 작업(인덱스 생성, CHECK 검증)은 쓰기를 막지 않는 잠금으로 먼저 하고, 테이블 교체는 짧은 트랜잭션 하나로 수행
+-- 각 문장은 다시 실행해도 되도록 작성됨
+
+-- history partition 의 상한, 기존 row 와 예약 가능한 기간(약 3개월)을 모두 포함하는 다음 달 1일
+-- 교체 전에 이 값보다 뒤의 row 를 넣으면 CHECK 제약에 걸리므로 여유를 둠
+CREATE OR REPLACE FUNCTION add_history_bound(parent TEXT, key_column TEXT)
+RETURNS VOID AS $$
+DECLARE
+    last_at TIMESTAMP;
+    bound TIMESTAMP;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = parent::REGCLASS) <> 'r'
+        OR EXISTS (SELECT 1 FROM pg_constraint WHERE conname = parent || '_history_bound') THEN
+        RETURN;
+    END IF;
+    IF key_column = 'hour_key' THEN
+        EXECUTE format('SELECT to_timestamp(max(hour_key) * 3600.0) AT TIME ZONE ''UTC'' FROM %I', parent)
+            INTO last_at;
+    ELSE
+        EXECUTE format('SELECT max(%I) FROM %I', key_column, parent) INTO last_at;
+    END IF;
+    bound := date_trunc('month', greatest(last_at, LOCALTIMESTAMP + INTERVAL '3 months')) + INTERVAL '1 month';
+    -- NOT VALID 로 추가해 테이블을 읽지 않고 잠깐만 잠금, 검증은 별도 트랜잭션에서
+    EXECUTE format(
+        'ALTER TABLE %I ADD CONSTRAINT %I CHECK (%I < %s) NOT VALID',
+        parent, parent || '_history_bound', key_column,
+        CASE WHEN key_column = 'hour_key'
+            THEN (extract(epoch FROM bound) / 3600)::BIGINT::TEXT
+            ELSE quote_literal(bound) || '::TIMESTAMP' END
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+-- 검증은 SHARE UPDATE EXCLUSIVE 잠금으로 전체를 읽어 조회와 쓰기를 막지 않음
+CREATE OR REPLACE FUNCTION validate_history_bound(parent TEXT)
+RETURNS VOID AS $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = parent::REGCLASS) = 'r' THEN
+        EXECUTE format('ALTER TABLE %I VALIDATE CONSTRAINT %I', parent, parent || '_history_bound');
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 검증된 CHECK 제약의 상한, attach 할 때 partition 범위로 사용해 테이블을 다시 읽지 않음
+CREATE OR REPLACE FUNCTION history_bound(parent TEXT)
+RETURNS TEXT AS $$
+    SELECT substring(pg_get_constraintdef(oid) FROM '< (.+)\)\)$')
+    FROM pg_constraint
+    WHERE conname = parent || '_history_bound';
+$$ LANGUAGE sql;
+
+-- 해당 월 partition 을 생성, default partition 에 있던 같은 월 row 는 옮긴 뒤 attach
+-- history partition 범위에 포함되는 달은 만들지 않음
+CREATE OR REPLACE FUNCTION create_month_partition(parent TEXT, key_column TEXT, month DATE)
+RETURNS BOOLEAN AS $$
+DECLARE
+    partition TEXT := format('%s_%s', parent, to_char(month, 'YYYYMM'));
+    history_upper TEXT;
+    covered BOOLEAN := FALSE;
+    lower_bound TEXT;
+    upper_bound TEXT;
+BEGIN
+    IF to_regclass(partition) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+    IF key_column = 'hour_key' THEN
+        lower_bound := (extract(epoch FROM month::TIMESTAMP) / 3600)::BIGINT::TEXT;
+        upper_bound := (extract(epoch FROM month + INTERVAL '1 month') / 3600)::BIGINT::TEXT;
+    ELSE
+        lower_bound := quote_literal(month::TIMESTAMP) || '::TIMESTAMP';
+        upper_bound := quote_literal(month + INTERVAL '1 month') || '::TIMESTAMP';
+    END IF;
+    SELECT substring(pg_get_expr(relpartbound, oid) FROM 'TO \((.+)\)$') INTO history_upper
+    FROM pg_class
+    WHERE oid = to_regclass(parent || '_history');
+    IF history_upper IS NOT NULL THEN
+        EXECUTE format('SELECT %s < %s', lower_bound, history_upper) INTO covered;
+    END IF;
+    IF covered THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition, parent);
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM %I WHERE %I >= %s AND %I < %s RETURNING *) INSERT INTO %I SELECT * FROM moved',
+        parent || '_default', key_column, lower_bound, key_column, upper_bound, partition
+    );
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%s) TO (%s)',
+        parent, partition, lower_bound, upper_bound
+    );
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+-- [from_month, to_month] 의 월 partition 을 생성하고 새로 만든 수를 반환
+CREATE OR REPLACE FUNCTION ensure_month_partitions(parent TEXT, key_column TEXT, from_month DATE, to_month DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    month DATE := date_trunc('month', from_month);
+    created INTEGER := 0;
+BEGIN
+    WHILE month <= to_month LOOP
+        IF create_month_partition(parent, key_column, month) THEN
+            created := created + 1;
+        END IF;
+        month := month + INTERVAL '1 month';
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- partitioned table 의 primary key 는 partition key 를 포함해야 하므로
+-- attach 할 때 그대로 쓰일 (id, start_at) unique 인덱스를 잠그지 않고 미리 생성
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS schedule_history_id_start_at_key ON schedule (id, start_at);
+
+SELECT add_history_bound('schedule', 'start_at');
+SELECT add_history_bound('schedule_slot', 'hour_key');
+SELECT add_history_bound('schedule_slot_shard', 'hour_key');
+
+SELECT validate_history_bound('schedule');
+SELECT validate_history_bound('schedule_slot');
+SELECT validate_history_bound('schedule_slot_shard');
+
+-- 이름만 바꾸고 빈 partitioned table 을 만들어 attach, 같은 인덱스와 외래키는 새로 만들지 않고 재사용됨
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'schedule'::REGCLASS) = 'p' THEN
+        RETURN;
+    END IF;
+    SET LOCAL lock_timeout = '10s';
+    ALTER TABLE schedule RENAME TO schedule_history;
+    ALTER INDEX schedule_pkey RENAME TO schedule_history_pkey;
+    ALTER INDEX schedule_start_at_id_idx RENAME TO schedule_history_start_at_id_idx;
+    ALTER INDEX schedule_account_id_start_at_id_idx RENAME TO schedule_history_account_id_start_at_id_idx;
+    ALTER INDEX schedule_account_id_id_idx RENAME TO schedule_history_account_id_id_idx;
+    ALTER INDEX schedule_status_start_at_idx RENAME TO schedule_history_status_start_at_idx;
+    ALTER TABLE schedule_history RENAME CONSTRAINT schedule_account_id_fkey TO schedule_history_account_id_fkey;
+    ALTER TABLE schedule_history
+        ADD CONSTRAINT schedule_history_id_start_at_key UNIQUE USING INDEX schedule_history_id_start_at_key;
+
+    CREATE TABLE schedule (
+        id INTEGER GENERATED BY DEFAULT AS IDENTITY,
+        name VARCHAR(100) NOT NULL,
+        start_at TIMESTAMP NOT NULL,
+        end_at TIMESTAMP NOT NULL,
+        applicants INT NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        account_id UUID NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW(),
+        -- attach 할 때 history partition 의 같은 이름 제약과 맞춰지도록 이름을 지정
+        CONSTRAINT schedule_status_check CHECK (status IN ('PENDING', 'CONFIRMED', 'CANCELED')),
+        PRIMARY KEY (id, start_at),
+        FOREIGN KEY (account_id) REFERENCES account(id)
+    ) PARTITION BY RANGE (start_at);
+    CREATE INDEX schedule_start_at_id_idx ON schedule (start_at, id);
+    CREATE INDEX schedule_account_id_start_at_id_idx ON schedule (account_id, start_at, id);
+    CREATE INDEX schedule_account_id_id_idx ON schedule (account_id, id);
+    CREATE INDEX schedule_status_start_at_idx ON schedule (status, start_at);
+    EXECUTE format(
+        'ALTER TABLE schedule ATTACH PARTITION schedule_history FOR VALUES FROM (MINVALUE) TO (%s)',
+        history_bound('schedule')
+    );
+    CREATE TABLE schedule_default PARTITION OF schedule DEFAULT;
+    -- 새 id 는 partitioned table 의 identity 에서 이어서 발급
+    PERFORM setval(pg_get_serial_sequence('schedule', 'id'), max(id)) FROM schedule HAVING max(id) IS NOT NULL;
+END;
+$$;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'schedule_slot'::REGCLASS) = 'p' THEN
+        RETURN;
+    END IF;
+    SET LOCAL lock_timeout = '10s';
+    ALTER TABLE schedule_slot RENAME TO schedule_slot_history;
+    ALTER INDEX schedule_slot_pkey RENAME TO schedule_slot_history_pkey;
+
+    CREATE TABLE schedule_slot (
+        hour_key INTEGER PRIMARY KEY NOT NULL,
+        max_applicants INT NOT NULL DEFAULT 50000,
+        confirmed_applicants INT NOT NULL DEFAULT 0
+    ) PARTITION BY RANGE (hour_key);
+    EXECUTE format(
+        'ALTER TABLE schedule_slot ATTACH PARTITION schedule_slot_history FOR VALUES FROM (MINVALUE) TO (%s)',
+        history_bound('schedule_slot')
+    );
+    CREATE TABLE schedule_slot_default PARTITION OF schedule_slot DEFAULT;
+END;
+$$;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'schedule_slot_shard'::REGCLASS) = 'p' THEN
+        RETURN;
+    END IF;
+    SET LOCAL lock_timeout = '10s';
+    ALTER TABLE schedule_slot_shard RENAME TO schedule_slot_shard_history;
+    ALTER INDEX schedule_slot_shard_pkey RENAME TO schedule_slot_shard_history_pkey;
+
+    CREATE TABLE schedule_slot_shard (
+        hour_key INTEGER NOT NULL,
+        shard SMALLINT NOT NULL,
+        max_applicants INT NOT NULL,
+        confirmed_applicants INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (hour_key, shard)
+    ) PARTITION BY RANGE (hour_key);
+    EXECUTE format(
+        'ALTER TABLE schedule_slot_shard ATTACH PARTITION schedule_slot_shard_history FOR VALUES FROM (MINVALUE) TO (%s)',
+        history_bound('schedule_slot_shard')
+    );
+    CREATE TABLE schedule_slot_shard_default PARTITION OF schedule_slot_shard DEFAULT;
+END;
+$$;
@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- 시간 겹침 조회용 [start_at, end_at) 범위 식 인덱스, 컬럼을 추가하지 않으므로 partition 을 다시 쓰지 않음
+-- 슬롯을 차지하는 것은 CONFIRMED 뿐이므로 해당 row 만 색인
+-- partitioned table 이므로 runner 가 ON ONLY 인덱스, partition 별 CONCURRENTLY 생성, ATTACH 로 나눠 실행
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_confirmed_time_range_idx ON schedule
+    USING GIST (tsrange(start_at, end_at, '[)')) WHERE status = 'CONFIRMED';
@@ -0,0 +1,10 @@
+-- migrate: no-transaction
+-- 관리자 검색의 상태, 계정 + 상태 조건을 (start_at, id) 정렬 순서 그대로 읽기 위한 인덱스
+-- partitioned table 이므로 runner 가 ON ONLY 인덱스, partition 별 CONCURRENTLY 생성, ATTACH 로 나눠 실행
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_status_start_at_id_idx ON schedule (status, start_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_account_id_status_start_at_id_idx
+    ON schedule (account_id, status, start_at, id);
+
+-- 대체 인덱스가 만들어진 뒤 마지막에 삭제
+-- partitioned 인덱스는 CONCURRENTLY 로 지울 수 없지만 카탈로그만 바꾸므로 잠금은 짧음
+DROP INDEX IF EXISTS schedule_status_start_at_idx;
@@ -0,0 +1,9 @@
+-- SLOT_DAY_ROWS=true 일 때 사용, 하루 24시간의 인원을 int[24] 배열 한 row 로 저장
+-- day_key: 1970-01-01 부터 지난 일 수 (hour_key / 24)
+-- 기본 인원은 DEFAULT_MAX_APPLICANTS 와 중복되지 않도록 repository 가 row 를 만들 때 채움
+CREATE TABLE schedule_slot_day (
+    day_key INTEGER PRIMARY KEY NOT NULL,
+    max_applicants INT[] NOT NULL,
+    confirmed_applicants INT[] NOT NULL,
+    CHECK (cardinality(max_applicants) = 24 AND cardinality(confirmed_applicants) = 24)
+);
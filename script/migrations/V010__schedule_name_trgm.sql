@@ -0,0 +1,6 @@
+-- migrate: no-transaction
+-- migrate: requires-extension pg_trgm
+-- 이름 부분 검색(ILIKE '%name%')용 trigram 인덱스
+-- pg_trgm 이 없는 서버에서는 기록하지 않고 건너뛰며, 설치 후 다음 migrate 에서 적용됨
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS schedule_name_trgm_idx ON schedule USING GIN (name gin_trgm_ops);